@@ -6,9 +6,19 @@
 # ///
 
 from src.core.game import Game
+from src.core.headless import Headless
+import argparse
 import asyncio
 import pygame
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--headless", type=int, metavar="FRAMES", help="simulate this many frames without a window and print how fast it went")
+    args = parser.parse_args()
+
     pygame.init()
-    asyncio.run(Game().run())
+    headless = Headless(frames=args.headless) if args.headless is not None else None
+    game = Game(headless)
+    asyncio.run(game.run())
+    if headless is not None:
+        print(f"Simulated {game.timestamp} frames in {game.run_time:.2f}s ({game.timestamp / max(game.run_time, 1e-3):.1f} frames per second).")
@@ -0,0 +1,32 @@
+#version 300 es
+precision highp float;
+
+uniform vec2 u_screen;
+
+layout (location = 0) in vec2 in_pos;
+layout (location = 1) in vec2 in_size;
+layout (location = 2) in float in_angle;
+layout (location = 3) in vec4 in_tint;
+layout (location = 4) in vec4 in_uv;
+
+vec2 corners[4] = vec2[](
+    vec2(-0.5, -0.5),
+    vec2(-0.5, 0.5),
+    vec2(0.5, -0.5),
+    vec2(0.5, 0.5)
+);
+
+out vec2 pos;
+out vec4 tint;
+
+void main() {
+    vec2 corner = corners[gl_VertexID];
+    vec2 offset = corner * in_size;
+    float c = cos(in_angle);
+    float s = sin(in_angle);
+    vec2 screen = in_pos + vec2(offset.x * c - offset.y * s, offset.x * s + offset.y * c);
+    gl_Position = vec4(screen.x / u_screen.x * 2.0 - 1.0, 1.0 - screen.y / u_screen.y * 2.0, 0.0, 1.0);
+    // in_uv holds the top left and bottom right corners of the atlas region
+    pos = mix(in_uv.xy, in_uv.zw, corner + 0.5);
+    tint = in_tint;
+}
@@ -0,0 +1,42 @@
+#version 300 es
+precision highp float;
+
+#define MAX_CIRCLES 64
+
+uniform sampler2D u_texture;
+uniform vec2 u_screen;
+uniform vec2 u_camera;
+uniform vec3 u_background;
+uniform float u_blend_distance;
+uniform float u_circle_count;
+// xy is the center and z the radius, in world coordinates
+uniform vec4 u_circles[MAX_CIRCLES];
+uniform vec4 u_colors[MAX_CIRCLES];
+
+in vec2 pos;
+out vec4 color;
+
+void main() {
+    // world coordinates of this pixel, y pointing down like pygame
+    vec2 world = u_camera + vec2(pos.x, 1.0 - pos.y) * u_screen;
+
+    vec3 color_sum = vec3(0.0);
+    float weight_sum = 0.0;
+    for (int i = 0; i < MAX_CIRCLES; i++) {
+        if (float(i) >= u_circle_count) break;
+        vec4 circle = u_circles[i];
+        float weight = clamp(1.0 - (distance(world, circle.xy) - circle.z) / u_blend_distance, 0.0, 1.0);
+        // squared for a smoother fade
+        weight *= weight;
+        color_sum += u_colors[i].rgb * weight;
+        weight_sum += weight;
+    }
+
+    // the background fills in wherever the circles don't have enough weight
+    float remaining = clamp(1.0 - weight_sum, 0.0, 1.0);
+    vec3 terrain = (color_sum + u_background * remaining) / (weight_sum + remaining);
+
+    // anything drawn onto the group's surface goes on top of the terrain
+    vec4 top = texture(u_texture, pos);
+    color = vec4(mix(terrain, top.rgb, top.a), 1.0);
+}
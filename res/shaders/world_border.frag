@@ -0,0 +1,45 @@
+#version 300 es
+precision highp float;
+
+uniform sampler2D u_texture;
+uniform vec2 u_screen;
+uniform vec4 u_color;
+uniform vec2 u_center;
+uniform float u_radius;
+uniform vec2 u_target_center;
+uniform float u_target_radius;
+uniform float u_show_target;
+uniform vec2 u_line_start;
+uniform vec2 u_line_end;
+uniform float u_show_line;
+
+in vec2 pos;
+out vec4 color;
+
+const vec4 MARKER = vec4(1.0, 1.0, 1.0, 200.0 / 255.0);
+
+float segment_distance(vec2 p, vec2 a, vec2 b) {
+    vec2 ab = b - a;
+    float t = clamp(dot(p - a, ab) / max(dot(ab, ab), 1e-6), 0.0, 1.0);
+    return distance(p, a + t * ab);
+}
+
+void main() {
+    // screen coordinates in pixels, y pointing down like pygame
+    vec2 p = vec2(pos.x, 1.0 - pos.y) * u_screen;
+
+    vec4 overlay = distance(p, u_center) > u_radius ? u_color : vec4(0.0);
+    float target_distance = distance(p, u_target_center);
+    if (u_show_target > 0.5 && target_distance <= u_target_radius && target_distance > u_target_radius - 3.0) {
+        overlay = MARKER;
+    }
+    if (u_show_line > 0.5 && segment_distance(p, u_line_start, u_line_end) <= 0.5) {
+        overlay = MARKER;
+    }
+
+    // anything drawn onto the group's surface goes on top of the overlay
+    vec4 top = texture(u_texture, pos);
+    float alpha = top.a + overlay.a * (1.0 - top.a);
+    vec3 rgb = top.rgb * top.a + overlay.rgb * overlay.a * (1.0 - top.a);
+    color = vec4(rgb / max(alpha, 1e-6), alpha);
+}
@@ -1,8 +1,10 @@
 from src.game.settings import *
 
-from .render_layer import LayerGroup, Layer
+from .render_layer import LayerGroup, Layer, mark_dirty
+from .sprite_batch import SpriteBatch
 from .sprite import Sprite
 from .scene import Scene
+from .headless import Headless, InputScript
 from .util import *
 import pygame
 
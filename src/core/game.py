@@ -2,12 +2,13 @@ from src.game.resources import init_resources
 from src.core.util.resource import Resource
 from src.core.util.timer import Time
 from src.core.scene import Scene
+from src.core.headless import Headless
 import src.game.scenes as scenes
 from src.game.settings import *
 from typing import cast, Never
 from src.core.util import *
-import asyncio
 import pygame
+import os
 import zengl
 
 class AbortScene(Exception):
@@ -19,9 +20,22 @@ class AbortGame(Exception):
         return "Game aborted but not caught with a try/except block."
 
 class Game(metaclass=Singleton):
-    def __init__(self) -> None:
+    def __init__(self, headless: Optional[Headless] = None) -> None:
+        # without a window there's no gpu, see Headless
+        self.headless = headless
         self.size = self.width, self.height = self.w, self.h = Vec(WIDTH, HEIGHT)
-        pygame.display.set_mode(self.size, OPENGL | DOUBLEBUF)
+        if headless is None:
+            try:
+                pygame.display.set_mode(self.size, OPENGL | DOUBLEBUF, vsync=int(VSYNC))
+            except pygame.error:
+                # not every driver can do vsync
+                pygame.display.set_mode(self.size, OPENGL | DOUBLEBUF)
+        else:
+            # images still need a display to be converted for
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            pygame.display.quit()
+            pygame.display.init()
+            pygame.display.set_mode(self.size)
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
         self.time = pygame.time.get_ticks() / 1000
@@ -29,7 +43,21 @@ class Game(metaclass=Singleton):
         self.fps = 0
         self.timestamp = 0
 
-        self.ctx = zengl.context()
+        # the simulation runs in fixed ticks, frames draw wherever it is between
+        # the last two of them, see Sprite.render_pos
+        self.fixed_dt = 1 / TICK_RATE
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.events: dict[int, pygame.event.Event] = {}
+        self.key_down = self.key_up = -1
+        self.input_consumed = True
+
+        self.ctx = zengl.context() if headless is None else None
+        if headless is None:
+            self.pacer = FramePacer(FPS, IDLE_FPS, pygame.display.is_vsync(), pygame.display.get_current_refresh_rate())
+        else:
+            # headless runs go as fast as they can
+            self.pacer = FramePacer(0, 0)
 
         init_resources()
         Resource.preload()
@@ -40,38 +68,88 @@ class Game(metaclass=Singleton):
         self.update_profiler = Profile(self.scene.update)
         self.draw_profiler = Profile(self.scene.draw)
 
+        # making the scene shouldn't count as time to catch up on
+        self.pacer.restart()
+        start = pygame.time.get_ticks()
         while True:
-            await asyncio.sleep(0)
-
-            self.time = pygame.time.get_ticks() / 1000 - Debug._pause_time
-            Time.begin_frame(self)
-            self.seed = time()
-            seed(self.seed)
+            self.dt = await self.pacer.wait()
+            if self.headless is not None:
+                if self.timestamp == self.headless.frames: break
+                self.dt = self.headless.dt
 
             try:
                 self.update()
-                if not Debug.paused():
-                    self.update_profiler(self.dt)
+                if Debug.paused():
+                    self.consume_input()
+                else:
+                    self.tick()
             except AbortScene:
                 continue
             except AbortGame:
                 break
 
-            if not Debug.paused():
-                self.ctx.new_frame()
-                self.draw_profiler()
-                self.ctx.end_frame()
-            pygame.display.flip()
+            if self.ctx is None:
+                if self.headless is not None and self.headless.draw:
+                    self.draw_profiler()
+            else:
+                if not Debug.paused():
+                    self.ctx.new_frame()
+                    self.draw_profiler()
+                    self.ctx.end_frame()
+                pygame.display.flip()
+            SurfacePool.end_frame()
 
-            self.dt = self.clock.tick(0) / 1000
+            self.clock.tick(0)
             self.fps = self.clock.get_fps()
             if not Debug.paused():
                 self.timestamp += 1
 
+        # how long the game ran for, used to measure headless runs
+        self.run_time = (pygame.time.get_ticks() - start) / 1000
         pygame.quit()
 
+    def tick(self) -> None:
+        """Step the simulation as many fixed ticks as the time since the last
+        frame makes up for."""
+        self.accumulator += self.dt
+        ticks = 0
+        while self.accumulator >= self.fixed_dt:
+            if ticks == MAX_TICKS_PER_FRAME:
+                # too far behind to ever catch up, slow down instead
+                self.accumulator %= self.fixed_dt
+                break
+            self.time += self.fixed_dt
+            Time.begin_frame(self)
+            self.seed = time()
+            seed(self.seed)
+            self.update_profiler(self.fixed_dt)
+            self.consume_input()
+            self.accumulator -= self.fixed_dt
+            ticks += 1
+            if Debug.paused(): break
+        self.alpha = self.accumulator / self.fixed_dt
+
+    def consume_input(self) -> None:
+        """Handle the game's own keys, then forget the events once a tick (or a
+        paused frame) has seen them, so that a frame running several ticks
+        doesn't handle them more than once."""
+        self.handle_input()
+        self.events = {}
+        self.key_down = self.key_up = -1
+        self.input_consumed = True
+
     def update(self) -> None:
-        self.events = {event.type: event for event in pygame.event.get()}
+        if self.headless is None:
+            events = {event.type: event for event in pygame.event.get()}
+            self.keys = pygame.key.get_pressed()
+            self.mouse_pos = Vec(pygame.mouse.get_pos())
+            self.mouse_pressed = pygame.mouse.get_pressed()
+        else:
+            events, self.keys, self.mouse_pos, self.mouse_pressed = self.headless.script.poll(self.timestamp)
+
+        # frames that run no ticks leave their events for the next frame's
+        self.events = events if self.input_consumed else self.events | events
+        self.input_consumed = False
         self.key_down = -1
         if KEYDOWN in self.events:
             self.key_down = cast(pygame.event.Event, self.events[KEYDOWN]).key
@@ -79,23 +157,26 @@ class Game(metaclass=Singleton):
         if KEYUP in self.events:
             self.key_up = cast(pygame.event.Event, self.events[KEYUP]).key
 
-        self.keys = pygame.key.get_pressed()
-        self.mouse_pos = Vec(pygame.mouse.get_pos())
-        self.mouse_pressed = pygame.mouse.get_pressed()
+        # nobody's watching, so there's no need to draw that often
+        if self.headless is None:
+            self.pacer.idle = Debug.paused() or not pygame.key.get_focused()
 
+        if Debug.on():
+            pygame.display.set_caption(f"{TITLE} - FPS: {self.fps:.1f}")
+
+    def handle_input(self) -> None:
+        """Respond to the keys that control the game itself. Reads the same
+        events as the ticks, right before they're consumed."""
         if QUIT in self.events:
             raise AbortGame
 
         if KEYDOWN in self.events and Debug.on():
-            match self.events[KEYDOWN].key:
+            match self.key_down:
                 case pygame.K_F1:
                     Debug.toggle_paused(self)
                 case pygame.K_F3:
                     Debug.launch_tkinter_tree(self)
 
-        if Debug.on():
-            pygame.display.set_caption(f"{TITLE} - FPS: {self.fps:.1f}")
-
         Profile.update(self.key_down)
 
     def new_scene(self, scene: str, *args: Any, **kwargs: Any) -> Never:
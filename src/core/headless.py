@@ -0,0 +1,99 @@
+from __future__ import annotations
+from src.core.util.typing import Coord
+from src.core.util.vector import Vec
+from src.game.settings import TICK_RATE
+from dataclasses import dataclass, field
+from bisect import bisect_right
+from pygame.locals import KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEBUTTONUP
+from typing import Optional
+import pygame
+
+class ScriptedKeys:
+    """Stands in for pygame.key.get_pressed() in a headless game."""
+
+    def __init__(self, held: set[int]) -> None:
+        self.held = held
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.held
+
+class InputScript:
+    """Input for a headless game, decided ahead of time frame by frame.
+
+    Every method returns the script so calls can be chained, e.g.
+    `InputScript().hold(K_d, 0, 120).press(K_j, 30).click(60, (700, 300))`.
+    Like the game's own event handling, only the last event of each type in
+    a frame is seen.
+
+    Args:
+        mouse_pos: Where the mouse is until it is first moved.
+    """
+
+    def __init__(self, mouse_pos: Coord = (0, 0)) -> None:
+        self.held: list[tuple[int, int, int]] = []
+        self.events: dict[int, list[pygame.event.Event]] = {}
+        self.clicks: list[tuple[int, int]] = []
+        self.mouse_frames: list[int] = [-1]
+        self.mouse_positions: list[Vec] = [Vec(mouse_pos)]
+
+    def hold(self, key: int, start: int, end: int) -> InputScript:
+        """Hold a key down from the start frame until the end frame, with a
+        KEYDOWN event on the first frame and a KEYUP event on the last."""
+        self.held.append((key, start, end))
+        self.events.setdefault(start, []).append(pygame.event.Event(KEYDOWN, key=key))
+        self.events.setdefault(end, []).append(pygame.event.Event(KEYUP, key=key))
+        return self
+
+    def press(self, key: int, frame: int) -> InputScript:
+        """Tap a key for a single frame."""
+        return self.hold(key, frame, frame + 1)
+
+    def move_mouse(self, frame: int, pos: Coord) -> InputScript:
+        """Move the mouse to a position on the screen from a frame onwards."""
+        index = bisect_right(self.mouse_frames, frame)
+        self.mouse_frames.insert(index, frame)
+        self.mouse_positions.insert(index, Vec(pos))
+        return self
+
+    def click(self, frame: int, pos: Optional[Coord] = None, button: int = 1) -> InputScript:
+        """Click a mouse button for a single frame, moving the mouse there
+        first if a position is given."""
+        if pos is not None:
+            self.move_mouse(frame, pos)
+        self.clicks.append((frame, button))
+        self.events.setdefault(frame, []).append(pygame.event.Event(MOUSEBUTTONDOWN, button=button, pos=pos))
+        self.events.setdefault(frame + 1, []).append(pygame.event.Event(MOUSEBUTTONUP, button=button, pos=pos))
+        return self
+
+    def poll(self, frame: int) -> tuple[dict[int, pygame.event.Event], ScriptedKeys, Vec, tuple[bool, bool, bool]]:
+        """Get the input of a frame the way Game.update reads it.
+
+        Returns:
+            The events by type, the held keys, the mouse position and which
+            mouse buttons are pressed.
+        """
+        events = {event.type: event for event in self.events.get(frame, [])}
+        keys = ScriptedKeys({key for key, start, end in self.held if start <= frame < end})
+        mouse_pos = self.mouse_positions[bisect_right(self.mouse_frames, frame) - 1].copy()
+        buttons = {button for start, button in self.clicks if start == frame}
+        mouse_pressed = (1 in buttons, 2 in buttons, 3 in buttons)
+        return events, keys, mouse_pos, mouse_pressed
+
+@dataclass
+class Headless:
+    """Settings for running the game without a window or a gpu, as fast as
+    possible, e.g. to measure how fast the simulation is.
+
+    Every frame pretends `dt` passed instead of following the clock, so what
+    gets simulated doesn't depend on how fast the machine is, only how long
+    it takes does. With the default `dt` every frame runs exactly one tick.
+    """
+    # the input of every frame
+    script: InputScript = field(default_factory=InputScript)
+    # how many frames to simulate before stopping, None to never stop
+    frames: Optional[int] = None
+    # the time every frame simulates
+    dt: float = 1 / TICK_RATE
+    # whether to still draw the sprites to the layer surfaces, which are never
+    # shown, to include drawing in the measurements
+    draw: bool = False
@@ -4,18 +4,76 @@ if TYPE_CHECKING:
     from src.core.scene import Scene
 
 from typing import Protocol, Any, Callable, Optional, Type
+from pygame.typing import RectLike
 from src.game.resources import VertShader, FragShader
+from src.core.sprite_batch import SpriteBatch
+from src.core.util.general import ref_proxy
+from src.core.util.sprite_set import SpriteSet
 from src.core.sprite import Sprite
 from dataclasses import dataclass
+from functools import wraps
 from enum import Enum
+import struct
 import pygame
 import zengl
 
+class DirtySurface(pygame.Surface):
+    """
+    A surface that remembers which areas were drawn to since the last reset.
+    Blits, fills and the shapes of pygame.draw are recorded automatically,
+    anything else that writes pixels (e.g. surfarray or set_at) has to be
+    reported with `mark` (or `mark_dirty`).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.dirty: list[pygame.Rect] = []
+
+    def mark(self, rect: RectLike) -> pygame.Rect:
+        rect = pygame.Rect(rect).clip(self.get_rect())
+        if rect.w and rect.h:
+            self.dirty.append(rect)
+        return rect
+
+    def blit(self, *args: Any, **kwargs: Any) -> pygame.Rect:
+        return self.mark(super().blit(*args, **kwargs))
+
+    def blits(self, *args: Any, **kwargs: Any) -> Any:
+        rects = super().blits(*args, **kwargs)
+        if rects is not None:
+            for rect in rects:
+                self.mark(rect)
+        return rects
+
+    def fill(self, *args: Any, **kwargs: Any) -> pygame.Rect:
+        return self.mark(super().fill(*args, **kwargs))
+
+def mark_dirty(target: pygame.Surface, rect: RectLike) -> None:
+    """Report an area drawn to without a blit, fill or pygame.draw call, e.g.
+    with surfarray. Does nothing if the target doesn't track dirty rects."""
+    if isinstance(target, DirtySurface):
+        target.mark(rect)
+
+def _marking(draw: Callable[..., pygame.Rect]) -> Callable[..., pygame.Rect]:
+    @wraps(draw)
+    def wrapper(*args: Any, **kwargs: Any) -> pygame.Rect:
+        rect = draw(*args, **kwargs)
+        mark_dirty(args[0] if args else kwargs["surface"], rect)
+        return rect
+    return wrapper
+
+# every pygame.draw function returns the area it touched, so sprites can draw
+# onto dirty tracked groups just like onto any other surface
+for _name in ("rect", "polygon", "circle", "ellipse", "arc", "line", "lines", "aaline", "aalines"):
+    setattr(pygame.draw, _name, _marking(getattr(pygame.draw, _name)))
+
 class LayerGroupRecord:
-    def __init__(self, type: Type[LayerGroup], vert: str, frag: str) -> None:
+    def __init__(self, type: Type[LayerGroup], vert: str, frag: str, dirty_rects: bool = False, uniforms: Optional[dict[str, Any]] = None) -> None:
         self.type = type
         self.vert = vert
         self.frag = frag
+        self.dirty_rects = dirty_rects
+        self.uniforms = uniforms
         self.layers: list[LayerRecord] = []
 
     def add(self, *layers: LayerRecord) -> LayerGroupRecord:
@@ -23,24 +81,48 @@ class LayerGroupRecord:
         return self
 
     def construct(self, scene: Scene) -> LayerGroup:
-        group = self.type(scene, vert=self.vert, frag=self.frag)
+        group = self.type(scene, vert=self.vert, frag=self.frag, dirty_rects=self.dirty_rects, uniforms=self.uniforms)
         group.layers = [layer.construct(scene) for layer in self.layers]
+        for layer in group.layers:
+            layer.group = group
         return group
 
 class LayerGroup:
+    """Layers drawn onto one surface, which is then shown with the group's
+    shaders.
+
+    With `dirty_rects` the surface is a DirtySurface, and only the areas
+    drawn to are cleared and uploaded every frame. Blits, fills and
+    pygame.draw calls are tracked on their own, pixels written any other way
+    (surfarray, set_at, ...) have to be reported with `mark_dirty`, or they
+    never reach the screen.
+    """
+    # past this many separate areas it's cheaper to upload their bounding box
+    MAX_DIRTY_RECTS = 16
+
     @classmethod
-    def record(cls, vert: str = "default", frag: str = "default") -> LayerGroupRecord:
-        return LayerGroupRecord(cls, vert, frag)
+    def record(cls, vert: str = "default", frag: str = "default", dirty_rects: bool = False, uniforms: Optional[dict[str, Any]] = None) -> LayerGroupRecord:
+        return LayerGroupRecord(cls, vert, frag, dirty_rects, uniforms)
 
-    def __init__(self, scene: Scene, vert: str = "default", frag: str = "default") -> None:
+    def __init__(self, scene: Scene, vert: str = "default", frag: str = "default", dirty_rects: bool = False, uniforms: Optional[dict[str, Any]] = None) -> None:
         self.game = scene.game
         self.vert = vert
         self.frag = frag
+        self.dirty_rects = dirty_rects
+        # initial values of the shaders' uniforms by name, None for all zeros
+        self.uniforms = uniforms
         self.layers: list[Layer] = []
 
-        self.image = self.game.ctx.image(self.game.size.itup, "rgba8unorm")
-        self.pipeline = self._create_pipeline()
-        self.surface = pygame.Surface(self.game.size, pygame.SRCALPHA)
+        # headless games have no gpu, so the group only ever draws to its surface
+        self.image = self.game.ctx.image(self.game.size.itup, "rgba8unorm") if self.game.ctx is not None else None
+        self.pipeline = self._create_pipeline() if self.game.ctx is not None else None
+        if dirty_rects:
+            # only the areas drawn to get cleared and sent to the gpu, see upload
+            self.surface = DirtySurface(self.game.size, pygame.SRCALPHA)
+            self.cleared: list[pygame.Rect] = [self.surface.get_rect()]
+            self.uploaded: dict[tuple[int, int, int, int], bytes] = {}
+        else:
+            self.surface = pygame.Surface(self.game.size, pygame.SRCALPHA)
 
     def _create_pipeline(self) -> zengl.Pipeline:
         return self.game.ctx.pipeline(
@@ -50,6 +132,7 @@ class LayerGroup:
             viewport=(0, 0, *self.game.size.itup),
             topology="triangle_strip",
             vertex_count=4,
+            uniforms=self.uniforms,
             blend={
                 "enable": True,
                 "src_color": "src_alpha",
@@ -76,17 +159,94 @@ class LayerGroup:
             ]
         )
 
+    def set_uniform(self, name: str, *values: float) -> None:
+        """Set a float, vec or float array uniform of the group's shaders.
+
+        Args:
+            name: The name of the uniform, which must have been given in
+                the group's uniforms.
+            values: The values to set it to.
+        """
+        if self.pipeline is None: return
+        self.pipeline.uniforms[name][:] = struct.pack(f"{len(values)}f", *values) # type: ignore
+
     def update(self, dt: float) -> None:
         for layer in self.layers:
             layer.update(dt)
 
+    def clear(self) -> None:
+        if not isinstance(self.surface, DirtySurface):
+            self.surface.fill((0, 0, 0, 0))
+            return
+        # wipe whatever was drawn last frame, without marking it as drawn again
+        for rect in self.surface.dirty:
+            pygame.Surface.fill(self.surface, (0, 0, 0, 0), rect)
+        self.cleared.extend(self.surface.dirty)
+        self.surface.dirty = []
+
     def draw(self) -> None:
+        if self.pipeline is None:
+            for layer in self.layers:
+                layer.draw(self.surface)
+            return
+
+        # batches render straight to the screen, so whatever was drawn onto the
+        # surface so far has to be shown before them, and the layers above
+        # them start over on a clear surface. Every batch that isn't on the
+        # last layer costs another upload, so batched layers should go last
+        pending = False
+        last = self.layers[-1] if self.layers else None
         for layer in self.layers:
             layer.draw(self.surface)
+            pending = True
+            batch = layer.batch
+            if batch is None or not batch.order: continue
+            self.present()
+            batch.render()
+            pending = False
+            if layer is not last:
+                self.clear()
+        if pending:
+            self.present()
 
-        self.image.write(pygame.image.tobytes(self.surface, "RGBA", True))
+    def present(self) -> None:
+        """Send the surface to the gpu and draw it to the screen."""
+        self.upload()
         self.pipeline.render()
 
+    def upload(self) -> None:
+        if not isinstance(self.surface, DirtySurface):
+            self.image.write(pygame.image.tobytes(self.surface, "RGBA", True))
+            return
+
+        # both the areas that were just wiped and the ones just drawn changed
+        regions = self._merge_rects(self.cleared + self.surface.dirty)
+        self.cleared = []
+        height = self.surface.get_height()
+        uploaded = {}
+        for rect in regions:
+            key = (rect.x, rect.y, rect.w, rect.h)
+            data = pygame.image.tobytes(self.surface.subsurface(rect), "RGBA", True)
+            uploaded[key] = data
+            # the hud tends to draw the exact same thing every frame
+            if self.uploaded.get(key) == data: continue
+            # the texture is flipped, so its rows start from the bottom
+            self.image.write(data, rect.size, (rect.x, height - rect.bottom))
+        self.uploaded = uploaded
+
+    def _merge_rects(self, rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            # keep absorbing overlapping rects until nothing overlaps anymore
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        if len(merged) > self.MAX_DIRTY_RECTS:
+            return [merged[0].unionall(merged[1:])]
+        return merged
+
 class LayerRecord:
     def __init__(self, type: Type[Layer], *args: Any, **kwargs: dict[str, Any]) -> None:
         self.type = type
@@ -98,27 +258,52 @@ class LayerRecord:
 
 class Layer:
     @classmethod
-    def record(cls, name: str, pixel_scale: int = 1) -> LayerRecord:
-        return LayerRecord(cls, name, pixel_scale)
+    def record(cls, name: str, pixel_scale: int = 1, batched: bool = False, cull: bool = False) -> LayerRecord:
+        return LayerRecord(cls, name, pixel_scale, batched, cull)
 
-    def __init__(self, scene: Scene, name: str, pixel_scale: int = 1) -> None:
+    def __init__(self, scene: Scene, name: str, pixel_scale: int = 1, batched: bool = False, cull: bool = False) -> None:
         self.game = scene.game
+        self.scene = ref_proxy(scene)
         self.name = name
         self.pixel_scale = pixel_scale
-        self.updating: list[Sprite] = []
-        self.drawing: list[Sprite] = []
+        # skip drawing sprites whose bounds are outside of the scene's view
+        self.cull = cull
+        # sprites can draw through this instead of onto the target, see Sprite.batch
+        self.batch = SpriteBatch(self.game) if batched and self.game.ctx is not None else None
+        # set by the group this layer is in once it's constructed
+        self.group: LayerGroup
+        self.updating: SpriteSet[Sprite] = SpriteSet()
+        self.drawing: SpriteSet[Sprite] = SpriteSet()
 
     def update(self, dt: float) -> None:
+        lod = self.scene.update_lod
         for sprite in self.updating:
-            sprite.update(dt)
+            if sprite.interpolated:
+                sprite._render_prev_pos = sprite.pos.copy()
+            if lod is None or not sprite.throttled:
+                sprite.update(dt)
+            elif (step := lod.step(sprite, dt)) is not None:
+                sprite.update(step)
 
     def draw(self, target: pygame.Surface) -> None:
+        view = self.scene.view_rect if self.cull else None
+        if view is None:
+            for sprite in self.drawing:
+                sprite.draw(target)
+            return
+
+        left, top, right, bottom = view
         for sprite in self.drawing:
-            sprite.draw(target)
+            bounds = sprite.bounds
+            if bounds is None or (bounds[0] <= right and bounds[2] >= left and bounds[1] <= bottom and bounds[3] >= top):
+                sprite.draw(target)
 
     def add(self, sprite: Sprite) -> None:
-        self.updating.append(sprite)
-        self.drawing.append(sprite)
+        # a reused sprite shouldn't be drawn sliding in from where it last was
+        if sprite.interpolated:
+            sprite._render_prev_pos = None
+        self.updating.add(sprite)
+        self.drawing.add(sprite)
 
     def remove(self, sprite: Sprite) -> None:
         self.updating.remove(sprite)
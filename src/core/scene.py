@@ -19,6 +19,24 @@ class Scene(AbstractClass):
             *map(lambda group: group.construct(self), self._layers),
         ]
         self.layers = {layer.name: layer for group in self.layer_groups for layer in group.layers}
+        # updates throttled sprites less often the further they are from the view, see UpdateLOD
+        self.update_lod: Optional[UpdateLOD] = None
+        # sprites added and removed during an update, applied in order once it's done
+        self.commands: list[tuple[bool, Sprite]] = []
+        self.deferring = False
+        # killed sprites of short lived classes waiting to be reused
+        self.sprite_pool = SpritePool()
+        # calls sprites want made at some point in the future, made at the start of every update
+        self.scheduler = Scheduler()
+
+    @property
+    def view_rect(self) -> Optional[tuple[float, float, float, float]]:
+        """The area of the world on screen as (left, top, right, bottom), or
+        None if the scene has no camera."""
+        if not hasattr(self, "camera"):
+            return None
+        x, y = self.camera.pos # type: ignore
+        return (x, y, x + self.game.size.x, y + self.game.size.y)
 
     def preupdate(self, dt: float) -> None:
         pass
@@ -27,10 +45,19 @@ class Scene(AbstractClass):
         pass
 
     def update(self, dt: float) -> None:
-        self.preupdate(dt)
-        for layer in self.layers.values():
-            layer.update(dt)
-        self.postupdate(dt)
+        self.deferring = True
+        try:
+            self.scheduler.run(time())
+            self.preupdate(dt)
+            view = self.view_rect
+            if self.update_lod is not None and view is not None:
+                self.update_lod.begin_frame(Vec((view[0] + view[2]) / 2, (view[1] + view[3]) / 2))
+            for layer in self.layers.values():
+                layer.update(dt)
+            self.postupdate(dt)
+        finally:
+            self.deferring = False
+            self.flush()
 
     def predraw(self, screen: pygame.Surface) -> None:
         pass
@@ -40,7 +67,7 @@ class Scene(AbstractClass):
 
     def draw(self) -> None:
         for group in self.layer_groups:
-            group.surface.fill((0, 0, 0, 0))
+            group.clear()
         self.predraw(self.layer_groups[0].surface)
         for group in self.layer_groups[:-1]:
             group.draw()
@@ -48,10 +75,30 @@ class Scene(AbstractClass):
         self.layer_groups[-1].draw()
 
     def add(self, sprite: Sprite) -> None:
+        if self.deferring:
+            self.commands.append((True, sprite))
+            return
         self.layers[sprite.layer].add(sprite)
+        sprite.on_add()
 
     def remove(self, sprite: Sprite) -> None:
+        if self.deferring:
+            self.commands.append((False, sprite))
+            return
         try:
             self.layers[sprite.layer].remove(sprite)
-        except ValueError:
+        except KeyError:
             Log.warn(f"Attempted to remove sprite {sprite} from scene {self}, but it was not found in the scene.")
+            return
+        sprite.on_remove()
+        self.sprite_pool.release(sprite)
+
+    def flush(self) -> None:
+        """Add and remove the sprites that were added and removed during the
+        update, in the order it happened in."""
+        commands, self.commands = self.commands, []
+        for adding, sprite in commands:
+            if adding:
+                self.add(sprite)
+            else:
+                self.remove(sprite)
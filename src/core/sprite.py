@@ -1,21 +1,66 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from src.core.sprite_batch import SpriteBatch
     from src.core.scene import Scene
 
 from abc import ABC as AbstractClass, abstractmethod
+from typing import Callable, ClassVar
 from src.core.util import *
 from uuid import uuid4
 import pygame
 
 class Sprite(AbstractClass):
+    # whether the scene's UpdateLOD may update this sprite less often when it's far away
+    throttled: ClassVar[bool] = False
+    # whether to draw this sprite between where it was at the last two ticks, see render_pos
+    interpolated: ClassVar[bool] = False
+    # how many killed sprites of this class the scene keeps around for acquire, see SpritePool
+    pool_size: ClassVar[int] = 0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # a reused sprite has to be put back into the state of a new one
+        if cls.pool_size > 0 and cls.reset is Sprite.reset:
+            raise TypeError(f"{cls.__name__} has a pool_size but doesn't override reset")
+
+    @classmethod
+    def acquire(cls, scene: Scene, *args: Any, **kwargs: Any) -> Self:
+        """Get a new sprite of this class, reusing a killed one if the class is
+        pooled. Takes the same arguments as constructing the sprite."""
+        return scene.sprite_pool.acquire(cls, scene, *args, **kwargs)
+
     def __init__(self, scene: Scene, layer: str) -> None:
         self.uuid = uuid4()
+        # sprites are hashed all the time by the sets they're in
+        self._hash = hash(self.uuid)
         self.game = ref_proxy(scene.game)
         self.scene = ref_proxy(scene)
         self.layer = layer
         self.pos = Vec()
         self.size = Vec()
+        # time that passed while this sprite was skipped by the UpdateLOD
+        self.skipped_dt = 0.0
+        # where the sprite was before the last tick, only kept for interpolated sprites
+        self._render_prev_pos: Optional[Vec] = None
+        # calls made through schedule, cancelled when the sprite is killed
+        self.scheduled: list[ScheduledCall] = []
+
+    def reset(self, *args: Any, **kwargs: Any) -> None:
+        """Put a killed sprite back into the state a new one would be in, given
+        the arguments of __init__ after the scene. Pooled classes have to
+        override it."""
+        pass
+
+    def on_add(self) -> None:
+        """Called once the sprite has actually been added to the scene, which
+        is deferred until the end of the update if it was added during one."""
+        pass
+
+    def on_remove(self) -> None:
+        """Called once the sprite has actually been removed from the scene,
+        the counterpart to on_add."""
+        pass
 
     @abstractmethod
     def update(self, dt: float) -> None:
@@ -25,25 +70,58 @@ class Sprite(AbstractClass):
     def draw(self, target: pygame.Surface) -> None:
         pass
 
+    @property
+    def batch(self) -> Optional[SpriteBatch]:
+        """The gpu batch of this sprite's layer, None if it isn't batched."""
+        return self.scene.layers[self.layer].batch
+
+    @property
+    def bounds(self) -> Optional[tuple[float, float, float, float]]:
+        """The area of the world this sprite draws to as (left, top, right,
+        bottom), used by culling layers. None means it is always drawn."""
+        return None
+
     @property
     def center_pos(self) -> Vec:
         return self.pos + self.size / 2
 
+    @property
+    def render_pos(self) -> Vec:
+        """Where to draw the sprite. Frames usually fall between two ticks, so
+        interpolated sprites are drawn that far between their last two
+        positions."""
+        prev_pos = self._render_prev_pos
+        if not self.interpolated or prev_pos is None:
+            return self.pos
+        return prev_pos + (self.pos - prev_pos) * self.game.alpha
+
     @property
     def screen_pos(self) -> Vec:
         if not hasattr(self.scene, "camera"):
-            return self.pos
-        return self.pos - self.scene.camera.pos # type: ignore
+            return self.render_pos
+        return self.render_pos - self.scene.camera.render_pos # type: ignore
 
     @property
     def screen_center_pos(self) -> Vec:
         return self.screen_pos + self.size / 2
 
+    def schedule(self, delay: float, callback: Callable[[], Any], interval: Optional[float] = None) -> ScheduledCall:
+        """Have the scene's scheduler call back after a delay, and every
+        interval after that if one is given, until this sprite is killed."""
+        # drop the one-off calls that already happened
+        self.scheduled = [call for call in self.scheduled if call.active]
+        call = self.scene.scheduler.after(delay, callback, interval)
+        self.scheduled.append(call)
+        return call
+
     def kill(self) -> None:
+        for call in self.scheduled:
+            call.cancel()
+        self.scheduled.clear()
         self.scene.remove(self)
 
     def __hash__(self) -> int:
-        return hash(self.uuid)
+        return self._hash
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}{{{self.uuid}}}"
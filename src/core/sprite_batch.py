@@ -0,0 +1,151 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.core.game import Game
+
+from src.game.resources import VertShader, FragShader
+from src.core.util import *
+import numpy as np
+import pygame
+import zengl
+
+# x, y, width, height, rotation, r, g, b, a, u0, v0, u1, v1
+INSTANCE_FLOATS = 13
+INSTANCE_LAYOUT = "2f 2f 1f 4f 4f"
+
+class SpriteTexture:
+    """An atlas page uploaded to the gpu, along with everything needed to draw
+    many images from it in a single instanced draw call."""
+
+    def __init__(self, game: Game, page: AtlasPage) -> None:
+        self.game = game
+        self.page = page
+        self.version = -1
+        self.image = game.ctx.image((page.size, page.size), "rgba8unorm")
+        self.instances: list[tuple[float, ...]] = []
+        self.capacity = 0
+        self.buffer: zengl.Buffer
+        self.pipeline: zengl.Pipeline
+
+    def _allocate(self, capacity: int) -> None:
+        if self.capacity:
+            self.game.ctx.release(self.pipeline)
+            self.game.ctx.release(self.buffer)
+        self.capacity = capacity
+        self.buffer = self.game.ctx.buffer(size=capacity * INSTANCE_FLOATS * 4)
+        self.pipeline = self.game.ctx.pipeline(
+            vertex_shader=VertShader.get("sprite"),
+            fragment_shader=FragShader.get("sprite"),
+            framebuffer=None,
+            viewport=(0, 0, *self.game.size.itup),
+            topology="triangle_strip",
+            vertex_count=4,
+            vertex_buffers=zengl.bind(self.buffer, INSTANCE_LAYOUT, 0, 1, 2, 3, 4, instance=True),
+            uniforms={
+                "u_screen": self.game.size.itup,
+            },
+            blend={
+                "enable": True,
+                "src_color": "src_alpha",
+                "dst_color": "one_minus_src_alpha",
+                "src_alpha": "one",
+                "dst_alpha": "one_minus_src_alpha",
+            },
+            resources=[
+                {
+                    "type": "sampler",
+                    "binding": 0,
+                    "image": self.image,
+                    "min_filter": "nearest",
+                    "mag_filter": "nearest",
+                    "wrap_x": "clamp_to_edge",
+                    "wrap_y": "clamp_to_edge",
+                },
+            ],
+            layout=[
+                {
+                    "name": "u_texture",
+                    "binding": 0,
+                },
+            ]
+        )
+
+    def render(self) -> None:
+        count = len(self.instances)
+        if count == 0: return
+        # something new got packed into the page since it was last uploaded
+        if self.version != self.page.version:
+            self.image.write(pygame.image.tobytes(self.page.surface, "RGBA", True))
+            self.version = self.page.version
+        if count > self.capacity:
+            self._allocate(max(count, self.capacity * 2, 64))
+        self.buffer.write(np.array(self.instances, dtype=np.float32).tobytes())
+        self.pipeline.instance_count = count
+        self.pipeline.render()
+        self.instances.clear()
+
+class SpriteBatch:
+    """
+    Collects the sprites of a layer during its draw and renders everything
+    on the same atlas page with one instanced draw call, instead of blitting
+    them onto the layer group's surface. Images that aren't in the atlas yet
+    are packed into it the first time they are drawn, so images drawn this way
+    shouldn't be changed afterwards.
+
+    A batch is drawn on top of everything its layer and the layers below it in
+    the group drew onto the surface, and below the layers above it, one atlas
+    page at a time in the order the pages were first drawn from each frame.
+    """
+
+    def __init__(self, game: Game, atlas: Optional[TextureAtlas] = None) -> None:
+        self.game = game
+        self.atlas = Image.atlas if atlas is None else atlas
+        self.textures: dict[AtlasPage, SpriteTexture] = {}
+        self.order: list[SpriteTexture] = []
+        # plain rectangles are just a stretched white pixel
+        pixel = pygame.Surface((1, 1), pygame.SRCALPHA)
+        pixel.fill((255, 255, 255, 255))
+        self.pixel = self.atlas.add(pixel)
+
+    def draw(self, image: pygame.Surface, pos: Vec, angle: float = 0, tint: tuple[int, ...] = (255, 255, 255), size: Optional[Vec] = None) -> None:
+        """
+        Queue an image to be drawn this frame.
+
+        Args:
+            image: The image to draw.
+            pos: The screen position of the center of the image.
+            angle: The clockwise rotation around the center in radians.
+            tint: The color to multiply the image by, optionally with alpha.
+            size: The size to stretch the image to, defaults to its own size.
+        """
+        self.draw_region(self.atlas.add(image), pos, angle, tint, size)
+
+    def draw_region(self, region: AtlasRegion, pos: Vec, angle: float = 0, tint: tuple[int, ...] = (255, 255, 255), size: Optional[Vec] = None) -> None:
+        """
+        Queue a region of the atlas to be drawn this frame, see `draw`.
+        """
+        texture = self.textures.get(region.page)
+        if texture is None:
+            texture = self.textures[region.page] = SpriteTexture(self.game, region.page)
+        if not texture.instances:
+            self.order.append(texture)
+        w, h = region.rect.size if size is None else size
+        alpha = tint[3] if len(tint) > 3 else 255
+        texture.instances.append((pos.x, pos.y, w, h, angle, tint[0] / 255, tint[1] / 255, tint[2] / 255, alpha / 255, *region.uv))
+
+    def draw_rect(self, pos: Vec, size: Vec, color: tuple[int, ...], angle: float = 0) -> None:
+        """
+        Queue a filled rectangle to be drawn this frame.
+
+        Args:
+            pos: The screen position of the center of the rectangle.
+            size: The width and height of the rectangle.
+            color: The color of the rectangle, optionally with alpha.
+            angle: The clockwise rotation around the center in radians.
+        """
+        self.draw_region(self.pixel, pos, angle, color, size)
+
+    def render(self) -> None:
+        for texture in self.order:
+            texture.render()
+        self.order.clear()
@@ -6,3 +6,15 @@ from .vector import *
 from .debug import *
 from .timer import *
 from .hitbox import *
+from .spatial_hash import *
+from .batch_collision import *
+from .physics import *
+from .text import *
+from .surface_pool import *
+from .rotation_cache import *
+from .chunks import *
+from .update_lod import *
+from .sprite_set import *
+from .sprite_pool import *
+from .frame_pacer import *
+from .scheduler import *
@@ -0,0 +1,74 @@
+from __future__ import annotations
+from src.core.util.hitbox import Hitbox
+from typing import Sequence
+import numpy as np
+
+def batch_is_colliding(pairs: Sequence[tuple[Hitbox, Hitbox]]) -> np.ndarray:
+    """Run the separating axis test on many pairs of hitboxes at once.
+
+    Every distinct hitbox is packed once into a (hitboxes, vertices, 2) array
+    of world space points, padding shorter polygons by repeating their last
+    vertex, which doesn't change any of their projections. Their edge normals
+    are packed the same way, padded with zero axes that can never separate
+    anything. All pairs are then projected onto all of their axes in a single
+    vectorized pass.
+
+    Args:
+        pairs: The pairs of hitboxes to test, usually the candidates returned
+            by `SpatialHash.pairs` for a frame.
+
+    Returns:
+        A boolean array where each element is whether the pair at the same
+        index is colliding, matching `Hitbox.is_colliding`.
+    """
+    count = len(pairs)
+    if count == 0:
+        return np.zeros(0, dtype=bool)
+
+    # Pack each hitbox once, even if it takes part in many pairs
+    firsts, seconds = zip(*pairs)
+    hitboxes = list(dict.fromkeys(firsts + seconds))
+    indices = {hitbox: i for i, hitbox in enumerate(hitboxes)}
+    first = np.fromiter(map(indices.__getitem__, firsts), dtype=np.intp, count=count)
+    second = np.fromiter(map(indices.__getitem__, seconds), dtype=np.intp, count=count)
+
+    # Build plain lists first, converting them in one go is much cheaper than
+    # writing every hitbox into the arrays separately
+    all_points = [hitbox.points for hitbox in hitboxes]
+    all_normals = [hitbox.normals for hitbox in hitboxes]
+    max_points = max(max(map(len, all_points)), 1)
+    max_normals = max(max(map(len, all_normals)), 1)
+    solid = np.fromiter(map(bool, all_points), dtype=bool, count=len(hitboxes))
+    points = np.array([
+        hitbox_points + hitbox_points[-1:] * (max_points - len(hitbox_points)) if hitbox_points
+        else [(0.0, 0.0)] * max_points
+        for hitbox_points in all_points
+    ], dtype=np.float64)
+    normals = np.array([
+        hitbox_normals + [(0.0, 0.0)] * (max_normals - len(hitbox_normals))
+        for hitbox_normals in all_normals
+    ], dtype=np.float64)
+    centers = np.array([(hitbox.center.x, hitbox.center.y) for hitbox in hitboxes], dtype=np.float64)
+    radii = np.fromiter((hitbox.radius for hitbox in hitboxes), dtype=np.float64, count=len(hitboxes))
+
+    # Pairs whose bounding circles don't touch can't be colliding, and
+    # neither can hitboxes that haven't been given a shape yet
+    offsets = centers[first] - centers[second]
+    reach = radii[first] + radii[second]
+    close = np.einsum("nd,nd->n", offsets, offsets) <= reach * reach
+    close &= solid[first] & solid[second]
+    colliding = np.zeros(count, dtype=bool)
+    candidates = np.flatnonzero(close)
+    if len(candidates) == 0:
+        return colliding
+    first, second = first[candidates], second[candidates]
+
+    # Project both polygons of every remaining pair onto the axes of both
+    axes = np.concatenate((normals[first], normals[second]), axis=1)
+    proj_a = np.einsum("nvd,nkd->nkv", points[first], axes)
+    proj_b = np.einsum("nvd,nkd->nkv", points[second], axes)
+    separated = (proj_a.max(axis=2) < proj_b.min(axis=2)) | (proj_b.max(axis=2) < proj_a.min(axis=2))
+    colliding[candidates] = ~separated.any(axis=1)
+    return colliding
+
+__all__ = ["batch_is_colliding"]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from src.core.util.vector import Vec
+from typing import Callable, Generic, Iterator, Optional, TypeVar
+from collections import OrderedDict, deque
+from queue import SimpleQueue
+import threading
+import weakref
+import sys
+
+T = TypeVar("T")
+ChunkKey = tuple[int, int]
+
+class ChunkManager(Generic[T]):
+    """Generates square chunks of the world around a moving position and keeps
+    the most recently used ones around.
+
+    Chunks are generated on a worker thread so that generating them never
+    stalls a frame. Until a chunk is finished it is simply missing from the
+    results of `nearby`. Only the `max_cached` most recently used chunks are
+    kept, so memory doesn't grow with the size of the world that has been
+    explored. Chunks that get thrown away will be generated again when they
+    are needed, so generation should be deterministic.
+
+    Args:
+        generate: Creates the contents of the chunk at the given chunk
+            coordinates. Called from the worker thread.
+        chunk_size: The width and height of a chunk in world units.
+        load_radius: How many chunks around the position to generate.
+        max_cached: The maximum number of finished chunks to keep.
+        threaded: Whether to use a worker thread. Without one, a few chunks
+            are generated at the start of every `update` instead.
+    """
+    # how many chunks to generate per update without a worker thread
+    SYNC_BUDGET = 2
+
+    def __init__(self, generate: Callable[[int, int], T], chunk_size: int, load_radius: int = 2, max_cached: int = 256, threaded: bool = True) -> None:
+        self.generate = generate
+        self.chunk_size = chunk_size
+        self.load_radius = load_radius
+        # never throw away chunks that are still within the load radius
+        self.max_cached = max(max_cached, 2 * (2 * load_radius + 1) ** 2)
+        self.chunks: OrderedDict[ChunkKey, T] = OrderedDict()
+        self.pending: set[ChunkKey] = set()
+        self.finished: deque[tuple[ChunkKey, T]] = deque()
+        self.requests: SimpleQueue[Optional[ChunkKey]] = SimpleQueue()
+        self.threaded = threaded and not sys.platform.startswith("emscripten")
+        if self.threaded:
+            worker = threading.Thread(target=self._work, args=(generate, self.requests, self.finished), daemon=True)
+            worker.start()
+            # stop the worker once nothing can ask it for chunks anymore
+            weakref.finalize(self, self.requests.put, None)
+
+    @staticmethod
+    def _work(generate: Callable[[int, int], T], requests: SimpleQueue[Optional[ChunkKey]], finished: deque[tuple[ChunkKey, T]]) -> None:
+        while (key := requests.get()) is not None:
+            finished.append((key, generate(*key)))
+
+    def key(self, pos: Vec) -> ChunkKey:
+        """Get the coordinates of the chunk that contains a position."""
+        return (int(pos.x // self.chunk_size), int(pos.y // self.chunk_size))
+
+    def update(self, pos: Vec) -> None:
+        """Collect finished chunks and ask for the missing ones around a
+        position, closest first.
+
+        Args:
+            pos: The position to load chunks around, usually the player's.
+        """
+        if not self.threaded:
+            for _ in range(min(self.SYNC_BUDGET, len(self.pending))):
+                key = self.requests.get()
+                if key is not None:
+                    self.finished.append((key, self.generate(*key)))
+
+        while self.finished:
+            key, chunk = self.finished.popleft()
+            self.pending.discard(key)
+            self.chunks[key] = chunk
+        while len(self.chunks) > self.max_cached:
+            self.chunks.popitem(last=False)
+
+        cx, cy = self.key(pos)
+        radius = self.load_radius
+        missing = [
+            (x, y)
+            for x in range(cx - radius, cx + radius + 1)
+            for y in range(cy - radius, cy + radius + 1)
+            if (x, y) not in self.chunks and (x, y) not in self.pending
+        ]
+        missing.sort(key=lambda key: (key[0] - cx) ** 2 + (key[1] - cy) ** 2)
+        for key in missing:
+            self.pending.add(key)
+            self.requests.put(key)
+
+    def get(self, key: ChunkKey) -> Optional[T]:
+        """Get a chunk if it has been generated, marking it as recently used."""
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+        return chunk
+
+    def nearby(self, pos: Vec, radius: int) -> Iterator[tuple[ChunkKey, T]]:
+        """Yield the generated chunks around a position.
+
+        Args:
+            pos: The position to look around.
+            radius: How many chunks around the position's chunk to include.
+
+        Yields:
+            The coordinates and contents of every finished chunk in range.
+        """
+        cx, cy = self.key(pos)
+        for x in range(cx - radius, cx + radius + 1):
+            for y in range(cy - radius, cy + radius + 1):
+                chunk = self.get((x, y))
+                if chunk is not None:
+                    yield (x, y), chunk
+
+__all__ = ["ChunkManager"]
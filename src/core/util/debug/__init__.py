@@ -47,8 +47,6 @@ if sys.platform.startswith("emscripten"):
         def launch_tkinter_tree(cls, game: object) -> None:
             pass
 
-        _pause_time = 0
-
     Debug = DummyDebug
 
     class DummyLog:
@@ -5,14 +5,12 @@ if TYPE_CHECKING:
 
 from functools import lru_cache
 from typing import Any, Callable, Optional
-from src.core.util.timer import Time
 from itertools import chain
 from functools import wraps
 from tkinter import ttk
 import tkinter as tk
 import tomllib
 import weakref
-import pygame
 import types
 import os
 import gc
@@ -128,8 +126,6 @@ class Debug:
 
     _visible = True
     _paused = False
-    _pause_start = 0
-    _pause_time = 0
 
     @staticmethod
     def toggle_visibility() -> None:
@@ -146,19 +142,14 @@ class Debug:
 
     @staticmethod
     def pause(game: Game) -> None:
-        """Pauses the game and updates the time to reflect the pause."""
+        """Pauses the game."""
         Debug._paused = True
-        Debug._pause_start = pygame.time.get_ticks() / 1000
 
     @staticmethod
     def unpause(game: Game) -> None:
-        """Unpauses the game and updates the time to reflect the unpause."""
+        """Unpauses the game. The game's time only moves while it ticks, so
+        nothing has to make up for the time spent paused."""
         Debug._paused = False
-        Debug._pause_time += pygame.time.get_ticks() / 1000 - Debug._pause_start
-        # Unfortunately we need to update this here as well or else for one
-        # frame the time will be off, causing issues with timers and such
-        game.time = pygame.time.get_ticks() / 1000 - Debug._pause_time
-        Time.begin_frame(game)
 
     @staticmethod
     def paused() -> bool:
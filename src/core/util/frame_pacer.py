@@ -0,0 +1,69 @@
+from __future__ import annotations
+from time import perf_counter
+import asyncio
+import sys
+
+class FramePacer:
+    """Waits out the rest of every frame so the game runs at a target frame
+    rate instead of as fast as it can.
+
+    Most of the wait is an asyncio sleep, which is only accurate to a
+    millisecond or two, so the last `SPIN_TIME` of it is spent yielding to
+    the event loop until the frame is due. When vsync is on, flipping the
+    display already waits for the screen, so the pacer only steps in when the
+    target is below the refresh rate. While idle, e.g. paused or in the
+    background, frames drop to `idle_fps` to save power.
+
+    Args:
+        fps: The target frame rate, 0 for no limit.
+        idle_fps: The frame rate while idle.
+        vsync: Whether flipping the display waits for the screen.
+        refresh_rate: The screen's refresh rate, 0 if unknown.
+    """
+    SPIN_TIME = 0.002
+
+    def __init__(self, fps: float, idle_fps: float, vsync: bool = False, refresh_rate: float = 0) -> None:
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.vsync = vsync
+        self.refresh_rate = refresh_rate
+        self.idle = False
+        self.last = perf_counter()
+        # the browser schedules every frame itself, spinning would only stall it
+        self.spin_time = 0 if sys.platform.startswith("emscripten") else self.SPIN_TIME
+
+    def restart(self) -> None:
+        """Time the next frame from now, e.g. after a long load."""
+        self.last = perf_counter()
+
+    @property
+    def target_fps(self) -> float:
+        """The frame rate being paced to right now, 0 for no limit."""
+        fps = self.idle_fps if self.idle else self.fps
+        # vsync is already holding us to the refresh rate
+        if self.vsync and (fps <= 0 or fps >= self.refresh_rate > 0):
+            return 0
+        return fps
+
+    async def wait(self) -> float:
+        """Wait until the next frame is due, letting other tasks run
+        meanwhile.
+
+        Returns:
+            The time since the last frame in seconds.
+        """
+        fps = self.target_fps
+        if fps > 0:
+            deadline = self.last + 1 / fps
+            while (remaining := deadline - perf_counter()) > self.spin_time:
+                await asyncio.sleep(remaining - self.spin_time)
+            while perf_counter() < deadline:
+                await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(0)
+        now = perf_counter()
+        dt = now - self.last
+        self.last = now
+        return dt
+
+__all__ = ["FramePacer"]
@@ -1,6 +1,6 @@
 from .vector import Vec
-from typing import List, Self
-from math import radians, cos, sin, pi
+from typing import List, Optional, Self
+from math import radians, cos, sin, pi, hypot
 
 class Hitbox():
     """
@@ -14,6 +14,7 @@ class Hitbox():
         self.original_vertices = vertices
         self.vertices = vertices
         self.angle_rad = 0
+        self.__invalidate_shape()
 
     def set_size_rect(self, dx: float, dy: float) -> None:
         self.original_vertices = [
@@ -22,23 +23,24 @@ class Hitbox():
             Vec( dx/2,  dy/2),
             Vec(-dx/2,  dy/2),
         ]
-        self.vertices = self.original_vertices
+        self.__update_rotation()
 
     def set_size_rad(self, rad: float) -> None:
         points = []
         for i in range(6):
             points.append(Vec(rad * cos(2 * pi * i / 6), rad * sin(2 * pi * i / 6)))
         self.original_vertices = points
-        self.vertices = points
+        self.__update_rotation()
 
     def set_rotation(self, angle: float, degrees = True) -> None:
         if degrees:
-            self.angle_rad = -radians(angle)
-        else:
-            self.angle_rad = angle
+            angle = -radians(angle)
+        if angle == self.angle_rad: return
+        self.angle_rad = angle
         self.__update_rotation()
 
     def rotate(self, angle: float, degrees = True) -> None:
+        if angle == 0: return
         if degrees:
             self.angle_rad -= radians(angle)
         else:
@@ -56,7 +58,7 @@ class Hitbox():
             trans_y = p.y + translation.y
             translated.append(Vec(trans_x, trans_y))
         self.original_vertices = translated
-
+        self.__update_rotation()
 
     def __update_rotation(self) -> None:
         cos_a = cos(self.angle_rad)
@@ -68,37 +70,103 @@ class Hitbox():
             rotated_y = p.x * sin_a + p.y * cos_a
             rotated.append(Vec(rotated_x, rotated_y))
         self.vertices = rotated
+        self.__invalidate_shape()
+
+    def __invalidate_shape(self) -> None:
+        # Everything relative to the center only changes with the shape or the
+        # rotation, the world space caches are also keyed on the center since
+        # it is usually shared with (and moved in place by) the owner's pos
+        self._normals: Optional[list[tuple[float, float]]] = None
+        self._radius: Optional[float] = None
+        self._world_key: Optional[tuple[float, float]] = None
+        self._points: list[tuple[float, float]] = []
+        self._hitbox: Optional[List[Vec]] = None
+        self._bounds: Optional[tuple[float, float, float, float]] = None
+
+    def __update_world(self) -> None:
+        key = (self.center.x, self.center.y)
+        if key == self._world_key: return
+        cx, cy = key
+        self._points = [(p.x + cx, p.y + cy) for p in self.vertices]
+        self._world_key = key
+        self._hitbox = None
+        self._bounds = None
+
+    @property
+    def normals(self) -> list[tuple[float, float]]:
+        """The unit normals of the edges, with parallel edges only counted
+        once since they project onto the same axis."""
+        if self._normals is None:
+            normals: list[tuple[float, float]] = []
+            verts = self.vertices
+            for i in range(len(verts)):
+                point1 = verts[i]
+                point2 = verts[(i+1) % len(verts)]
+                # rotate 90 degrees and normalize
+                nx, ny = point1.y - point2.y, point2.x - point1.x
+                length = hypot(nx, ny)
+                if length == 0: continue
+                nx, ny = nx / length, ny / length
+                if any(abs(nx * oy - ny * ox) < 1e-9 for ox, oy in normals): continue
+                normals.append((nx, ny))
+            self._normals = normals
+        return self._normals
+
+    @property
+    def radius(self) -> float:
+        """The radius of the smallest circle around the center containing the
+        whole hitbox."""
+        if self._radius is None:
+            self._radius = max((p.magnitude() for p in self.vertices), default=0)
+        return self._radius
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """The world space bounding box as (left, top, right, bottom)."""
+        self.__update_world()
+        if self._bounds is None:
+            xs = [p[0] for p in self._points] or [self.center.x]
+            ys = [p[1] for p in self._points] or [self.center.y]
+            self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        return self._bounds
+
+    @property
+    def points(self) -> list[tuple[float, float]]:
+        """The world space vertices as tuples of floats."""
+        self.__update_world()
+        return self._points
 
     def get_hitbox(self) -> List[Vec]:
-        real_hitbox = []
-        for p in self.vertices:
-            real_hitbox.append(p + self.center)
-        return real_hitbox
+        self.__update_world()
+        if self._hitbox is None:
+            self._hitbox = [Vec(p) for p in self._points]
+        return self._hitbox
 
     def project_to_axis(self, axis: Vec) -> Vec:
         # create a "shadow" using dot product
-        dots = [point.dot(axis) for point in self.get_hitbox()]
-        return Vec(min(dots), max(dots))
+        return Vec(self.__project(axis.x, axis.y))
+
+    def __project(self, ax: float, ay: float) -> tuple[float, float]:
+        dots = [x * ax + y * ay for x, y in self._points]
+        return min(dots), max(dots)
 
     def is_colliding(self, other: Self) -> bool:
-        # apparently this method is called the Separating Axis Theorem
-        axies = []
+        # cheap rejection first, the bounding circles don't even touch
+        dx = self.center.x - other.center.x
+        dy = self.center.y - other.center.y
+        reach = self.radius + other.radius
+        if dx * dx + dy * dy > reach * reach:
+            return False
 
-        # get all axies from hitboxes, and find their perpendicular axis
+        # apparently this method is called the Separating Axis Theorem
+        self.__update_world()
+        other.__update_world()
         for polygon in (self, other):
-            poly = polygon.get_hitbox()
-            for i in range(len(poly)):
-                point1 = poly[i]
-                point2 = poly[(i+1) % len(poly)]
-                edge = point2 - point1
-                normal = Vec(-edge.y, edge.x).normalize() # rotate 90 degrees and normalize
-                axies.append(normal)
-
-        for axis in axies:
-            min1, max1 = self.project_to_axis(axis)
-            min2, max2 = other.project_to_axis(axis)
-            if max1 < min2 or max2 < min1:
-                return False # a projection doesn't overlap
+            for ax, ay in polygon.normals:
+                min1, max1 = self.__project(ax, ay)
+                min2, max2 = other.__project(ax, ay)
+                if max1 < min2 or max2 < min1:
+                    return False # a projection doesn't overlap
 
         return True # all projections overlap
 
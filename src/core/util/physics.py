@@ -0,0 +1,173 @@
+from __future__ import annotations
+from src.core.util.vector import Vec
+from typing import Any, Iterable, Protocol
+import numpy as np
+
+class Body(Protocol):
+    pos: Vec
+    vel: Vec
+    acc: Vec
+    ext_acc: Vec
+    ext_vel: Vec
+
+class PhysicsWorld:
+    """Moves many bodies at once by integrating their motion in NumPy arrays.
+
+    Bodies keep their own Vecs, so they can be changed in any way during a
+    tick (e.g. `body.acc.x = 0` or `body.ext_acc += push`). Each step copies
+    the bodies that take part in it into contiguous arrays, integrates all of
+    them together and writes the results back in place, which keeps any
+    references to the bodies' `pos` valid (hitboxes share it, for example).
+
+    A body only moves in the steps it was told to with `move`, by the time it
+    was given there, so bodies that are updated less often (e.g. throttled by
+    an UpdateLOD) also move less often, but by the same distance in the end.
+
+    All of `vel`, `acc`, `ext_vel` and `ext_acc` are measured in unit/s, and
+    `ext_acc` and `ext_vel` are consumed when the body is moved.
+
+    Args:
+        damping: The fraction of velocity that is kept after one second.
+        separation: The acceleration pushing two touching bodies apart.
+        capacity: The number of bodies to allocate room for up front.
+    """
+
+    def __init__(self, damping: float, separation: float, capacity: int = 256) -> None:
+        self.damping = damping
+        self.separation = separation
+        self.bodies: list[Any] = []
+        self.indices: dict[Any, int] = {}
+        # the time each body moves by in the next step, 0 for not at all
+        self.dt = np.zeros(0, dtype=np.float64)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        count = len(self.bodies)
+        # the vectors are only filled in while stepping, so they needn't be kept
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.acc = np.zeros((capacity, 2), dtype=np.float64)
+        self.ext_acc = np.zeros((capacity, 2), dtype=np.float64)
+        self.ext_vel = np.zeros((capacity, 2), dtype=np.float64)
+        dt = np.zeros(capacity, dtype=np.float64)
+        dt[:count] = self.dt[:count]
+        self.dt = dt
+
+    def add(self, body: Body) -> None:
+        """Start simulating a body. Does nothing if it is already simulated.
+
+        Args:
+            body: The body to add.
+        """
+        if body in self.indices: return
+        index = len(self.bodies)
+        if index == len(self.dt):
+            self._allocate(index * 2)
+        self.dt[index] = 0
+        self.indices[body] = index
+        self.bodies.append(body)
+
+    def remove(self, body: Body) -> None:
+        """Stop simulating a body. Does nothing if it isn't simulated.
+
+        The last body is swapped into the removed body's slot so that the
+        arrays stay contiguous.
+
+        Args:
+            body: The body to remove.
+        """
+        index = self.indices.pop(body, None)
+        if index is None: return
+        last = self.bodies.pop()
+        if last is body: return
+        self.dt[index] = self.dt[len(self.bodies)]
+        self.bodies[index] = last
+        self.indices[last] = index
+
+    def move(self, body: Body, dt: float) -> None:
+        """Have the next step move a body by some time.
+
+        Args:
+            body: The body to move, which must be simulated.
+            dt: The time to move it by in seconds.
+        """
+        self.dt[self.indices[body]] = dt
+
+    def step(self, contacts: Iterable[tuple[Body, Body]] = ()) -> list[Body]:
+        """Move every body that was told to by `move`.
+
+        Args:
+            contacts: Pairs of bodies that are touching and should be pushed
+                away from each other. Every body pushes the other one for as
+                long as it moves itself, bodies that aren't moving keep the
+                push in their `ext_acc` for when they do.
+
+        Returns:
+            The bodies whose position changed.
+        """
+        count = len(self.bodies)
+        if count == 0: return []
+        dt = self.dt[:count]
+        moving = np.flatnonzero(dt)
+        if len(moving) == 0: return []
+
+        # Only the moving bodies and the ones they touch take part
+        indices = self.indices
+        pairs = [(indices[a], indices[b]) for a, b in contacts if a in indices and b in indices]
+        involved = moving
+        if pairs:
+            pair_indices = np.array(pairs, dtype=np.intp)
+            involved = np.union1d(moving, pair_indices)
+            # where each body of a pair ended up in the involved bodies
+            first, second = np.searchsorted(involved, pair_indices).T
+        step = dt[involved][:, None]
+        dt[:] = 0
+
+        bodies = [self.bodies[index] for index in involved.tolist()]
+        count = len(bodies)
+        pos, vel, acc = self.pos[:count], self.vel[:count], self.acc[:count]
+        ext_acc, ext_vel = self.ext_acc[:count], self.ext_vel[:count]
+        pos[:] = [(body.pos.x, body.pos.y) for body in bodies]
+        vel[:] = [(body.vel.x, body.vel.y) for body in bodies]
+        acc[:] = [(body.acc.x, body.acc.y) for body in bodies]
+        ext_acc[:] = [(body.ext_acc.x, body.ext_acc.y) for body in bodies]
+        ext_vel[:] = [(body.ext_vel.x, body.ext_vel.y) for body in bodies]
+
+        # Push every touching pair apart along the line between their centers
+        if pairs:
+            offsets = pos[first] - pos[second]
+            lengths = np.hypot(offsets[:, 0], offsets[:, 1])[:, None]
+            normals = np.divide(offsets, lengths, out=np.zeros_like(offsets), where=lengths > 0)
+            np.add.at(ext_acc, first, self.separation * step[second] * normals)
+            np.add.at(ext_acc, second, -self.separation * step[first] * normals)
+
+        # Bodies that aren't moving have a step of 0, which leaves them be
+        active = step > 0
+        vel += acc * step
+        vel += np.where(active, ext_acc, 0)
+        vel *= self.damping ** step
+        displacement = vel * step + np.where(active, ext_vel, 0)
+        pos += displacement
+
+        moved = []
+        for body, (is_active,), (px, py), (vx, vy), (ax, ay), (dx, dy) in zip(
+            bodies, active.tolist(), pos.tolist(), vel.tolist(), ext_acc.tolist(), displacement.tolist()
+        ):
+            if not is_active:
+                body.ext_acc.update(ax, ay)
+                continue
+            body.pos.update(px, py)
+            body.vel.update(vx, vy)
+            body.ext_acc.update(0, 0)
+            body.ext_vel.update(0, 0)
+            if dx or dy:
+                moved.append(body)
+        return moved
+
+    def __contains__(self, body: object) -> bool:
+        return body in self.indices
+
+    def __len__(self) -> int:
+        return len(self.bodies)
+
+__all__ = ["Body", "PhysicsWorld"]
@@ -1,10 +1,14 @@
 from __future__ import annotations
 from src.core.util.general import pathof, read_file
-from typing import TypeVar, Generic, Any, ClassVar
+from typing import TypeVar, Generic, Any, ClassVar, Optional, cast
 from src.core.util.debug import Log
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from time import perf_counter
 from abc import abstractmethod
+from enum import Enum, auto
+import threading
 import pygame
+import sys
 import os
 
 class ResourceMeta(type):
@@ -23,55 +27,267 @@ class ResourceMeta(type):
         # Create copy of instances for each subclass
         cls.instances = {}
 
+class LoadMode(Enum):
+    """When a resource gets loaded."""
+    EAGER = auto()
+    """During `Resource.preload`, before the game starts."""
+    LAZY = auto()
+    """The first time it is asked for with `get`."""
+    BACKGROUND = auto()
+    """Read from disk on a background thread started by `Resource.preload`, and
+    finished on the main thread by the first `get`. Same as LAZY where threads
+    aren't available."""
+
 T = TypeVar("T")
 @dataclass
 class Resource(Generic[T], metaclass=ResourceMeta):
     """A resource loaded from disk."""
     DIR = "res"
     instances: ClassVar[dict[str, Resource]] = {}
+    # the background thread hands what it read over to the main thread under this
+    _lock: ClassVar[threading.RLock] = threading.RLock()
 
     @classmethod
     def preload(cls) -> int:
-        """Preload all resources."""
+        """Load all eager resources and start loading the background ones.
+
+        Returns:
+            The number of resources that were loaded.
+        """
+        start = perf_counter()
         loaded = 0
         for subclass in cls.__subclasses__():
             loaded += subclass.preload()
-        for instance in cls.instances.values():
+        eager = [instance for instance in cls.instances.values() if instance.mode == LoadMode.EAGER]
+        background = [instance for instance in cls.instances.values() if instance.mode == LoadMode.BACKGROUND]
+        for instance in eager:
             cls.get(instance.name)
-        loaded += len(cls.instances)
-        Log.info(f"Preloaded {loaded} {cls.__name__}s.")
+        loaded += len(eager)
+        # no threads in the browser, these just load on first use there instead
+        if background and not sys.platform.startswith("emscripten"):
+            threading.Thread(target=cls._load_all, args=(background,), daemon=True).start()
+
+        deferred = len(cls.instances) - len(eager)
+        Log.info(f"Preloaded {loaded} {cls.__name__}s in {(perf_counter() - start) * 1000:.1f}ms, {deferred} deferred.")
+        if cls is Resource:
+            cls.report()
         return loaded
 
+    @classmethod
+    def _load_all(cls, instances: list[Resource]) -> None:
+        # only reads, anything shared like the display or the atlas is left to load
+        for instance in instances:
+            if instance.object is not None: continue
+            data = instance.read()
+            with Resource._lock:
+                if instance.object is None:
+                    instance.data = data
+
     @classmethod
     def get(cls, name: str) -> T:
         instance = cls.instances[name]
         if instance.object is None:
-            instance.object = instance.load()
+            with Resource._lock:
+                # it may have been loaded by the other thread while waiting
+                if instance.object is None:
+                    start = perf_counter()
+                    instance.object = instance.load()
+                    instance.load_time = perf_counter() - start
+                    instance.data = None
         return instance.object
 
+    @classmethod
+    def report(cls, count: int = 5) -> None:
+        """Log how long the slowest resources took to load so far.
+
+        Args:
+            count: How many of the slowest resources to list.
+        """
+        instances = [instance for instance in cls.all_instances() if instance.load_time is not None]
+        instances.sort(key=lambda instance: instance.load_time, reverse=True)
+        total = sum(instance.load_time for instance in instances)
+        slowest = ", ".join(f"{instance.name} {instance.load_time * 1000:.1f}ms" for instance in instances[:count])
+        Log.info(f"Loaded {len(instances)} resources in {total * 1000:.1f}ms total, slowest: {slowest}.")
+
+    @classmethod
+    def all_instances(cls) -> list[Resource]:
+        instances = list(cls.instances.values())
+        for subclass in cls.__subclasses__():
+            instances.extend(subclass.all_instances())
+        return instances
+
     name: str
     path: str
+    mode: LoadMode = field(default=LoadMode.EAGER, kw_only=True)
 
     def __post_init__(self) -> None:
         self.path = os.path.join(self.DIR, self.path)
         self.object = None
+        # what read returned if it was called ahead of load, see read
+        self.data: Any = None
+        self.load_time: Optional[float] = None
         self.instances[self.name] = self
 
+    def read(self) -> Any:
+        """Do the part of loading that doesn't touch anything shared with the
+        main thread, e.g. reading the file, so background resources can do it
+        on their thread. The result is kept in `data` for `load`, which has to
+        work without it as well."""
+        return None
+
     @abstractmethod
     def load(self) -> T:
-        """Load the resource from disk."""
+        """Load the resource from disk, on the main thread."""
         pass
 
+@dataclass
+class AtlasRegion:
+    """Where an image was packed into a texture atlas."""
+    page: AtlasPage
+    rect: pygame.Rect
+    uv: tuple[float, float, float, float]
+    """The texture coordinates of the top left and bottom right corners, for
+    a page uploaded flipped like the layer group surfaces."""
+    surface: pygame.Surface
+    """The packed image itself, a subsurface of the page."""
+
+class AtlasPage:
+    """A single large surface that images are packed into row by row."""
+
+    def __init__(self, size: int, padding: int) -> None:
+        self.size = size
+        self.padding = padding
+        self.surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        # [y, height, next free x] of each row of images
+        self.shelves: list[list[int]] = []
+        self.bottom = 0
+        # bumped whenever something is packed, so textures know to reupload
+        self.version = 0
+
+    def pack(self, surface: pygame.Surface) -> Optional[AtlasRegion]:
+        """Copy an image into the page.
+
+        Args:
+            surface: The image to copy.
+
+        Returns:
+            The region the image was packed into, None if it doesn't fit.
+        """
+        w, h = surface.get_size()
+        padded_w, padded_h = w + self.padding, h + self.padding
+        pos = None
+        # the shortest row that the image fits into wastes the least space
+        for shelf in sorted(self.shelves, key=lambda shelf: shelf[1]):
+            y, height, x = shelf
+            if padded_h <= height and x + padded_w <= self.size:
+                pos = (x, y)
+                shelf[2] += padded_w
+                break
+        if pos is None:
+            if self.bottom + padded_h > self.size or padded_w > self.size:
+                return None
+            pos = (0, self.bottom)
+            self.shelves.append([self.bottom, padded_h, padded_w])
+            self.bottom += padded_h
+
+        rect = pygame.Rect(pos, (w, h))
+        # max-blending onto the empty page copies the pixels exactly
+        self.surface.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        self.version += 1
+        uv = (
+            rect.left / self.size, 1 - rect.top / self.size,
+            rect.right / self.size, 1 - rect.bottom / self.size,
+        )
+        return AtlasRegion(self, rect, uv, self.surface.subsurface(rect))
+
+class TextureAtlas:
+    """
+    Packs images into a few large pages so that everything on a page can be
+    drawn with the same texture. Images are only packed once, runtime variants
+    of them (tints and rotations) are generated once and packed as well.
+
+    Args:
+        page_size: The width and height of each page in pixels.
+        padding: The empty space left between images to avoid bleeding.
+    """
+
+    def __init__(self, page_size: int = 1024, padding: int = 1) -> None:
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: list[AtlasPage] = []
+        self.regions: dict[pygame.Surface, AtlasRegion] = {}
+        self.variants: dict[tuple[pygame.Surface, Optional[tuple[int, ...]], int], AtlasRegion] = {}
+
+    def add(self, surface: pygame.Surface) -> AtlasRegion:
+        """Get the region of an image, packing it first if it isn't already.
+
+        Args:
+            surface: The image to get the region of. This may also be the
+                surface of a region of this atlas.
+
+        Returns:
+            The region the image is in.
+        """
+        region = self.regions.get(surface)
+        if region is not None:
+            return region
+        for page in self.pages:
+            region = page.pack(surface)
+            if region is not None: break
+        else:
+            # images too big for a normal page get a page of their own
+            size = max(self.page_size, *(length + self.padding for length in surface.get_size()))
+            page = AtlasPage(size, self.padding)
+            self.pages.append(page)
+            region = cast(AtlasRegion, page.pack(surface))
+        self.regions[surface] = region
+        self.regions[region.surface] = region
+        return region
+
+    def variant(self, surface: pygame.Surface, tint: Optional[tuple[int, ...]] = None, angle: float = 0) -> AtlasRegion:
+        """Get the region of a tinted and/or rotated copy of an image, creating
+        and packing it the first time it's asked for.
+
+        Args:
+            surface: The original image.
+            tint: The color to multiply the image by, None for no tint.
+            angle: The counterclockwise rotation in degrees, like
+                pygame.transform.rotate. Rounded to whole degrees.
+
+        Returns:
+            The region the variant is in.
+        """
+        angle = round(angle) % 360
+        if tint is None and angle == 0:
+            return self.add(surface)
+        key = (surface, tint, angle)
+        region = self.variants.get(key)
+        if region is None:
+            image = surface.copy()
+            if tint is not None:
+                image.fill(tint, special_flags=pygame.BLEND_RGBA_MULT)
+            if angle:
+                image = pygame.transform.rotate(image, angle)
+            region = self.variants[key] = self.add(image)
+        return region
+
 @dataclass
 class Image(Resource[pygame.Surface]):
     """An image resource."""
     DIR = "images"
+    atlas: ClassVar[TextureAtlas] = TextureAtlas()
 
     scale: float = 1.0
 
+    def read(self) -> pygame.Surface:
+        # converting and packing the image need the main thread
+        return pygame.image.load(self.path)
+
     def load(self) -> pygame.Surface:
-        surface = pygame.image.load(self.path).convert_alpha()
-        return pygame.transform.scale_by(surface, self.scale)
+        surface = (self.data if self.data is not None else self.read()).convert_alpha()
+        surface = pygame.transform.scale_by(surface, self.scale)
+        # every image gets packed as it loads, the atlas copy is used from then on
+        return self.atlas.add(surface).surface
 
 @dataclass
 class Sound(Resource[pygame.Sound]):
@@ -109,19 +325,29 @@ class VertShader(Resource[str]):
     """A vertex shader resource."""
     DIR = "shaders"
 
-    def load(self) -> str:
+    def read(self) -> str:
         return read_file(self.path)
 
+    def load(self) -> str:
+        return self.data if self.data is not None else self.read()
+
 @dataclass
 class FragShader(Resource[str]):
     """A fragment shader resource."""
     DIR = "shaders"
 
-    def load(self) -> str:
+    def read(self) -> str:
         return read_file(self.path)
 
+    def load(self) -> str:
+        return self.data if self.data is not None else self.read()
+
 __all__ = [
+    "LoadMode",
     "Resource",
+    "AtlasRegion",
+    "AtlasPage",
+    "TextureAtlas",
     "Image",
     "Sound",
     "Font",
@@ -0,0 +1,53 @@
+from __future__ import annotations
+from src.core.util.vector import Vec
+from collections import OrderedDict
+import pygame
+
+class RotationCache:
+    """Keeps rotated copies of images so that sprites drawing rotated art
+    don't have to rotate it again every frame.
+
+    Angles are rounded to the nearest multiple of the resolution, so an image
+    has at most 360 / resolution rotated copies. The least recently used
+    copies are thrown away once there are more than `max_entries` of them.
+    The source images are cached by identity and must not be changed after
+    they have been rotated.
+
+    Args:
+        resolution: The size of each angle step in degrees.
+        max_entries: The maximum number of rotated copies to keep.
+    """
+
+    def __init__(self, resolution: float = 1, max_entries: int = 512) -> None:
+        self.resolution = resolution
+        self.max_entries = max_entries
+        self.steps = max(1, round(360 / resolution))
+        self.cache: OrderedDict[tuple[pygame.Surface, int], pygame.Surface] = OrderedDict()
+
+    def get(self, image: pygame.Surface, angle: float) -> tuple[pygame.Surface, Vec]:
+        """Get a rotated copy of an image.
+
+        Args:
+            image: The image to rotate.
+            angle: The counterclockwise angle in degrees, like
+                pygame.transform.rotate.
+
+        Returns:
+            The rotated image along with its size.
+        """
+        step = round(angle / self.resolution) % self.steps
+        key = (image, step)
+        rotated = self.cache.get(key)
+        if rotated is not None:
+            self.cache.move_to_end(key)
+        else:
+            rotated = self.cache[key] = pygame.transform.rotate(image, step * 360 / self.steps)
+            if len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        return rotated, Vec(rotated.get_size())
+
+    def clear(self) -> None:
+        """Forget all rotated images."""
+        self.cache.clear()
+
+__all__ = ["RotationCache"]
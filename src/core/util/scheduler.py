@@ -0,0 +1,91 @@
+from __future__ import annotations
+from src.core.util.timer import time
+from typing import Any, Callable, Optional
+from itertools import count
+import heapq
+
+class ScheduledCall:
+    """A callback waiting in a Scheduler, which can be cancelled."""
+    __slots__ = ("deadline", "interval", "callback")
+
+    def __init__(self, deadline: float, interval: Optional[float], callback: Callable[[], Any]) -> None:
+        self.deadline = deadline
+        self.interval = interval
+        self.callback: Optional[Callable[[], Any]] = callback
+
+    @property
+    def active(self) -> bool:
+        """Whether the call is still going to happen."""
+        return self.callback is not None
+
+    def cancel(self) -> None:
+        """Stop the call from happening (again)."""
+        self.callback = None
+
+class Scheduler:
+    """Calls callbacks once the game's time reaches their deadlines.
+
+    Calls are kept in a heap ordered by deadline, so running the scheduler
+    only costs anything for the calls that are due, however many are
+    waiting. Cancelled calls are dropped once they come up.
+    """
+
+    def __init__(self) -> None:
+        self.heap: list[tuple[float, int, ScheduledCall]] = []
+        # breaks ties between equal deadlines in the order they were scheduled
+        self.counter = count()
+
+    def at(self, deadline: float, callback: Callable[[], Any], interval: Optional[float] = None) -> ScheduledCall:
+        """Call a callback once the time reaches a deadline.
+
+        Args:
+            deadline: The time to call it at, as given by `time()`.
+            callback: The function to call.
+            interval: If given, keep calling it this many seconds apart.
+
+        Returns:
+            The scheduled call, to cancel it with.
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError(f"Interval must be positive, got {interval}")
+        call = ScheduledCall(deadline, interval, callback)
+        heapq.heappush(self.heap, (deadline, next(self.counter), call))
+        return call
+
+    def after(self, delay: float, callback: Callable[[], Any], interval: Optional[float] = None) -> ScheduledCall:
+        """Call a callback once a number of seconds have passed. See `at`."""
+        return self.at(time() + delay, callback, interval)
+
+    def run(self, now: float) -> int:
+        """Make every call that is due, in order of deadline.
+
+        Args:
+            now: The current time.
+
+        Returns:
+            How many calls were made.
+        """
+        heap = self.heap
+        made = 0
+        while heap and heap[0][0] <= now:
+            _, _, call = heapq.heappop(heap)
+            callback = call.callback
+            if callback is None: continue
+            if call.interval is None:
+                call.callback = None
+            else:
+                call.deadline += call.interval
+                heapq.heappush(heap, (call.deadline, next(self.counter), call))
+            callback()
+            made += 1
+        return made
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """When the next call (possibly a cancelled one) is due, if any."""
+        return self.heap[0][0] if self.heap else None
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+__all__ = ["ScheduledCall", "Scheduler"]
@@ -0,0 +1,332 @@
+from __future__ import annotations
+from src.core.util.vector import Vec
+from typing import Any, Callable, Iterable, Iterator, Protocol
+from math import ceil, inf
+
+Cell = tuple[int, int]
+
+class Positioned(Protocol):
+    pos: Vec
+
+class SpatialHash:
+    """A uniform grid that sorts objects into square cells by their position.
+
+    Objects are inserted once under a category (e.g. "entity") and stay in the
+    grid until they are removed. Calling `update` on an object only moves it
+    when it has crossed into a different cell, so keeping the grid in sync
+    costs one key computation per moving object instead of a full rebuild.
+
+    Objects are filed by their position only, so every query is widened by
+    `padding` to catch objects whose center is just outside of the queried
+    area but whose body reaches into it. The queries are generators; changes
+    made to the grid while one of them is running (e.g. a projectile killing
+    another one) are held back until every running query has finished.
+
+    Args:
+        cell_size: The width and height of a single cell in world units.
+        padding: How far outside of a queried area to look for objects.
+            Defaults to the cell size.
+    """
+
+    def __init__(self, cell_size: int, padding: float | None = None) -> None:
+        self.cell_size = cell_size
+        self.padding = cell_size if padding is None else padding
+        self.cells: dict[Cell, dict[str, set[Any]]] = {}
+        self.entries: dict[Any, tuple[Cell, str]] = {}
+        self._iterating = 0
+        self._deferred: list[tuple[Callable[..., None], tuple[Any, ...]]] = []
+
+    def key(self, pos: Vec) -> Cell:
+        """Get the cell that contains the given position.
+
+        Args:
+            pos: The position to get the cell of.
+
+        Returns:
+            The integer coordinates of the cell.
+        """
+        return (int(pos.x // self.cell_size), int(pos.y // self.cell_size))
+
+    def insert(self, obj: Positioned, category: str) -> None:
+        """Add an object to the grid, replacing any previous entry it had.
+
+        Args:
+            obj: The object to add, which must have a `pos` attribute.
+            category: The category to file the object under.
+        """
+        if self._iterating:
+            self._deferred.append((self.insert, (obj, category)))
+            return
+        if obj in self.entries:
+            self.remove(obj)
+        cell = self.key(obj.pos)
+        self._add(cell, category, obj)
+        self.entries[obj] = (cell, category)
+
+    def remove(self, obj: Positioned) -> None:
+        """Remove an object from the grid. Does nothing if it isn't in it.
+
+        Args:
+            obj: The object to remove.
+        """
+        if self._iterating:
+            self._deferred.append((self.remove, (obj,)))
+            return
+        entry = self.entries.pop(obj, None)
+        if entry is None: return
+        self._discard(*entry, obj)
+
+    def update(self, obj: Positioned) -> None:
+        """Move an object to the cell of its current position if it has left
+        its previous cell. Does nothing if the object isn't in the grid.
+
+        Args:
+            obj: The object to update.
+        """
+        if self._iterating:
+            self._deferred.append((self.update, (obj,)))
+            return
+        entry = self.entries.get(obj)
+        if entry is None: return
+        cell, category = entry
+        new_cell = self.key(obj.pos)
+        if new_cell == cell: return
+        self._discard(cell, category, obj)
+        self._add(new_cell, category, obj)
+        self.entries[obj] = (new_cell, category)
+
+    def query_radius(self, pos: Vec, radius: float, category: str) -> Iterator[Any]:
+        """Yield the objects of a category that may be within a circle.
+
+        Args:
+            pos: The center of the circle.
+            radius: The radius of the circle.
+            category: The category of objects to look for.
+
+        Yields:
+            Every object filed in a cell that overlaps the padded circle.
+        """
+        reach = radius + self.padding
+        return self.query_rect(pos.x - reach, pos.y - reach, pos.x + reach, pos.y + reach, category, padding=0)
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float, category: str, padding: float | None = None) -> Iterator[Any]:
+        """Yield the objects of a category that may be within a rectangle.
+
+        Args:
+            left: The leftmost x-coordinate of the rectangle.
+            top: The topmost y-coordinate of the rectangle.
+            right: The rightmost x-coordinate of the rectangle.
+            bottom: The bottommost y-coordinate of the rectangle.
+            category: The category of objects to look for.
+            padding: How much to widen the rectangle by on each side. Defaults
+                to the padding of the grid.
+
+        Yields:
+            Every object filed in a cell that overlaps the padded rectangle.
+        """
+        if padding is None:
+            padding = self.padding
+        size = self.cell_size
+        x0, y0 = int((left - padding) // size), int((top - padding) // size)
+        x1, y1 = int((right + padding) // size), int((bottom + padding) // size)
+        cells = ((x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+        return self._iter_cells(cells, category)
+
+    def query_segment(self, start: Vec, end: Vec, category: str, width: float = 0) -> Iterator[Any]:
+        """Yield the objects of a category that may touch a line segment.
+
+        The cells are found by walking along the segment one cell at a time,
+        so long rays only look at the cells they actually pass through.
+
+        Args:
+            start: The start of the segment.
+            end: The end of the segment.
+            category: The category of objects to look for.
+            width: How far away from the segment objects may be, e.g. half of
+                the width of a beam.
+
+        Yields:
+            Every object filed in a cell within reach of the segment.
+        """
+        size = self.cell_size
+        reach = ceil((width + self.padding) / size)
+        seen: set[Cell] = set()
+        cells: list[Cell] = []
+        for cx, cy in self._walk(start, end):
+            for x in range(cx - reach, cx + reach + 1):
+                for y in range(cy - reach, cy + reach + 1):
+                    if (x, y) not in seen:
+                        seen.add((x, y))
+                        cells.append((x, y))
+        return self._iter_cells(cells, category)
+
+    def nearest(self, pos: Vec, category: str, k: int = 1, max_distance: float = inf) -> list[Any]:
+        """Get the objects of a category closest to a position.
+
+        Rings of cells are searched outwards from the position until the k
+        closest objects found can no longer be beaten by anything further out.
+
+        Args:
+            pos: The position to search around.
+            category: The category of objects to look for.
+            k: The maximum number of objects to return.
+            max_distance: The maximum distance an object may be at.
+
+        Returns:
+            Up to k objects sorted from closest to furthest.
+        """
+        if k <= 0 or not self.cells:
+            return []
+        size = self.cell_size
+        cx, cy = self.key(pos)
+        if max_distance == inf:
+            # Every occupied cell is within this many rings of the center
+            max_ring = max(max(abs(x - cx), abs(y - cy)) for x, y in self.cells)
+        else:
+            max_ring = ceil(max_distance / size)
+        max_dist_sq = max_distance * max_distance
+        found: list[tuple[float, Any]] = []
+        for ring in range(max_ring + 1):
+            for obj in self._iter_cells(self._ring(cx, cy, ring), category):
+                dist_sq = pos.distance_squared_to(obj.pos)
+                if dist_sq <= max_dist_sq:
+                    found.append((dist_sq, obj))
+            # Anything in the next ring is at least this far away
+            if len(found) >= k:
+                found.sort(key=lambda item: item[0])
+                del found[k:]
+                if found[-1][0] <= (ring * size) ** 2:
+                    break
+        found.sort(key=lambda item: item[0])
+        return [obj for _, obj in found[:k]]
+
+    def pairs(self, category: str, other: str | None = None) -> list[tuple[Any, Any]]:
+        """Get every pair of objects that are close enough to possibly touch.
+
+        Two objects are paired when their cells are within the padding of each
+        other. Without `other`, every unordered pair within `category` is
+        returned once; with it, every (category, other) pair is returned.
+
+        Args:
+            category: The category of the first object of each pair.
+            other: The category of the second object of each pair. Defaults to
+                the first category.
+
+        Returns:
+            The candidate pairs for a narrow phase such as `batch_is_colliding`.
+        """
+        reach = ceil(self.padding / self.cell_size)
+        cells = self.cells
+        found: list[tuple[Any, Any]] = []
+        if other is None or other == category:
+            # Only look at half of the neighbours so each pair is found once
+            offsets = [(dx, dy) for dx in range(0, reach + 1) for dy in range(-reach, reach + 1) if dx > 0 or dy > 0]
+            for (cx, cy), buckets in cells.items():
+                bucket = buckets.get(category)
+                if bucket is None: continue
+                members = list(bucket)
+                for i, a in enumerate(members):
+                    for b in members[i + 1:]:
+                        found.append((a, b))
+                for dx, dy in offsets:
+                    neighbour = cells.get((cx + dx, cy + dy))
+                    if neighbour is None or category not in neighbour: continue
+                    for b in neighbour[category]:
+                        for a in members:
+                            found.append((a, b))
+        else:
+            offsets = [(dx, dy) for dx in range(-reach, reach + 1) for dy in range(-reach, reach + 1)]
+            for (cx, cy), buckets in cells.items():
+                bucket = buckets.get(category)
+                if bucket is None: continue
+                for dx, dy in offsets:
+                    neighbour = cells.get((cx + dx, cy + dy))
+                    if neighbour is None or other not in neighbour: continue
+                    for b in neighbour[other]:
+                        for a in bucket:
+                            found.append((a, b))
+        return found
+
+    def _iter_cells(self, cells: Iterable[Cell], category: str) -> Iterator[Any]:
+        self._iterating += 1
+        try:
+            grid = self.cells
+            for cell in cells:
+                buckets = grid.get(cell)
+                if buckets is None: continue
+                bucket = buckets.get(category)
+                if bucket is not None:
+                    yield from bucket
+        finally:
+            self._iterating -= 1
+            if not self._iterating and self._deferred:
+                deferred, self._deferred = self._deferred, []
+                for method, args in deferred:
+                    method(*args)
+
+    def _ring(self, cx: int, cy: int, ring: int) -> Iterator[Cell]:
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for x in range(cx - ring, cx + ring + 1):
+            yield (x, cy - ring)
+            yield (x, cy + ring)
+        for y in range(cy - ring + 1, cy + ring):
+            yield (cx - ring, y)
+            yield (cx + ring, y)
+
+    def _walk(self, start: Vec, end: Vec) -> Iterator[Cell]:
+        # Amanatides & Woo grid traversal
+        size = self.cell_size
+        x, y = self.key(start)
+        end_x, end_y = self.key(end)
+        dx, dy = end.x - start.x, end.y - start.y
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if dx != 0:
+            next_x = (x + (step_x > 0)) * size
+            t_max_x, t_delta_x = (next_x - start.x) / dx, size / abs(dx)
+        else:
+            t_max_x = t_delta_x = inf
+        if dy != 0:
+            next_y = (y + (step_y > 0)) * size
+            t_max_y, t_delta_y = (next_y - start.y) / dy, size / abs(dy)
+        else:
+            t_max_y = t_delta_y = inf
+        yield (x, y)
+        while (x, y) != (end_x, end_y) and min(t_max_x, t_max_y) <= 1:
+            if t_max_x < t_max_y:
+                x += step_x
+                t_max_x += t_delta_x
+            else:
+                y += step_y
+                t_max_y += t_delta_y
+            yield (x, y)
+
+    def _add(self, cell: Cell, category: str, obj: Positioned) -> None:
+        buckets = self.cells.get(cell)
+        if buckets is None:
+            buckets = self.cells[cell] = {}
+        bucket = buckets.get(category)
+        if bucket is None:
+            bucket = buckets[category] = set()
+        bucket.add(obj)
+
+    def _discard(self, cell: Cell, category: str, obj: Positioned) -> None:
+        # Empty buckets and cells are dropped so the grid doesn't grow with
+        # every cell that something has ever passed through
+        buckets = self.cells[cell]
+        bucket = buckets[category]
+        bucket.discard(obj)
+        if not bucket:
+            del buckets[category]
+            if not buckets:
+                del self.cells[cell]
+
+    def __contains__(self, obj: object) -> bool:
+        return obj in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+__all__ = ["SpatialHash"]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, TypeVar
+if TYPE_CHECKING:
+    from src.core.sprite import Sprite
+    from src.core.scene import Scene
+
+from src.core.util.debug import Log
+from dataclasses import dataclass
+
+S = TypeVar("S", bound="Sprite")
+
+@dataclass
+class PoolStats:
+    """How a sprite class' pool has been used so far."""
+    # sprites that had to be constructed because the pool was empty
+    created: int = 0
+    # sprites that were handed out again instead
+    reused: int = 0
+    # killed sprites that were put in the pool
+    released: int = 0
+    # killed sprites that were let go of because the pool was full
+    dropped: int = 0
+    # sprites in the pool right now
+    free: int = 0
+
+class SpritePool:
+    """Keeps killed sprites of short lived classes around so that new ones can
+    reuse them instead of being constructed from scratch.
+
+    A class is pooled by giving it a `pool_size` above 0, which caps how many
+    killed sprites of it are kept. Pooled sprites are handed out by
+    `Sprite.acquire` and put back by the scene once they have been removed
+    from it. A reused sprite has its `reset` called with the arguments it was
+    acquired with instead of `__init__`, which has to put it back into the
+    state a new sprite would be in.
+    """
+
+    def __init__(self) -> None:
+        self.free: dict[type, list[Sprite]] = {}
+        self.stats: dict[type, PoolStats] = {}
+
+    def acquire(self, cls: type[S], scene: Scene, *args: Any, **kwargs: Any) -> S:
+        """Get a sprite of a class, reusing a killed one if there is one.
+
+        Args:
+            cls: The class of the sprite.
+            scene: The scene the sprite is for.
+            *args: The arguments to construct or reset the sprite with.
+            **kwargs: The keyword arguments to construct or reset the sprite
+                with.
+
+        Returns:
+            The sprite, which still has to be added to the scene.
+        """
+        if cls.pool_size <= 0:
+            return cls(scene, *args, **kwargs)
+        stats = self.stats.setdefault(cls, PoolStats())
+        free = self.free.get(cls)
+        if not free:
+            stats.created += 1
+            return cls(scene, *args, **kwargs)
+        sprite = free.pop()
+        stats.reused += 1
+        stats.free -= 1
+        sprite.reset(*args, **kwargs)
+        return sprite # type: ignore
+
+    def release(self, sprite: Sprite) -> None:
+        """Put a sprite that was removed from the scene into its class' pool,
+        if the class is pooled.
+
+        Args:
+            sprite: The sprite, which mustn't be used by anything anymore.
+        """
+        cls = type(sprite)
+        if cls.pool_size <= 0: return
+        stats = self.stats.setdefault(cls, PoolStats())
+        free = self.free.setdefault(cls, [])
+        if len(free) >= cls.pool_size:
+            stats.dropped += 1
+            return
+        free.append(sprite)
+        stats.released += 1
+        stats.free += 1
+
+    def report(self) -> None:
+        """Log how much every pool has been used."""
+        for cls, stats in self.stats.items():
+            Log.info(f"{cls.__name__} pool: {stats.created} created, {stats.reused} reused, {stats.dropped} dropped, {stats.free} free.")
+
+    def clear(self) -> None:
+        """Let go of every pooled sprite."""
+        self.free.clear()
+        for stats in self.stats.values():
+            stats.free = 0
+
+__all__ = ["PoolStats", "SpritePool"]
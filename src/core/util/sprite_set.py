@@ -0,0 +1,86 @@
+from __future__ import annotations
+from typing import Generic, Hashable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+class SpriteSet(Generic[T]):
+    """An ordered set of sprites with constant time adding and removing.
+
+    Sprites are kept in the order they were added. While the set is being
+    iterated over, adding and removing is deferred until every iteration has
+    finished, so sprites can add and kill each other in the middle of an
+    update without the update skipping or repeating anyone. Sprites removed
+    during an iteration are not visited by it anymore, and sprites added
+    during one are first visited by the next.
+
+    Args:
+        items: The sprites to start with.
+    """
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._items: dict[T, None] = dict.fromkeys(items)
+        self._added: dict[T, None] = {}
+        self._removed: set[T] = set()
+        self._iterating = 0
+
+    def add(self, item: T) -> None:
+        """Add a sprite, doing nothing if it's already in the set."""
+        if not self._iterating:
+            self._items[item] = None
+        elif item in self._removed:
+            self._removed.discard(item)
+        elif item not in self._items:
+            self._added[item] = None
+
+    def remove(self, item: T) -> None:
+        """Remove a sprite.
+
+        Raises:
+            KeyError: If the sprite isn't in the set.
+        """
+        if item not in self:
+            raise KeyError(item)
+        self.discard(item)
+
+    def discard(self, item: T) -> None:
+        """Remove a sprite if it's in the set."""
+        if not self._iterating:
+            self._items.pop(item, None)
+        elif item in self._added:
+            del self._added[item]
+        elif item in self._items:
+            self._removed.add(item)
+
+    def flush(self) -> None:
+        """Apply the changes deferred by iterating. Done automatically once
+        the last iteration finishes."""
+        if self._removed:
+            for item in self._removed:
+                del self._items[item]
+            self._removed.clear()
+        if self._added:
+            self._items.update(self._added)
+            self._added.clear()
+
+    def __iter__(self) -> Iterator[T]:
+        self._iterating += 1
+        try:
+            removed = self._removed
+            for item in self._items:
+                if item not in removed:
+                    yield item
+        finally:
+            self._iterating -= 1
+            if not self._iterating:
+                self.flush()
+
+    def __contains__(self, item: object) -> bool:
+        return (item in self._items and item not in self._removed) or item in self._added
+
+    def __len__(self) -> int:
+        return len(self._items) - len(self._removed) + len(self._added)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}([{', '.join(map(str, self))}])"
+
+__all__ = ["SpriteSet"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from src.core.util.typing import Coord
+import pygame
+
+PoolKey = tuple[int, int, int]
+
+class SurfacePool:
+    """Hands out scratch surfaces for drawing, reusing the ones from previous
+    frames instead of allocating new ones every frame.
+
+    Surfaces are grouped by their size and flags. Every surface handed out
+    during a frame is taken back by `end_frame`, so they must not be kept
+    around after the frame they were asked for in. Sizes that haven't been
+    asked for in a while are let go of so that the pool doesn't keep growing.
+    """
+    KEEP_FRAMES = 120
+    _free: dict[PoolKey, list[pygame.Surface]] = {}
+    _used: list[tuple[PoolKey, pygame.Surface]] = []
+    _last_used: dict[PoolKey, int] = {}
+    _frame = 0
+
+    @staticmethod
+    def get(size: Coord, flags: int = pygame.SRCALPHA) -> pygame.Surface:
+        """Get a cleared surface to draw onto for the rest of this frame.
+
+        Args:
+            size: The size of the surface, truncated to whole pixels.
+            flags: The flags to create the surface with.
+
+        Returns:
+            A fully transparent (or black without SRCALPHA) surface without
+            any surface alpha or colorkey set.
+        """
+        key = (int(size[0]), int(size[1]), flags)
+        free = SurfacePool._free.get(key)
+        if free:
+            surface = free.pop()
+            # undo whatever the last user of the surface did to it, setting the
+            # alpha to None would also turn off per-pixel alpha
+            surface.set_alpha(255 if flags & pygame.SRCALPHA else None)
+            surface.set_colorkey(None)
+            surface.fill((0, 0, 0, 0))
+        else:
+            surface = pygame.Surface(key[:2], flags)
+        SurfacePool._used.append((key, surface))
+        SurfacePool._last_used[key] = SurfacePool._frame
+        return surface
+
+    @staticmethod
+    def end_frame() -> None:
+        """Take back every surface handed out this frame."""
+        free = SurfacePool._free
+        for key, surface in SurfacePool._used:
+            free.setdefault(key, []).append(surface)
+        SurfacePool._used.clear()
+
+        SurfacePool._frame += 1
+        if SurfacePool._frame % SurfacePool.KEEP_FRAMES: return
+        oldest = SurfacePool._frame - SurfacePool.KEEP_FRAMES
+        for key, frame in list(SurfacePool._last_used.items()):
+            if frame < oldest:
+                del SurfacePool._last_used[key]
+                free.pop(key, None)
+
+    @staticmethod
+    def clear() -> None:
+        """Let go of every surface that isn't in use."""
+        SurfacePool._free.clear()
+
+__all__ = ["SurfacePool"]
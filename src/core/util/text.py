@@ -0,0 +1,78 @@
+from __future__ import annotations
+from src.core.util.resource import Font
+from src.core.util.typing import Coord
+from collections import OrderedDict
+import pygame
+
+TextKey = tuple[str, str, tuple[int, ...], bool]
+
+class TextCache:
+    """Keeps rendered text around so that drawing the same text every frame
+    doesn't render it from scratch every frame.
+
+    Rendered surfaces are kept in a least recently used cache keyed by
+    (font, text, color, antialias). Text that keeps changing, like counters,
+    should be drawn with `blit_glyphs` instead, which only ever caches the
+    individual characters.
+    """
+    MAX_ENTRIES = 512
+    _cache: OrderedDict[TextKey, pygame.Surface] = OrderedDict()
+
+    @staticmethod
+    def render(font: str, text: str, color: tuple[int, ...], antialias: bool = False) -> pygame.Surface:
+        """Render text, or get it from the cache if it was rendered before.
+
+        Args:
+            font: The name of the Font resource to render with.
+            text: The text to render.
+            color: The color of the text.
+            antialias: Whether to render the text antialiased.
+
+        Returns:
+            The rendered text. It is shared, so it shouldn't be drawn onto.
+        """
+        cache = TextCache._cache
+        key = (font, text, color, antialias)
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        surface = cache[key] = Font.get(font).render(text, antialias, color)
+        if len(cache) > TextCache.MAX_ENTRIES:
+            cache.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def blit_glyphs(target: pygame.Surface, font: str, text: str, color: tuple[int, ...], pos: Coord, antialias: bool = False) -> pygame.Rect:
+        """Draw text one cached character at a time.
+
+        Meant for short, frequently changing text such as numbers, where
+        caching every full string would just fill the cache with values that
+        are never seen again. Kerning is ignored, which is fine for the pixel
+        font.
+
+        Args:
+            target: The surface to draw onto.
+            font: The name of the Font resource to render with.
+            text: The text to draw.
+            color: The color of the text.
+            pos: The top left corner of the text on the target.
+            antialias: Whether to render the text antialiased.
+
+        Returns:
+            The area of the target that was drawn onto.
+        """
+        x, y = pos
+        rect = pygame.Rect(x, y, 0, 0)
+        for char in text:
+            glyph = TextCache.render(font, char, color, antialias)
+            rect.union_ip(target.blit(glyph, (x, y)))
+            x += glyph.get_width()
+        return rect
+
+    @staticmethod
+    def clear() -> None:
+        """Forget all rendered text."""
+        TextCache._cache.clear()
+
+__all__ = ["TextCache"]
@@ -36,7 +36,8 @@ class Timer():
     @property
     def elapsed(self) -> float:
         """The time elapsed since the timer started."""
-        return min(time() - self.time - self.paused_duration - ((time() - self.pause_start) if self.paused else 0), self.duration)
+        now = time()
+        return min(now - self.time - self.paused_duration - ((now - self.pause_start) if self.paused else 0), self.duration)
 
     @property
     def remaining(self) -> float:
@@ -59,7 +60,9 @@ class Timer():
     def done(self) -> bool:
         """Whether the timer is done."""
         if self.has_been_done: return True
-        self.has_been_done = self.elapsed >= self.duration and not self.paused
+        if self.paused: return False
+        # compare against the deadline instead of working out elapsed, timers are polled a lot
+        self.has_been_done = Time._time >= self.time + self.paused_duration + self.duration
         return self.has_been_done
 
     def reset(self, duration: Optional[float] = None) -> None:
@@ -0,0 +1,68 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Sequence
+if TYPE_CHECKING:
+    from src.core.sprite import Sprite
+
+from src.core.util.vector import Vec
+
+class UpdateLOD:
+    """Updates sprites that are far away from the action less often.
+
+    Sprites are put into tiers by their distance from a focus point, usually
+    the middle of the screen. A sprite in a tier with an interval of n is only
+    updated every n frames, with all of the time that passed since its last
+    update, so it still moves as far as it would have. Sprites in the same
+    tier are spread over the frames of the interval so that the work is even
+    from frame to frame. Since the tier is worked out every frame, a sprite
+    that comes close is updated again on the very next frame.
+
+    Only sprites with `throttled` set are affected, see Layer.update.
+
+    Args:
+        tiers: Pairs of (max distance, interval in frames). Sprites further
+            away than every max distance use the last tier's interval.
+    """
+
+    def __init__(self, tiers: Sequence[tuple[float, int]]) -> None:
+        # compare squared distances so there's no square root per sprite
+        self.tiers = sorted((distance * distance, max(1, interval)) for distance, interval in tiers)
+        self.focus = Vec()
+        self.frame = 0
+
+    def begin_frame(self, focus: Vec) -> None:
+        """Move the focus point and start a new frame.
+
+        Args:
+            focus: The point that distances are measured from.
+        """
+        self.focus = focus
+        self.frame += 1
+
+    def interval(self, pos: Vec) -> int:
+        """Get how many frames apart a sprite at a position is updated."""
+        dx = pos.x - self.focus.x
+        dy = pos.y - self.focus.y
+        distance = dx * dx + dy * dy
+        for limit, interval in self.tiers:
+            if distance <= limit:
+                return interval
+        return self.tiers[-1][1]
+
+    def step(self, sprite: Sprite, dt: float) -> Optional[float]:
+        """Decide whether a sprite gets updated this frame.
+
+        Args:
+            sprite: The sprite about to be updated.
+            dt: The time since the last frame.
+
+        Returns:
+            The time to update the sprite with, or None if it should be
+            skipped this frame.
+        """
+        sprite.skipped_dt += dt
+        if (self.frame + hash(sprite)) % self.interval(sprite.pos):
+            return None
+        step, sprite.skipped_dt = sprite.skipped_dt, 0.0
+        return step
+
+__all__ = ["UpdateLOD"]
@@ -1,4 +1,4 @@
-from src.core.util import Resource, Image, Sound, Font, VertShader, FragShader
+from src.core.util import Resource, LoadMode, Image, Sound, Font, VertShader, FragShader
 
 def init_resources() -> None:
     Image("test", "test.png", scale=1)
@@ -6,6 +6,11 @@ def init_resources() -> None:
 
     VertShader("default", "default.vert")
     FragShader("default", "default.frag")
+    VertShader("sprite", "sprite.vert")
+    FragShader("sprite", "sprite.frag")
+    FragShader("world_border", "world_border.frag")
+    FragShader("terrain", "terrain.frag")
 
+    # only font18 is actually used right now, the rest load when first needed
     for i in range(1, 129):
-        Font(f"font{i}", "PixelTandysoft-0rJG.ttf", i)
+        Font(f"font{i}", "PixelTandysoft-0rJG.ttf", i, mode=LoadMode.EAGER if i == 18 else LoadMode.LAZY)
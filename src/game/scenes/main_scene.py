@@ -1,48 +1,90 @@
 from __future__ import annotations
 from src.core import *
 from src.game.sprites import *
-from collections import defaultdict
+from src.game.world import World
 class MainScene(Scene):
     _layers = [
-        LayerGroup.record().add(
+        # the terrain is blended by its shader, see TerrainBackground. Without
+        # it the fill in predraw shows through, which only gets uploaded again
+        # if it changes, see LayerGroup.upload
+        LayerGroup.record(frag="terrain", dirty_rects=True, uniforms=dict.fromkeys(TerrainBackground.UNIFORMS)).add(
             Layer.record("BACKGROUND"),
-            Layer.record("GROUND"),
-            Layer.record("DEFAULT"),
-            Layer.record("SKY"),
+        ),
+        LayerGroup.record().add(
+            Layer.record("GROUND", cull=True),
+            # entities are drawn on the gpu on top of the ground, last so that
+            # the group's surface is only uploaded once, see LayerGroup.draw
+            Layer.record("ENTITY", batched=True, cull=True),
+        ),
+        # spells only cover small parts of the screen, so only upload those
+        LayerGroup.record(dirty_rects=True).add(
+            Layer.record("DEFAULT", cull=True),
+        ),
+        # the border is drawn by its shader, so there's never anything to upload
+        LayerGroup.record(frag="world_border", dirty_rects=True, uniforms=dict.fromkeys(WorldBorder.UNIFORMS)).add(
+            Layer.record("BORDER"),
+        ),
+        # the sky and the hud barely change, so only upload the parts of them that do
+        LayerGroup.record(dirty_rects=True).add(
+            Layer.record("SKY", cull=True),
             Layer.record("HUD"),
-        )
+        ),
     ]
 
     def __init__(self, game: Game) -> None:
         super().__init__(game)
+        # entities, constructs and projectiles register themselves in here
+        self.spatial_hash = SpatialHash(64)
+        # who was touching which entities at the end of the last tick, see update_contacts
+        self.entity_contacts: dict[Entity, list[Entity]] = {}
+        self.construct_contacts: dict[Construct, list[Entity]] = {}
+        self.entity_pairs: list[tuple[Entity, Entity]] = []
+        # entities are simulated in here if it exists, see Entity.update_position
+        self.physics = PhysicsWorld(0.004, 6000) if BATCHED_PHYSICS else None
+        self.constructs: SpriteSet[Construct] = SpriteSet()
+        self.projectiles: SpriteSet[Projectile] = SpriteSet()
+        self.enemies: SpriteSet[Enemy] = SpriteSet()
+        # enemies and constructs off screen are updated every few frames instead
+        self.update_lod = UpdateLOD([(1200, 1), (2500, 4), (inf, 12)])
+        # terrain and decorations get streamed in around the player, see Player.update_surroundings
+        self.world = World(self, randrange(2 ** 32))
         self.player = Player(self)
         self.camera = Camera(self, self.player)
         self.border = WorldBorder(self)
         self.add(self.player)
         self.add(self.camera)
         self.add(self.border)
-        self.constructs: list[Construct] = []
-        self.projectiles: list[Projectile] = []
-        self.enemies: list[Enemy] = []
-        self.collideable_buckets = defaultdict(lambda: defaultdict(list))
-        self.BUCKET_GRID_SIZE = 64
 
         # self.add(TerrainBackground(self))
 
-    def predraw(self, screen: pygame.Surface) -> None:
-        screen.fill((120, 160, 80))
+    def update_contacts(self) -> None:
+        """Find every entity touching another entity or a construct in one
+        batched narrow phase over the spatial hash's candidate pairs.
 
-        self.collideable_buckets = defaultdict(lambda: defaultdict(list))
-        for construct in self.constructs:
-            key = self.spacial_hash_key(construct.pos)
-            self.collideable_buckets[key]["construct"].append(construct)
-        for projectile in self.projectiles:
-            key = self.spacial_hash_key(projectile.pos)
-            self.collideable_buckets[key]["projectile"].append(projectile)
-        for enemy in self.enemies:
-            key = self.spacial_hash_key(enemy.pos)
-            self.collideable_buckets[key]["entity"].append(enemy)
-        self.collideable_buckets[self.spacial_hash_key(self.player.pos)]["entity"].append(self.player)
+        Done once everything has moved, for the next tick to use. Sprites
+        killed in the meantime are still in there, see colliding_entities.
+        """
+        self.entity_contacts = {}
+        self.construct_contacts = {}
+        self.entity_pairs = []
+        for category, contacts in (("entity", self.entity_contacts), ("construct", self.construct_contacts)):
+            pairs = self.spatial_hash.pairs(category, "entity")
+            colliding = batch_is_colliding([(a.hitbox, b.hitbox) for a, b in pairs])
+            for (a, b), hit in zip(pairs, colliding):
+                if not hit: continue
+                contacts.setdefault(a, []).append(b)
+                if category == "entity":
+                    contacts.setdefault(b, []).append(a)
+                    self.entity_pairs.append((a, b))
 
-    def spacial_hash_key(self, pos: Vec) -> Vec:
-        return Vec(pos.x // self.BUCKET_GRID_SIZE, pos.y // self.BUCKET_GRID_SIZE)
+    def postupdate(self, dt: float) -> None:
+        if self.physics is not None:
+            # only the entities that actually moved need their hitbox and cell updated
+            for entity in self.physics.step(self.entity_pairs):
+                entity.hitbox.set_position(entity.pos)
+                entity.hitbox.set_rotation(entity.angle)
+                self.spatial_hash.update(entity)
+        self.update_contacts()
+
+    def predraw(self, screen: pygame.Surface) -> None:
+        screen.fill((120, 160, 80))
@@ -8,3 +8,18 @@ FIRE = (200, 100, 50)
 EARTH = (100, 60, 30)
 AIR = (200, 200, 200)
 WATER = (50, 100, 200)
+
+# frames per second to aim for, 0 for no limit, and while paused or unfocused
+FPS = 120
+IDLE_FPS = 15
+# wait for the screen when flipping, if the driver lets us
+VSYNC = True
+
+# how many times a second the simulation is stepped, whatever the frame rate
+TICK_RATE = 60
+# the most ticks a single frame may run to catch up, past that the game slows
+# down instead of spending ever longer catching up
+MAX_TICKS_PER_FRAME = 5
+
+# move every entity at once with numpy instead of one at a time
+BATCHED_PHYSICS = True
@@ -1,6 +1,8 @@
 from src.core import *
 
 class Camera(Sprite):
+    interpolated = True
+
     def __init__(self, scene: Scene, target: Sprite) -> None:
         super().__init__(scene, "DEFAULT")
         self.target = target
@@ -3,11 +3,13 @@ from src.core import *
 from .entity import Entity
 from abc import abstractmethod
 class Enemy(Entity):
+    # far away enemies don't need to chase the player every frame
+    throttled = True
+
     def __init__(self, scene: MainScene, hp: int, pos: Vec) -> None:
-        super().__init__(scene, hp, pygame.transform.rotate(Image.get("test"), 180), pos)
+        # the atlas hands every enemy the same flipped image
+        super().__init__(scene, hp, Image.atlas.variant(Image.get("test"), angle=180).surface, pos)
         self.scene = scene
-        self.scene.enemies.append(self)
-        self.killed = False
 
     def update(self, dt: float) -> None:
         self.update_movement(dt)
@@ -24,9 +26,16 @@ class Enemy(Entity):
     def update_attack(self, dt: float):
         pass
 
+    def on_add(self) -> None:
+        super().on_add()
+        self.scene.enemies.add(self)
+
+    def on_remove(self) -> None:
+        self.scene.enemies.discard(self)
+        super().on_remove()
+
     def kill(self):
         if not self.killed:
-            self.scene.enemies.remove(self)
             super().kill()
             self.killed = True
 
@@ -37,9 +46,9 @@ class Enemy(Entity):
         return self.scene.player.pos.distance_to(self.pos)
 
     def is_near_player(self) -> bool:
-        playerhash = self.scene.spacial_hash_key(self.scene.player.pos)
-        selfhash = self.scene.spacial_hash_key(self.pos)
-        if abs(playerhash.x - selfhash.x) <= 1 and abs(playerhash.y - selfhash.y) <= 1:
+        px, py = self.scene.spatial_hash.key(self.scene.player.pos)
+        sx, sy = self.scene.spatial_hash.key(self.pos)
+        if abs(px - sx) <= 1 and abs(py - sy) <= 1:
             return True
         return False
 
@@ -3,13 +3,16 @@ from src.core import *
 from pygame import Surface
 
 class Entity(Sprite):
+    interpolated = True
+
     def __init__(self, scene: MainScene, hp: int, image: Surface, pos: Vec) -> None:
-        super().__init__(scene, "DEFAULT")
+        super().__init__(scene, "ENTITY")
 
         self.scene = scene
 
         # combat
         self.hp = hp
+        self.killed = False
 
         # movement-related variables
         self.pos = pos
@@ -25,9 +28,26 @@ class Entity(Sprite):
         self.hitbox.set_size_rect(rect.width, rect.height)
         self.size = Vec(rect.width, rect.height)
         self.angle = 0
+        # multiplies the image's colors, done on the gpu when the layer is batched
+        self.tint: tuple[int, ...] = (255, 255, 255)
+
+    def on_add(self) -> None:
+        # only collidable and simulated once it's actually in the scene
+        self.scene.spatial_hash.insert(self, "entity")
+        if self.scene.physics is not None:
+            self.scene.physics.add(self)
 
+    def on_remove(self) -> None:
+        self.scene.spatial_hash.remove(self)
+        if self.scene.physics is not None:
+            self.scene.physics.remove(self)
 
     def update_position(self, dt: float) -> None:
+        # With batched physics the scene moves every entity at once after
+        # all of them have updated, see MainScene.postupdate
+        if self.scene.physics is not None:
+            self.scene.physics.move(self, dt)
+            return
         # All of vel, acc, ext_vel, etc. are measured in unit/s
         for entity in self.colliding_entities():
             entity.ext_acc += 6000 * Vec((entity.pos - self.pos)).normalize() * dt
@@ -40,6 +60,7 @@ class Entity(Sprite):
         self.ext_vel = Vec()
         self.hitbox.set_position(self.pos)
         self.hitbox.set_rotation(self.angle)
+        self.scene.spatial_hash.update(self)
 
     def take_damage(self, dmg: int) -> int:
         prev_hp = self.hp
@@ -47,33 +68,23 @@ class Entity(Sprite):
         return prev_hp - self.hp
 
     def draw(self, target: pygame.Surface) -> None:
-        target.blit(self.image, self.screen_pos - Vec(self.image.get_rect().size) / 2)
+        batch = self.batch
+        if batch is not None:
+            batch.draw(self.image, self.screen_pos, tint=self.tint)
+            return
+        target.blit(self.get_tinted_image(), self.screen_pos - Vec(self.image.get_rect().size) / 2)
 
-    def get_nearby_entities(self) -> list[Entity]:
-        cx, cy = self.scene.spacial_hash_key(self.pos)
-        nearby: list[Entity] = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                nearby.extend(self.scene.collideable_buckets.get(Vec(cx+dx, cy+dy), {}).get("entity", []))
-        return nearby
-
-    def colliding_entities(self) -> list[Entity]:
-        entities = []
-        # # the player
-        # if self != self.scene.player \
-        #    and self.scene.player.pos.distance_to(self.pos) < self.size.magnitude() + self.scene.player.size.magnitude() \
-        #    and self.hitbox.is_colliding(self.scene.player.hitbox):
-        #     entities.append(self.scene.player)
+    @property
+    def bounds(self) -> Optional[tuple[float, float, float, float]]:
+        w, h = self.size / 2
+        return (self.pos.x - w, self.pos.y - h, self.pos.x + w, self.pos.y + h)
 
-        self_rad = (self.size.x + self.size.y) / 2
+    def get_tinted_image(self) -> Surface:
+        if self.tint == (255, 255, 255):
+            return self.image
+        # the atlas only does the tinting once for everyone with this tint
+        return Image.atlas.variant(self.image, tint=self.tint).surface
 
-        def is_close(other: Entity) -> bool:
-            other_rad = (other.size.x + other.size.y) / 2
-            return other.pos.distance_squared_to(self.pos) < (self_rad + other_rad) ** 2
-
-        # enemies
-        for entity in self.get_nearby_entities():
-            if self != entity and is_close(entity) and self.hitbox.is_colliding(entity.hitbox):
-                entities.append(entity)
-
-        return entities
+    def colliding_entities(self) -> list[Entity]:
+        # worked out for every entity at once by the scene at the end of the last tick
+        return [entity for entity in self.scene.entity_contacts.get(self, ()) if not entity.killed]
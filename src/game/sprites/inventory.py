@@ -1,6 +1,7 @@
 from __future__ import annotations
 from src.core import *
-from typing import List
+from itertools import count
+import heapq
 
 class Inventory(Sprite):
     def __init__(self, scene: MainScene) -> None:
@@ -17,7 +18,11 @@ class Inventory(Sprite):
             "earth": 0,
             "fire": 0
         }
-        self.spent_elements: List[tuple[Timer, str, int]] = []
+        # spent elements waiting to come back as (deadline, order, elem, num), soonest first
+        self.refunds: list[tuple[float, int, str, int]] = []
+        self.refund_order = count()
+        # the scheduler wakes the inventory up when the soonest refund is due, it isn't polled
+        self.next_refund: Optional[ScheduledCall] = None
 
         # trying to simplify the draw() redundancy
         self.to_draw = [
@@ -28,11 +33,30 @@ class Inventory(Sprite):
         ]
 
     def update(self, dt: float) -> None:
-        for (timer, elem, num) in self.spent_elements:
-            if timer.done:
-                self.spent_elements.remove((timer, elem, num))
-                self.add(elem, num = num)
-                self.cooling[elem] -= num
+        pass
+
+    def refund(self) -> None:
+        """Give back every spent element whose cooldown is over, one batch per
+        element, then wait for the next one."""
+        self.next_refund = None
+        now = time()
+        refunded: dict[str, int] = {}
+        while self.refunds and self.refunds[0][0] <= now:
+            _, _, elem, num = heapq.heappop(self.refunds)
+            refunded[elem] = refunded.get(elem, 0) + num
+        for elem, num in refunded.items():
+            self.elements[elem] += num
+            self.cooling[elem] -= num
+        self.wake_for_refund()
+
+    def wake_for_refund(self) -> None:
+        # have the scheduler call refund when the soonest refund is due
+        if not self.refunds: return
+        deadline = self.refunds[0][0]
+        if self.next_refund is not None:
+            if self.next_refund.deadline <= deadline: return
+            self.next_refund.cancel()
+        self.next_refund = self.schedule(deadline - time(), self.refund)
 
     def draw(self, target: pygame.Surface) -> None:
         self.pos = Vec(300, target.get_height() - 100)
@@ -43,11 +67,11 @@ class Inventory(Sprite):
                 darker = [c/2 for c in color]
                 new_darker: tuple[int, int, int] = (int(darker[0]), int(darker[1]), int(darker[2]))
                 pygame.draw.rect(target, new_darker, pygame.Rect(self.pos + Vec(60 * i, 0), Vec(50)))
-                target.blit(Font.get("font18").render(str(self.cooling[elem]), False, (80, 80, 80)), (self.pos + (60 * i + 5, 45)))
+                TextCache.blit_glyphs(target, "font18", str(self.cooling[elem]), (80, 80, 80), self.pos + (60 * i + 5, 45))
             if self.elements[elem] > 0:
                 pygame.draw.rect(target, color, pygame.Rect(self.pos + Vec(60 * i, 0), Vec(50)))
-                target.blit(Font.get("font18").render(str(self.elements[elem]), False, (0, 0, 0)), (self.pos + (60 * i + 35, 45)))
-                target.blit(Font.get("font18").render(tag, False, (16, 16, 0)), (self.pos + (60 * i + 10, 15)))
+                TextCache.blit_glyphs(target, "font18", str(self.elements[elem]), (0, 0, 0), self.pos + (60 * i + 35, 45))
+                target.blit(TextCache.render("font18", tag, (16, 16, 0)), self.pos + (60 * i + 10, 15))
 
 
 
@@ -56,8 +80,9 @@ class Inventory(Sprite):
         if cooldown == 0:
             self.elements[elem] += num
         else:
-            self.spent_elements.append((Timer(cooldown), elem, num))
+            heapq.heappush(self.refunds, (time() + cooldown, next(self.refund_order), elem, num))
             self.cooling[elem] += num
+            self.wake_for_refund()
 
     def take(self, elem: str, num = 1) -> bool:
         """
@@ -34,12 +34,12 @@ class Player(Entity):
         self.update_surroundings()
 
     def draw(self, target: pygame.Surface) -> None:
-        target.blit(Font.get("font18").render(str(self.hp), False, (80, 80, 80)), (0, 0))
+        TextCache.blit_glyphs(target, "font18", str(self.hp), (80, 80, 80), (0, 0))
         super().draw(target)
 
 
     def update_keys(self, dt: float) -> None:
-        self.keys = pygame.key.get_pressed()
+        self.keys = self.game.keys
 
         # movement keys
         if self.keys[K_w] and self.keys[K_s]:
@@ -106,5 +106,5 @@ class Player(Entity):
                 self.scene.border.schedule_move_to(Vec(-1000, -1000), 50, 15, 10)
 
     def update_surroundings(self) -> None:
-        # something something about generating decorations im too lazy
-        pass
+        # the world generates the chunks around us in the background
+        self.scene.world.update(self.pos)
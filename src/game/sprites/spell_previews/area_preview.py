@@ -8,7 +8,7 @@ class AreaPreview(SpellPreview):
         self.rad = args[0] # fetching radius (probably the wrong way)
 
     def draw(self, target: pygame.Surface) -> None:
-        trans_surf = pygame.surface.Surface(Vec(self.rad * 2), pygame.SRCALPHA)
+        trans_surf = SurfacePool.get(Vec(self.rad * 2))
         pygame.draw.circle(trans_surf, (120, 120, 120, 100), Vec(self.rad), self.rad)
         self.pos = self.game.mouse_pos + self.scene.camera.pos
         target.blit(trans_surf, self.screen_pos - (self.rad, self.rad))
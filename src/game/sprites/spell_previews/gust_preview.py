@@ -10,25 +10,31 @@ class GustPreview(SpellPreview):
         self.hitbox = Hitbox(Vec(100000), []) # send this so far away... to avoid that ONE frame of ugliness
         self.hitbox.set_size_rect(self.size.x, self.size.y)
         self.hitbox.translate(Vec(0, self.size.y / 2))
+        self.image = pygame.surface.Surface(self.size, pygame.SRCALPHA)
+        pygame.draw.rect(self.image, (120, 120, 120, 100), self.image.get_rect())
+        self.rotations = RotationCache(max_entries=360)
+        self.aim()
+
+    def aim(self) -> None:
+        # aimed in update rather than draw so it also works when nothing is drawn
+        mpos = self.game.mouse_pos
+        player = self.scene.player
+        self.angle = atan2((mpos.y - player.screen_pos.y), (mpos.x - player.screen_pos.x)) # in radians
 
     def update(self, dt: float) -> None:
+        self.aim()
         self.pos = self.scene.player.pos
         self.hitbox.set_rotation(self.angle - pi/2, False)
         self.hitbox.set_position(self.pos)
         super().update(dt)
 
     def draw(self, target: pygame.Surface) -> None:
-        mpos = self.game.mouse_pos
         player = self.scene.player
-        self.angle = atan2((mpos.y - player.screen_pos.y), (mpos.x - player.screen_pos.x)) # in radians
         flipped_angle = self.angle + pi
         pygame.draw.line(target, (120, 120, 120), player.screen_pos, player.screen_pos + Vec(0, self.push).rotate(-90 + degrees(flipped_angle)), 5)
         rotangle = -degrees(self.angle) + 90
-        origimg = pygame.surface.Surface(self.size, pygame.SRCALPHA)
-        origimg.set_colorkey((0, 0, 0))
-        pygame.draw.rect(origimg, (120, 120, 120, 100), origimg.get_rect())
-        rotimg = pygame.transform.rotate(origimg, rotangle)
-        target.blit(rotimg, player.screen_pos + self.size.y / 2 * Vec(1, 0).rotate(degrees(self.angle)) - Vec(rotimg.size) / 2)
+        rotimg, rotsize = self.rotations.get(self.image, rotangle)
+        target.blit(rotimg, player.screen_pos + self.size.y / 2 * Vec(1, 0).rotate(degrees(self.angle)) - rotsize / 2)
         # hitbox debugging
         if Debug.on():
             pygame.draw.polygon(target, (255, 0, 0), [Vec(p) - self.scene.player.pos + self.scene.player.screen_pos for p in self.hitbox.get_hitbox()], 2)
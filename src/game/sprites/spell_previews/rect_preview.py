@@ -6,16 +6,26 @@ class RectPreview(SpellPreview):
     def __init__(self, scene: MainScene, spell: Callable, cooldown: float, args: list) -> None:
         super().__init__(scene, spell, cooldown, args)
         self.rect: Vec = args[0]
+        self.image = pygame.surface.Surface(self.rect)
+        self.image.set_colorkey((0, 0, 0))
+        pygame.draw.rect(self.image, (120, 120, 120), self.image.get_rect())
+        self.rotations = RotationCache(max_entries=360)
+        self.aim()
 
-    def draw(self, target: pygame.Surface) -> None:
+    def aim(self) -> None:
+        # aimed in update rather than draw so it also works when nothing is drawn
         mpos = self.game.mouse_pos
         player = self.scene.player
         self.angle = 90 - degrees(atan2((mpos.y - player.screen_pos.y), (mpos.x - player.screen_pos.x)))
-        origimg = pygame.surface.Surface(self.rect)
-        origimg.set_colorkey((0, 0, 0))
-        pygame.draw.rect(origimg, (120, 120, 120), origimg.get_rect())
-        rotimg = pygame.transform.rotate(origimg, self.angle)
-        target.blit(rotimg, mpos - Vec(rotimg.size) / 2)
+
+    def update(self, dt: float) -> None:
+        self.aim()
+        super().update(dt)
+
+    def draw(self, target: pygame.Surface) -> None:
+        mpos = self.game.mouse_pos
+        rotimg, rotsize = self.rotations.get(self.image, self.angle)
+        target.blit(rotimg, mpos - rotsize / 2)
 
     def trigger_spell(self) -> None:
         self.args.append(self.angle)
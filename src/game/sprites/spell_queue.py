@@ -109,7 +109,7 @@ class SpellQueue(Sprite):
 
     def draw(self, target: pygame.Surface) -> None:
         self.pos = Vec(200, target.get_height() - 180)
-        trans_surf = pygame.surface.Surface((target.get_width() - 400, 70), pygame.SRCALPHA)
+        trans_surf = SurfacePool.get((target.get_width() - 400, 70))
         pygame.draw.rect(trans_surf, (120, 120, 120, 100), pygame.Rect((0, 0), (target.get_width() - 400, 70)))
         for i in range(len(self.queue)):
             draw_pos = Vec(10 + 60 * i, 10)
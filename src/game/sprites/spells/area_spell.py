@@ -12,6 +12,19 @@ class AreaSpell(Spell):
         self.rad = radius
         self.pos = target_posdiff + self.scene.player.pos
 
+    def reset_area(self, target_posdiff: Vec, charge_time: float, elem: str, lifespan: float, radius: int) -> None:
+        # for pooled area spells, the parts of __init__ that need redoing
+        self.reset_spell(charge_time, elem)
+        self.lifespan.reset(lifespan)
+        self.rad = radius
+        self.pos = target_posdiff + self.scene.player.pos
+
+    @property
+    def bounds(self) -> Optional[tuple[float, float, float, float]]:
+        # whirlpools and steam draw their little circles a bit past the radius
+        reach = self.rad * 1.5
+        return (self.pos.x - reach, self.pos.y - reach, self.pos.x + reach, self.pos.y + reach)
+
     def update_charge(self, dt: float) -> None:
         pass
 
@@ -5,6 +5,9 @@ from src.core import *
 from .spell import Spell
 from ..entity import Entity
 class Construct(Spell):
+    # far away constructs are updated less often by the scene's UpdateLOD
+    throttled = True
+
     def __init__(self, scene: MainScene, charge_time: float, lifespan: float, hp: int) -> None:
         """
         Notes: \n
@@ -12,24 +15,24 @@ class Construct(Spell):
         An hp amount of -1 makes it indestructible
         """
         super().__init__(scene, charge_time, "earth")
-        self.lifespan = Timer(lifespan)
         self.endless = False
         if lifespan == -1: self.endless = True
+        else: self.schedule(lifespan, self.kill)
         self.hp = hp
         self.pos: Vec
         self.angle: float
-        self.scene.constructs.append(self)
         self.hitbox: Hitbox
 
+    def update(self, dt: float) -> None:
+        super().update(dt)
+        self.scene.spatial_hash.update(self)
+
     def update_charge(self, dt: float) -> None:
         pass
 
     def update_spell(self, dt: float) -> None:
         if len((entities := self.colliding_entities())) > 0:
             self.collide(entities, dt)
-        if not self.endless and self.lifespan.done:
-            self.kill()
-            return
         if self.hp == 0:
             self.kill()
         # if self.size == Vec(): Log.warn(f"This Construct ({self}) has no size and is likely causing lag")
@@ -51,34 +54,19 @@ class Construct(Spell):
         self.hp = max(self.hp - dmg, 0)
         return prev_hp - self.hp
 
-    def kill(self) -> None:
-        if not self.killed:
-            self.scene.constructs.remove(self)
-        super().kill()
+    @property
+    def bounds(self) -> Optional[tuple[float, float, float, float]]:
+        return self.hitbox.bounds
 
-    def get_nearby_entities(self) -> list[Entity]:
-        cx, cy = self.scene.spacial_hash_key(self.pos)
-        buckets = self.scene.collideable_buckets
-        nearby: list[Entity] = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                nearby.extend(buckets.get(Vec(cx+dx, cy+dy), {}).get("entity", []))
-        return nearby
+    def on_add(self) -> None:
+        # only collidable once it's actually in the scene
+        self.scene.constructs.add(self)
+        self.scene.spatial_hash.insert(self, "construct")
 
-    def colliding_entities(self) -> list[Entity]:
-        entities = []
-        if self.pos.distance_to(self.scene.player.pos) > 1500: return entities
-        self_rad = (self.size.x + self.size.y) / 2
-
-        def is_close(other: Entity) -> bool:
-            other_rad = (other.size.x + other.size.y) / 2
-            return other.pos.distance_squared_to(self.pos) < (self_rad + other_rad) ** 2
-        # # the player
-        # if is_close(self.scene.player) and self.hitbox.is_colliding(self.scene.player.hitbox):
-        #     entities.append(self.scene.player)
-        # enemies
-        for enemy in self.get_nearby_entities():
-         if is_close(enemy) and self.hitbox.is_colliding(enemy.hitbox):
-            entities.append(enemy)
+    def on_remove(self) -> None:
+        self.scene.constructs.discard(self)
+        self.scene.spatial_hash.remove(self)
 
-        return entities
+    def colliding_entities(self) -> list[Entity]:
+        # worked out for every construct at once by the scene at the end of the last tick
+        return [entity for entity in self.scene.construct_contacts.get(self, ()) if not entity.killed]
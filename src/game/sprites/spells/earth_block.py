@@ -14,6 +14,20 @@ class EarthBlock(Construct):
         self.angle = angle
         self.pos = self.scene.player.pos + target_posdiff
         self.original_size = size
+        # the block only ever shows up at one angle, in one of two states
+        self.image = self.create_image(False)
+        self.damaged_image = self.create_image(True)
+        self.rotations = RotationCache(max_entries=2)
+        _, self.size = self.rotations.get(self.image, self.angle)
+
+    def create_image(self, damaged: bool) -> Surface:
+        image = pygame.surface.Surface(self.original_size)
+        image.set_colorkey((0, 0, 0))
+        pygame.draw.rect(image, EARTH, image.get_rect())
+        if damaged:
+            pygame.draw.line(image, (40, 20, 10), (10, 0), (40, 40))
+            pygame.draw.line(image, (40, 20, 10), (30, 0), (10, 40))
+        return image
 
     def draw_charge(self, screen: Surface) -> None:
         self.draw_spell(screen)
@@ -26,20 +40,22 @@ class EarthBlock(Construct):
 
     def draw_spell(self, screen: Surface) -> None:
         # more rectangle rotating
-        origimg = pygame.surface.Surface(self.original_size)
-        origimg.set_colorkey((0, 0, 0))
-        pygame.draw.rect(origimg, EARTH, origimg.get_rect())
-        if self.extra_damaged:
-            pygame.draw.line(origimg, (40, 20, 10), (10, 0), (40, 40))
-            pygame.draw.line(origimg, (40, 20, 10), (30, 0), (10, 40))
-        rotimg = pygame.transform.rotate(origimg, self.angle)
-        if self.size == Vec(): # init size for the first time
-            self.size = Vec(rotimg.get_rect().size)
+        image = self.damaged_image if self.extra_damaged else self.image
+        rotimg, _ = self.rotations.get(image, self.angle)
         screen.blit(rotimg, self.screen_pos - self.size / 2)
         # hitbox debugging
         if Debug.on():
             pygame.draw.polygon(screen, (255, 0, 0), [Vec(p) - self.scene.player.pos + self.scene.player.screen_pos for p in self.hitbox.get_hitbox()], 2)
 
+    @property
+    def bounds(self) -> Optional[tuple[float, float, float, float]]:
+        # the hitbox only catches up with pos once triggered, and while charging
+        # particles fly in from up to 100 units away
+        w, h = self.size / 2
+        if not self.charging_time.done:
+            w, h = w + 110, h + 110
+        return (self.pos.x - w, self.pos.y - h, self.pos.x + w, self.pos.y + h)
+
     def trigger_spell(self) -> None:
         self.hitbox.set_rotation(self.angle)
         self.hitbox.set_position(self.pos)
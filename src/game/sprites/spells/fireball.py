@@ -10,9 +10,14 @@ if TYPE_CHECKING:
     from ..enemy import Enemy
     from ..player import Player
 class Fireball(Projectile):
+    pool_size = 16
+
     def __init__(self, scene: MainScene, target_posdiff: Vec, origin: str) -> None:
         super().__init__(scene, target_posdiff, 10, 800, 0.5, 10, "fire", 10, origin)
 
+    def reset(self, target_posdiff: Vec, origin: str) -> None:
+        self.reset_projectile(target_posdiff, 10, 800, 0.5, 10, "fire", 10, origin)
+
     def draw_charge(self, screen: Surface) -> None:
         pygame.draw.circle(screen, FIRE, self.screen_pos, self.rad * self.charging_time.progress)
 
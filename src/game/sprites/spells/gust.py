@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..enemy import Enemy
 class Gust(Spell):
+    pool_size = 8
+
     def __init__(self, scene: MainScene, target_posdiff: Vec, origin: str, size: Vec, push: float, angle: float, hitbox: Hitbox) -> None:
         super().__init__(scene, 0, "air")
         self.angle = angle
@@ -17,6 +19,15 @@ class Gust(Spell):
         self.pos = self.scene.player.pos
         self.anim_timer = Timer(0.3)
 
+    def reset(self, target_posdiff: Vec, origin: str, size: Vec, push: float, angle: float, hitbox: Hitbox) -> None:
+        self.reset_spell(0, "air")
+        self.angle = angle
+        self.hitbox = hitbox
+        self.size = size
+        self.push = push
+        self.pos = self.scene.player.pos
+        self.anim_timer.reset()
+
     def draw_charge(self, screen: Surface) -> None:
         pass
     def update_charge(self, dt: float) -> None:
@@ -34,12 +45,17 @@ class Gust(Spell):
         pygame.draw.circle(screen, AIR, screen_pos, 10)
 
     def trigger_spell(self) -> None:
-        for projectile in self.scene.projectiles:
+        # the gust blows out of the player along its angle
+        spatial_hash = self.scene.spatial_hash
+        start = self.pos
+        end = self.pos + self.size.y * Vec(cos(self.angle), sin(self.angle))
+        for projectile in spatial_hash.query_segment(start, end, "projectile", self.size.x / 2):
             if projectile.element != "air" and projectile.pos.distance_to(self.pos) < projectile.rad + self.size.magnitude() \
             and self.hitbox.is_colliding(projectile.hitbox):
                 change = (800 * 10 / projectile.rad) * Vec(1, 0).rotate(degrees(self.angle))
                 projectile.external_acc += change
-        for enemy in self.scene.enemies:
+        for enemy in spatial_hash.query_segment(start, end, "entity", self.size.x / 2):
+            if enemy is self.scene.player: continue
             if enemy.pos.distance_to(self.pos) < self.size.magnitude() + enemy.size.magnitude() \
             and self.hitbox.is_colliding(enemy.hitbox):
                 change = (800 * 70 / enemy.size.magnitude()) * Vec(1, 0).rotate(degrees(self.angle))
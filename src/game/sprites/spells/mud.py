@@ -8,7 +8,7 @@ class Mud(AreaSpell):
         super().__init__(scene, target_posdiff, 1, "earth", 20, rad, "GROUND")
 
     def draw_charge(self, screen: Surface) -> None:
-        trans_surf = pygame.surface.Surface(Vec(2 * self.rad), pygame.SRCALPHA)
+        trans_surf = SurfacePool.get(Vec(2 * self.rad))
         pygame.draw.circle(trans_surf, EARTH, Vec(self.rad), self.rad)
         trans_surf.set_alpha(int(255 * self.charging_time.progress))
         screen.blit(trans_surf, self.screen_pos - Vec(self.rad))
@@ -17,9 +17,11 @@ class Mud(AreaSpell):
         pygame.draw.circle(screen, EARTH, self.screen_pos, self.rad)
 
     def update_spell(self, dt: float) -> None:
-        if self.scene.player.pos.distance_to(self.pos) < self.rad:
-            self.scene.player.vel *= 0.0000004 ** dt
-        for enemy in self.scene.enemies:
+        player = self.scene.player
+        if player.pos.distance_to(self.pos) < self.rad:
+            player.vel *= 0.0000004 ** dt
+        for enemy in self.scene.spatial_hash.query_radius(self.pos, self.rad, "entity"):
+            if enemy is player: continue
             if enemy.pos.distance_to(self.pos) < self.rad:
                 enemy.vel *= 0.0000004 ** dt
         super().update_spell(dt)
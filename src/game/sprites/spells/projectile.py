@@ -11,6 +11,8 @@ if TYPE_CHECKING:
     from ..player import Player
     from ..entity import Entity
 class Projectile(Spell):
+    interpolated = True
+
     def __init__(self,
                  scene: MainScene,
                  target_posdiff: Vec,
@@ -23,51 +25,62 @@ class Projectile(Spell):
                  origin: str,
                  max_damage_per_target: int = 9999) -> None:
         super().__init__(scene, charge_time, elem)
+        self.hitbox = Hitbox(self.pos, [])
+        self.ignore_elem = []
+        self.reset_projectile(target_posdiff, lifespan, speed, charge_time, dmg, elem, radius, origin, max_damage_per_target)
+
+    def reset_projectile(self,
+                         target_posdiff: Vec,
+                         lifespan: float,
+                         speed: float,
+                         charge_time: float,
+                         dmg: int,
+                         elem: str,
+                         radius: int,
+                         origin: str,
+                         max_damage_per_target: int = 9999) -> None:
+        # everything a new projectile starts with, redone when a pooled one is reused
+        self.reset_spell(charge_time, elem)
         self.vel = target_posdiff.normalize() * speed
         self.external_acc = Vec()
         self.pos = self.scene.player.pos.copy()
         self.speed = speed
-        self.lifespan = Timer(lifespan)
+        # the scene kills the projectile once its lifespan is up instead of it checking every frame
+        self.expired = False
+        self.schedule(lifespan, self.expire)
         self.rad = radius
         self.damage = dmg
-        self.hitbox = Hitbox(self.pos, [])
+        self.hitbox.set_position(self.pos)
         self.hitbox.set_size_rad(radius)
         self.origin = origin
         self.max_dmg_per_target = max_damage_per_target
-        self.ignore_elem = []
-        self.scene.projectiles.append(self)
+        self.ignore_elem.clear()
 
-    def kill(self) -> None:
-        if not self.killed:
-            self.scene.projectiles.remove(self)
-        super().kill()
+    def update(self, dt: float) -> None:
+        super().update(dt)
+        self.scene.spatial_hash.update(self)
 
-    def update_charge(self, dt: float) -> None:
-        pass
+    @property
+    def bounds(self) -> Optional[tuple[float, float, float, float]]:
+        # a bit of extra room for anything drawn around the ball itself
+        reach = self.rad + 10
+        return (self.pos.x - reach, self.pos.y - reach, self.pos.x + reach, self.pos.y + reach)
+
+    def on_add(self) -> None:
+        # only collidable once it's actually in the scene
+        self.scene.projectiles.add(self)
+        self.scene.spatial_hash.insert(self, "projectile")
 
-    def get_nearby_entities(self) -> list[Entity]:
-        cx, cy = self.scene.spacial_hash_key(self.pos)
-        nearby: list[Entity] = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                nearby.extend(self.scene.collideable_buckets.get(Vec(cx+dx, cy+dy), {}).get("entity", []))
-        return nearby
+    def on_remove(self) -> None:
+        self.scene.projectiles.discard(self)
+        self.scene.spatial_hash.remove(self)
 
-    def get_nearby_constructs(self) -> list[Construct]:
-        cx, cy = self.scene.spacial_hash_key(self.pos)
-        nearby: list[Construct] = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                nearby.extend(self.scene.collideable_buckets.get(Vec(cx+dx, cy+dy), {}).get("construct", []))
-        return nearby
+    def expire(self) -> None:
+        self.expired = True
+        self.kill()
 
-    def get_nearby_projectiles(self) -> list[Projectile]:
-        cx, cy = self.scene.spacial_hash_key(self.pos)
-        nearby: list[Projectile] = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                nearby.extend(self.scene.collideable_buckets.get(Vec(cx+dx, cy+dy), {}).get("projectile", []))
-        return nearby
+    def update_charge(self, dt: float) -> None:
+        pass
 
     def update_spell(self, dt: float) -> None:
         self.vel += self.external_acc
@@ -76,22 +89,23 @@ class Projectile(Spell):
 
         self.hitbox.set_position(self.pos)
 
-        if self.lifespan.done:
-            self.kill()
+        # waterballs are still exploding, but don't collide anymore
+        if self.expired:
             return
         # collision with anything collidable
-        for construct in self.get_nearby_constructs():
+        spatial_hash = self.scene.spatial_hash
+        for construct in spatial_hash.query_radius(self.pos, self.rad, "construct"):
             if self.pos.distance_to(construct.pos) < self.rad + construct.size.magnitude() \
                and self.hitbox.is_colliding(construct.hitbox):
                 self.collide(construct)
-        for projectile in self.get_nearby_projectiles():
+        for projectile in spatial_hash.query_radius(self.pos, self.rad, "projectile"):
             if self.pos.distance_to(projectile.pos) < self.rad + projectile.rad \
                and projectile.element not in self.ignore_elem \
                and projectile != self and self.hitbox.is_colliding(projectile.hitbox):
                 self.collide(projectile)
         from ..enemy import Enemy
         if self.origin != "enemy":
-            for enemy in self.get_nearby_entities():
+            for enemy in spatial_hash.query_radius(self.pos, self.rad, "entity"):
                 if isinstance(enemy, Enemy):
                     if self.pos.distance_to(enemy.pos) < self.rad + enemy.size.magnitude() \
                     and self.hitbox.is_colliding(enemy.hitbox):
@@ -4,10 +4,14 @@ from pygame import Surface
 from src.core import *
 from .construct import Construct
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 if TYPE_CHECKING:
     from ..entity import Entity
 class Rollout(Construct):
+    # every rollout looks the same, so they all share one image and its rotations
+    image: ClassVar[Optional[Surface]] = None
+    rotations: ClassVar[RotationCache] = RotationCache()
+
     def __init__(self, scene: MainScene, target_posdiff: Vec, origin: str) -> None:
         super().__init__(scene, 2, 4, 20)
         self.copy_timer = LoopTimer(0.2, -1)
@@ -26,12 +30,21 @@ class Rollout(Construct):
 
     def draw_charge(self, screen: Surface) -> None:
         # pygame.draw.line(screen, (120, 120, 120), self.scene.player.screen_pos, self.game.mouse_pos, 3)
+        self.draw_rect(screen)
+
+    def draw_rect(self, screen: Surface) -> None:
+        batch = self.batch
+        if batch is not None:
+            # the gpu can rotate it for us, same angle as the rotate below but clockwise
+            batch.draw_rect(self.screen_pos, Vec(30, 10), EARTH, self.angle - pi/2)
+            self.size = Vec(abs(30 * sin(self.angle)) + abs(10 * cos(self.angle)), abs(30 * cos(self.angle)) + abs(10 * sin(self.angle)))
+            return
         # more rectangle rotating
-        origimg = pygame.surface.Surface((30, 10))
-        origimg.set_colorkey((0, 0, 0))
-        pygame.draw.rect(origimg, EARTH, origimg.get_rect())
-        rotimg = pygame.transform.rotate(origimg, 90 - degrees(self.angle))
-        self.size = Vec(rotimg.get_rect().size)
+        if Rollout.image is None:
+            Rollout.image = pygame.surface.Surface((30, 10))
+            Rollout.image.set_colorkey((0, 0, 0))
+            pygame.draw.rect(Rollout.image, EARTH, Rollout.image.get_rect())
+        rotimg, self.size = Rollout.rotations.get(Rollout.image, 90 - degrees(self.angle))
         screen.blit(rotimg, self.screen_pos - self.size / 2)
 
     def update_charge(self, dt: float) -> None:
@@ -58,13 +71,7 @@ class Rollout(Construct):
 
 
     def draw_spell(self, screen: Surface) -> None:
-        # even more rectangle rotating
-        origimg = pygame.surface.Surface((30, 10))
-        origimg.set_colorkey((0, 0, 0))
-        pygame.draw.rect(origimg, EARTH, origimg.get_rect())
-        rotimg = pygame.transform.rotate(origimg, 90 - degrees(self.angle))
-        self.size = Vec(rotimg.get_rect().size)
-        screen.blit(rotimg, self.screen_pos - self.size / 2)
+        self.draw_rect(screen)
         # hitbox debugging
         if Debug.on():
             pygame.draw.polygon(screen, (255, 0, 0), [Vec(p) - self.scene.player.pos + self.scene.player.screen_pos for p in self.hitbox.get_hitbox()], 2)
@@ -12,6 +12,12 @@ class Spell(Sprite):
         self.element = elem
         self.killed = False
 
+    def reset_spell(self, charge_time: float, elem: str) -> None:
+        # for pooled spells, the parts of __init__ that need redoing
+        self.charging_time.reset(charge_time)
+        self.element = elem
+        self.killed = False
+
     def update(self, dt: float) -> None:
         if self.killed:
             return
@@ -23,7 +29,6 @@ class Spell(Sprite):
     def draw(self, target: pygame.Surface) -> None:
         if not self.charging_time.done:
             self.draw_charge(target)
-        if self.pos.distance_to(self.scene.player.pos) > 800: return
         if self.charging_time.done:
             self.draw_spell(target)
 
@@ -9,7 +9,7 @@ class Steam(AreaSpell):
     def __init__(self, scene: MainScene, target_posdiff: Vec, origin: str, rad: int) -> None:
         super().__init__(scene, target_posdiff, 0, "water", 20, rad, "SKY")
         self.circle_offsets: list[Vec] = []
-        self.new_circle = LoopTimer(0.1)
+        self.schedule(0.1, self.new_circle, 0.1)
 
     def draw_charge(self, screen: Surface) -> None:
         pass
@@ -24,10 +24,9 @@ class Steam(AreaSpell):
         scalar = uniform(0, self.rad)
         return scalar * Vec(cos(angle), sin(angle))
 
-    def update_spell(self, dt: float) -> None:
-        if self.new_circle.done:
+    def new_circle(self) -> None:
+        if self.charging_time.done:
             self.circle_offsets.append(self.random_circle_point())
-        super().update_spell(dt)
 
     def trigger_spell(self) -> None:
         for _ in range(10):
@@ -9,6 +9,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..enemy import Enemy
 class StoneCannon(Projectile):
+    # every cast fires five of these
+    pool_size = 32
+
     def __init__(self, scene: MainScene, target_posdiff: Vec, origin: str) -> None:
         super().__init__(scene, target_posdiff, 10, 700, 0, 5, "earth", 8, origin)
         self.iframe = Timer(0.75)
@@ -18,6 +21,15 @@ class StoneCannon(Projectile):
         self.target_posdiff = target_posdiff
         self.is_original = True
 
+    def reset(self, target_posdiff: Vec, origin: str) -> None:
+        self.reset_projectile(target_posdiff, 10, 700, 0, 5, "earth", 8, origin)
+        self.iframe.reset()
+        self.angle = 0
+        self.turn_speed = 2
+        self.target_pos = Vec()
+        self.target_posdiff = target_posdiff
+        self.is_original = True
+
     def draw_charge(self, screen: Surface) -> None:
         pass
     def update_charge(self, dt: float) -> None:
@@ -55,7 +67,7 @@ class StoneCannon(Projectile):
     def trigger_spell(self) -> None:
         if self.is_original:
             for _ in range(4):
-                spell = StoneCannon(self.scene, self.target_posdiff, self.origin)
+                spell = StoneCannon.acquire(self.scene, self.target_posdiff, self.origin)
                 self.scene.add(spell)
                 spell.is_original = False
                 spell.trigger_spell()
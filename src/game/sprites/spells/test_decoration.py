@@ -12,6 +12,11 @@ class TestDecoration(Construct):
         self.hitbox.set_size_rad(20)
         self.size = Vec(20)
 
+    @property
+    def bounds(self) -> Optional[tuple[float, float, float, float]]:
+        # the circle reaches a bit further than the hexagon of the hitbox
+        return (self.pos.x - 20, self.pos.y - 20, self.pos.x + 20, self.pos.y + 20)
+
     def draw_spell(self, screen: pygame.Surface) -> None:
         pygame.draw.circle(screen, tuple(map(sum, zip((150, 50, 50), (-6*self.hp, 2*self.hp, 2*self.hp)))), self.screen_pos, 20)
 
@@ -12,18 +12,18 @@ class WallOfFire(AreaSpell):
         super().__init__(scene, target_posdiff, 9999, "fire", 15, rad, "GROUND")
         self.is_original = True
         self.wall_segments = 20
-        self.prev_pos = Vec()
-        self.damage_timer = LoopTimer(0.05)
+        self.last_segment_pos = Vec()
         self.original_wall = self
+        self.schedule(0.05, self.burn, 0.05)
 
     def draw_charge(self, screen: Surface) -> None:
         if self.is_original:
-            trans_surf = pygame.surface.Surface(Vec(self.rad * 2), pygame.SRCALPHA)
+            trans_surf = SurfacePool.get(Vec(self.rad * 2))
             pygame.draw.circle(trans_surf, FIRE + (100,), Vec(self.rad), self.rad)
             self.pos = self.game.mouse_pos + self.scene.camera.pos
             screen.blit(trans_surf, self.screen_pos - Vec(self.rad))
         else:
-            trans_surf = pygame.surface.Surface(Vec(2 * self.rad), pygame.SRCALPHA)
+            trans_surf = SurfacePool.get(Vec(2 * self.rad))
             pygame.draw.circle(trans_surf, FIRE, Vec(self.rad), self.rad)
             trans_surf.set_alpha(184)
             screen.blit(trans_surf, self.screen_pos - Vec(self.rad))
@@ -43,15 +43,15 @@ class WallOfFire(AreaSpell):
                 spell.is_original = False
                 spell.original_wall = self
                 self.wall_segments -= 1
-                self.prev_pos = self.pos
+                self.last_segment_pos = self.pos
                 return
 
-            diff = self.pos - self.prev_pos
+            diff = self.pos - self.last_segment_pos
 
             # on subsequent walls
             while diff.magnitude() > self.rad:
-                self.prev_pos += diff.normalize() * self.rad
-                diff = self.pos - self.prev_pos
+                self.last_segment_pos += diff.normalize() * self.rad
+                diff = self.pos - self.last_segment_pos
                 temp_pos = self.pos - diff
                 spell = WallOfFire(self.scene, Vec(), "", self.rad)
                 self.scene.add(spell)
@@ -65,17 +65,17 @@ class WallOfFire(AreaSpell):
         # fire particles?
 
     # TODO: should probably also make player take damage?
-    def update_spell(self, dt: float) -> None:
+    def burn(self) -> None:
         # reduces damage of all projectiles coming into contact
         # should it buff "fire" type projectiles?
-        if self.damage_timer.done:
-            for proj in self.scene.projectiles:
-                if proj.pos.distance_to(self.pos) <= proj.rad + self.rad:
-                    proj.take_damage(1)
-            for enemy in self.scene.enemies:
-                if enemy.pos.distance_to(self.pos) <= enemy.size.magnitude()/2 + self.rad:
-                    enemy.take_damage(1)
-            player = self.scene.player
-            if player.pos.distance_to(self.pos) <= player.size.magnitude()/2 + self.rad:
-                player.take_damage(1)
-        super().update_spell(dt)
+        if self.killed or not self.charging_time.done: return
+        player = self.scene.player
+        for proj in self.scene.spatial_hash.query_radius(self.pos, self.rad, "projectile"):
+            if proj.pos.distance_to(self.pos) <= proj.rad + self.rad:
+                proj.take_damage(1)
+        for enemy in self.scene.spatial_hash.query_radius(self.pos, self.rad, "entity"):
+            if enemy is player: continue
+            if enemy.pos.distance_to(self.pos) <= enemy.size.magnitude()/2 + self.rad:
+                enemy.take_damage(1)
+        if player.pos.distance_to(self.pos) <= player.size.magnitude()/2 + self.rad:
+            player.take_damage(1)
@@ -7,11 +7,20 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..enemy import Enemy
 class Waterball(Projectile):
+    # waterball enemies keep firing these, so reuse the dead ones
+    pool_size = 64
+
     def __init__(self, scene: MainScene, target_posdiff: Vec, origin: str) -> None:
         super().__init__(scene, target_posdiff, 5, 400, 1.5, 10, "water", 20, origin)
         self.exploding = False
         self.exploding_timer = Timer(0.1)
 
+    def reset(self, target_posdiff: Vec, origin: str) -> None:
+        # this also shrinks rad and the hitbox back from the explosion
+        self.reset_projectile(target_posdiff, 5, 400, 1.5, 10, "water", 20, origin)
+        self.exploding = False
+        self.exploding_timer.reset()
+
     def draw_charge(self, screen: Surface) -> None:
         pygame.draw.circle(screen, WATER, self.screen_pos, self.rad * self.charging_time.progress)
 
@@ -22,16 +31,18 @@ class Waterball(Projectile):
             if self.exploding_timer.done:
                 # testing an exploding mechanic
                 self.hitbox.set_size_rad(200)
-                for construct in self.get_nearby_constructs():
+                spatial_hash = self.scene.spatial_hash
+                for construct in spatial_hash.query_radius(self.pos, self.rad, "construct"):
                     if self.pos.distance_to(construct.pos) < self.rad + construct.size.magnitude() \
                        and self.hitbox.is_colliding(construct.hitbox):
                         construct.take_damage(10)
-                for projectile in self.get_nearby_projectiles():
+                for projectile in spatial_hash.query_radius(self.pos, self.rad, "projectile"):
                     if self.pos.distance_to(projectile.pos) < self.rad + projectile.rad \
                        and projectile.element != self.element and self.hitbox.is_colliding(projectile.hitbox):
                         projectile.take_damage(10)
+                from ..enemy import Enemy
                 if self.origin != "enemy":
-                    for enemy in self.get_nearby_entities():
+                    for enemy in spatial_hash.query_radius(self.pos, self.rad, "entity"):
                         if isinstance(enemy, Enemy):
                             if self.pos.distance_to(enemy.pos) < self.rad + enemy.size.magnitude() \
                             and self.hitbox.is_colliding(enemy.hitbox):
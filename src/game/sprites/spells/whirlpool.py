@@ -11,17 +11,17 @@ class Whirlpool(AreaSpell):
     def __init__(self, scene: MainScene, target_posdiff: Vec, origin: str, rad: int) -> None:
         super().__init__(scene, target_posdiff, 1, "air", 15, rad, "GROUND")
         self.circle_offsets: list[Vec] = []
-        self.new_circle_timer = LoopTimer(0.1)
+        self.schedule(0.1, self.new_circle, 0.1)
 
     def draw_charge(self, screen: Surface) -> None:
-        trans_surf = pygame.surface.Surface(Vec(2 * self.rad), pygame.SRCALPHA)
+        trans_surf = SurfacePool.get(Vec(2 * self.rad))
         pygame.draw.circle(trans_surf, WATER, Vec(self.rad), self.rad)
         trans_surf.set_alpha(int(255 * self.charging_time.progress))
         screen.blit(trans_surf, self.screen_pos - Vec(self.rad))
 
     def draw_spell(self, screen: Surface) -> None:
         pygame.draw.circle(screen, WATER, self.screen_pos, self.rad)
-        trans_surf = pygame.surface.Surface(Vec(2 * self.rad), pygame.SRCALPHA)
+        trans_surf = SurfacePool.get(Vec(2 * self.rad))
         for circle in self.circle_offsets:
             pygame.draw.circle(trans_surf, (220, 220, 220, 200), Vec(self.rad) + circle, 10)
         screen.blit(trans_surf, self.screen_pos - Vec(self.rad))
@@ -32,12 +32,13 @@ class Whirlpool(AreaSpell):
             player.vel *= ((1 - dist / self.rad) / 4) ** dt
             player.vel += (1 - dist / self.rad) * (self.pos - player.pos).normalize() * 2000 * dt
             player.vel += (1.1 - dist / self.rad) * (self.pos - player.pos).normalize().rotate(90) * 1500 * dt
-        for projectile in self.scene.projectiles:
+        for projectile in self.scene.spatial_hash.query_radius(self.pos, self.rad, "projectile"):
             if dist := projectile.pos.distance_to(self.pos) < self.rad:
                 projectile.vel *= ((1 - dist / self.rad) / 4) ** dt
                 projectile.vel += (1 - dist / self.rad) * (self.pos - projectile.pos).normalize() * 2000 * dt
                 projectile.vel += (1.1 - dist / self.rad) * (self.pos - projectile.pos).normalize().rotate(90) * 1500 * dt
-        for enemy in self.scene.enemies:
+        for enemy in self.scene.spatial_hash.query_radius(self.pos, self.rad, "entity"):
+            if enemy is player: continue
             if dist := enemy.pos.distance_to(self.pos) < self.rad:
                 enemy.vel *= ((1 - dist / self.rad) / 4) ** dt
                 enemy.vel += (1 - dist / self.rad) * (self.pos - enemy.pos).normalize() * 2000 * dt
@@ -50,10 +51,12 @@ class Whirlpool(AreaSpell):
             circle = circle + (dist / self.rad) * (-circle).normalize() * 90 * dt
             circle = circle + (circle).normalize().rotate(-90) * 240 * dt
             self.circle_offsets[i] = circle
-        if self.new_circle_timer.done:
-            self.circle_offsets.append(self.random_circle_point())
         super().update_spell(dt)
 
+    def new_circle(self) -> None:
+        if self.charging_time.done:
+            self.circle_offsets.append(self.random_circle_point())
+
     def random_circle_point(self) -> Vec:
         angle = uniform(0, 2*pi)
         scalar = self.rad
@@ -1,23 +1,21 @@
 from __future__ import annotations
 from src.core import *
-import numpy as np
 
 class TerrainBackground(Sprite):
+    # everything the terrain shader needs, set every frame in draw
+    UNIFORMS = [
+        "u_screen", "u_camera", "u_background", "u_blend_distance",
+        "u_circle_count", "u_circles", "u_colors",
+    ]
+    # has to match the array sizes in terrain.frag
+    MAX_CIRCLES = 64
+
     def __init__(self, scene: MainScene) -> None:
         super().__init__(scene, "BACKGROUND")
         self.scene = scene
         self.BLEND_DISTANCE = 50
         self.SCALE_FACTOR = 4
         self.background = (120, 160, 80)
-        # temporary color points
-        self.color_circles = [
-            # pos, rad, color
-            # (Vec(50, 50), 100, (153, 68, 78)),
-            # (Vec(-50, -50), 100, (138, 100, 219))
-            # (Vec(-100, 0), 150, (255, 0, 0)),
-            # (Vec(50, -86.6), 150, (0, 255, 0)),
-            # (Vec(50, 86.6), 150, (0, 0, 255)),
-        ]
 
     def update(self, dt: float) -> None:
         pass
@@ -53,19 +51,29 @@ class TerrainBackground(Sprite):
         # self.color = final_color
 
     def draw(self, target: pygame.Surface) -> None:
-        self.pos = self.scene.camera.pos
-
-        small_size = (WIDTH / self.SCALE_FACTOR, HEIGHT / self.SCALE_FACTOR)
-        terrain_background = pygame.surface.Surface(small_size, pygame.SRCALPHA)
-        self.draw_mixed_background(terrain_background)
-        # terrain_background.fill(self.background)
-        # terrain_background.fill(self.color)
-        # for circle in self.color_circles:
-        #     soft_c = pygame.surface.Surface(target.size, pygame.SRCALPHA)
-        #     self.draw_soft_circle(soft_c, *circle)
-        #     terrain_background.blit(soft_c, special_flags=pygame.BLEND_RGBA_ADD)
-        terrain_background = pygame.transform.smoothscale(terrain_background, target.get_size())
-        target.blit(terrain_background, (0, 0))
+        # the blending itself happens in the terrain shader, this just hands
+        # it the circles closest to the camera
+        self.pos = self.scene.camera.render_pos
+        group = self.scene.layers[self.layer].group
+        center = self.pos + Vec(target.size) / 2
+        # only the chunks around the screen, however big the world gets
+        circles = self.scene.world.circles(center, Vec(target.size).magnitude() / 2 + self.BLEND_DISTANCE * self.SCALE_FACTOR)
+        if len(circles) > self.MAX_CIRCLES:
+            circles = sorted(circles, key=lambda circle: center.distance_squared_to(circle[0]))[:self.MAX_CIRCLES]
+
+        circle_data = [0.0] * (4 * self.MAX_CIRCLES)
+        color_data = [0.0] * (4 * self.MAX_CIRCLES)
+        for i, ((cx, cy), rad, color) in enumerate(circles):
+            circle_data[4 * i:4 * i + 3] = (cx, cy, rad)
+            color_data[4 * i:4 * i + 3] = (c / 255 for c in color)
+
+        group.set_uniform("u_screen", *target.size)
+        group.set_uniform("u_camera", *self.pos)
+        group.set_uniform("u_background", *(c / 255 for c in self.background))
+        group.set_uniform("u_blend_distance", self.BLEND_DISTANCE * self.SCALE_FACTOR)
+        group.set_uniform("u_circle_count", len(circles))
+        group.set_uniform("u_circles", *circle_data)
+        group.set_uniform("u_colors", *color_data)
 
     # def draw_soft_circle(self, bg: pygame.Surface, pos: Vec, rad: int, color: tuple[int, int, int]) -> Optional[pygame.Surface]:
     #     if self.pos.distance_to(pos) > self.BLEND_DISTANCE + rad + 1000: return None
@@ -73,43 +81,3 @@ class TerrainBackground(Sprite):
     #     for r in range(self.BLEND_DISTANCE + rad, rad, -int(self.BLEND_DISTANCE / BLEND_NUM)):
     #         alpha = int(255 * ( 1 - ((r - rad) / self.BLEND_DISTANCE)))
     #         pygame.draw.circle(bg, (*color, alpha), pos - self.pos, r)
-
-    def draw_mixed_background(self, target: pygame.Surface):
-        # Behold, me trying to understand numpy (hence the extra comments)
-        wid, hei = target.get_size()
-
-        # coordinate grids (These seem to be arrays..?)
-        y_ind, x_ind = np.indices((hei, wid))
-
-        # color and weight buffers (makes empty arrays I think...)
-        color_buffer =  np.zeros((hei, wid, 3), dtype=np.float32)
-        weight_buffer = np.zeros((hei, wid), dtype=np.float32)
-
-        # it seems this loop is working on whole grids at once?
-        for (cx, cy), rad, color in self.color_circles:
-            # find distance to center of circle
-            dx = x_ind + (self.pos.x - cx) / self.SCALE_FACTOR
-            dy = y_ind + (self.pos.y - cy) / self.SCALE_FACTOR
-            dist = np.sqrt(dx**2 + dy**2)
-
-            # Weights of colors
-            weight = np.clip(1 - ((dist - rad / self.SCALE_FACTOR) / self.BLEND_DISTANCE), 0, 1)
-            weight_sq = weight**2 # smoother fade
-
-            # Apply color
-            for i in range(3): # This should be RGB range
-                color_buffer[..., i] += color[i] * weight_sq
-
-            weight_buffer += weight_sq
-
-        # add the background green when there is not enough weight
-        remaining_weight = np.clip(1 - weight_buffer, 0, 1)
-        for i in range(3):
-            color_buffer[..., i] += self.background[i] * remaining_weight
-
-        # normalize final color
-        total_weight = weight_buffer + remaining_weight
-        final_rgb = (color_buffer / total_weight[..., None]).astype(np.uint8) # no idea how this line works
-        final_rgb = final_rgb.swapaxes(0, 1)
-
-        pygame.surfarray.blit_array(target, final_rgb)
@@ -3,8 +3,14 @@ from src.core import *
 from typing import List
 
 class WorldBorder(Sprite):
+    # everything the world_border shader needs, set every frame in draw
+    UNIFORMS = [
+        "u_screen", "u_color", "u_center", "u_radius", "u_target_center", "u_target_radius",
+        "u_show_target", "u_line_start", "u_line_end", "u_show_line",
+    ]
+
     def __init__(self, scene: MainScene) -> None:
-        super().__init__(scene, "SKY")
+        super().__init__(scene, "BORDER")
 
         self.pos = Vec(0)
         self.rad = 3000
@@ -44,16 +50,23 @@ class WorldBorder(Sprite):
 
 
     def draw(self, target: pygame.Surface) -> None:
-        purple_overlay = pygame.surface.Surface(target.size, pygame.SRCALPHA)
-        purple_overlay.fill(self.rgba)
-        pygame.draw.circle(purple_overlay, (0, 0, 0, 0), self.screen_pos, self.rad)
-        if self.scheduling or self.moving:
-            pygame.draw.circle(purple_overlay, (255, 255, 255, 200), self.target_pos - self.scene.camera.pos, self.target_rad, 3)
-        if self.scene.player.pos.distance_to(self.target_pos) > self.target_rad:
-            center = self.target_pos - self.scene.camera.pos
-            player_point = self.scene.player.screen_pos
-            pygame.draw.line(purple_overlay, (255, 255, 255, 200), player_point, center - (center - player_point).normalize() * self.target_rad)
-        target.blit(purple_overlay, (0, 0))
+        # the overlay is drawn entirely by the world_border shader, this just
+        # hands it everything it needs to know
+        group = self.scene.layers[self.layer].group
+        center = self.target_pos - self.scene.camera.render_pos
+        player_point = self.scene.player.screen_pos
+        show_line = self.scene.player.pos.distance_to(self.target_pos) > self.target_rad
+        group.set_uniform("u_screen", *target.size)
+        group.set_uniform("u_color", *(c / 255 for c in self.rgba))
+        group.set_uniform("u_center", *self.screen_pos)
+        group.set_uniform("u_radius", self.rad)
+        group.set_uniform("u_target_center", *center)
+        group.set_uniform("u_target_radius", self.target_rad)
+        group.set_uniform("u_show_target", self.scheduling or self.moving)
+        group.set_uniform("u_show_line", show_line)
+        if show_line:
+            group.set_uniform("u_line_start", *player_point)
+            group.set_uniform("u_line_end", *(center - (center - player_point).normalize() * self.target_rad))
 
     def schedule_move_to(self, target_pos: Vec | None, target_rad: float | None, move_time: float, wait_time: float) -> None:
         self.old_pos = self.pos
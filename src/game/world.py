@@ -0,0 +1,90 @@
+from __future__ import annotations
+from src.core import *
+from src.game.sprites.spells import TestDecoration
+from dataclasses import dataclass, field
+from functools import partial
+import random as rng
+
+TerrainCircle = tuple[Vec, float, tuple[int, int, int]]
+
+# colors that terrain patches can have, blended into the grass by the terrain shader
+TERRAIN_COLORS = [
+    (153, 68, 78),
+    (138, 100, 219),
+    (170, 150, 90),
+    (90, 130, 60),
+    (110, 90, 70),
+]
+
+@dataclass
+class Chunk:
+    circles: list[TerrainCircle]
+    decorations: list[Vec]
+    # which decorations were destroyed, so they don't come back when the
+    # chunk is revisited (forgotten if the chunk is ever thrown away)
+    destroyed: set[int] = field(default_factory=set)
+
+def generate_chunk(seed: int, size: int, cx: int, cy: int) -> Chunk:
+    """Generate the contents of a chunk, always the same for the same seed.
+    Runs on the chunk manager's worker thread."""
+    random = rng.Random(f"{seed}:{cx}:{cy}")
+    origin = Vec(cx * size, cy * size)
+
+    circles = []
+    for _ in range(random.randint(0, 3)):
+        pos = origin + Vec(random.uniform(0, size), random.uniform(0, size))
+        circles.append((pos, random.uniform(60, 250), random.choice(TERRAIN_COLORS)))
+
+    decorations = []
+    for _ in range(random.randint(0, 4)):
+        pos = origin + Vec(random.uniform(0, size), random.uniform(0, size))
+        # don't trap the player in a decoration when they spawn
+        if pos.magnitude() < 200: continue
+        decorations.append(pos)
+
+    return Chunk(circles, decorations)
+
+class World:
+    """Streams the terrain and decorations of the chunks around the player."""
+    CHUNK_SIZE = 1024
+    # how many chunks around the player have their decorations in the scene
+    ACTIVE_RADIUS = 1
+
+    def __init__(self, scene: MainScene, seed: int) -> None:
+        self.scene = scene
+        self.seed = seed
+        self.chunks = ChunkManager(partial(generate_chunk, seed, self.CHUNK_SIZE), self.CHUNK_SIZE, load_radius=2)
+        self.active: dict[tuple[int, int], list[Optional[TestDecoration]]] = {}
+
+    def update(self, pos: Vec) -> None:
+        self.chunks.update(pos)
+        nearby = dict(self.chunks.nearby(pos, self.ACTIVE_RADIUS))
+        for key in [key for key in self.active if key not in nearby]:
+            self.deactivate(key)
+        for key, chunk in nearby.items():
+            if key not in self.active:
+                self.activate(key, chunk)
+
+    def activate(self, key: tuple[int, int], chunk: Chunk) -> None:
+        decorations: list[Optional[TestDecoration]] = []
+        for i, pos in enumerate(chunk.decorations):
+            if i in chunk.destroyed:
+                decorations.append(None)
+                continue
+            decoration = TestDecoration(self.scene, pos.copy())
+            self.scene.add(decoration)
+            decorations.append(decoration)
+        self.active[key] = decorations
+
+    def deactivate(self, key: tuple[int, int]) -> None:
+        chunk = self.chunks.get(key)
+        for i, decoration in enumerate(self.active.pop(key)):
+            if decoration is None: continue
+            if decoration.killed and chunk is not None:
+                chunk.destroyed.add(i)
+            decoration.kill()
+
+    def circles(self, pos: Vec, radius: float) -> list[TerrainCircle]:
+        """Get the terrain circles of the generated chunks within a distance."""
+        reach = ceil(radius / self.CHUNK_SIZE)
+        return [circle for _, chunk in self.chunks.nearby(pos, reach) for circle in chunk.circles]
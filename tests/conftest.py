@@ -0,0 +1,33 @@
+from typing import Callable
+from src.core.game import Game
+from src.core.headless import Headless
+from src.core.util import Time
+import src.game.scenes as scenes
+import pygame
+import pytest
+
+@pytest.fixture(scope="session")
+def game() -> Game:
+    pygame.init()
+    # Game is a singleton, so every test shares this one, which never runs
+    return Game(Headless(frames=0))
+
+@pytest.fixture
+def main_scene(game: Game) -> scenes.MainScene:
+    game.time = Time._time = 0
+    game.alpha = 1.0
+    # poll the (empty) input once so sprites have something to read
+    game.update()
+    game.scene = scenes.MainScene(game)
+    return game.scene
+
+@pytest.fixture
+def tick(main_scene: scenes.MainScene) -> Callable[[int], None]:
+    """Step the main scene a number of fixed ticks, like Game.tick does."""
+    def tick(count: int = 1) -> None:
+        game = main_scene.game
+        for _ in range(count):
+            game.time += game.fixed_dt
+            Time.begin_frame(game)
+            main_scene.update(game.fixed_dt)
+    return tick
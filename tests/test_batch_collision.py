@@ -0,0 +1,37 @@
+from src.core.util import Hitbox, Vec, batch_is_colliding
+from src.game.sprites import BasicEnemy
+from random import Random
+
+def random_hitbox(rng: Random) -> Hitbox:
+    hitbox = Hitbox(Vec(rng.uniform(0, 200), rng.uniform(0, 200)), [])
+    if rng.random() < 0.5:
+        hitbox.set_size_rect(rng.uniform(5, 60), rng.uniform(5, 60))
+    else:
+        hitbox.set_size_rad(rng.uniform(5, 40))
+    hitbox.set_rotation(rng.uniform(0, 360))
+    return hitbox
+
+def test_matches_hitbox_is_colliding():
+    rng = Random(3)
+    hitboxes = [random_hitbox(rng) for _ in range(60)]
+    pairs = [(a, b) for i, a in enumerate(hitboxes) for b in hitboxes[i + 1:]]
+    expected = [a.is_colliding(b) for a, b in pairs]
+    assert any(expected) and not all(expected)
+    assert batch_is_colliding(pairs).tolist() == expected
+
+def test_no_pairs():
+    assert batch_is_colliding([]).shape == (0,)
+
+def test_contacts_skip_entities_killed_since(main_scene):
+    first = BasicEnemy(main_scene, Vec(3000, 3000))
+    second = BasicEnemy(main_scene, Vec(3010, 3000))
+    far = BasicEnemy(main_scene, Vec(-3000, 3000))
+    for enemy in (first, second, far):
+        main_scene.add(enemy)
+    main_scene.update_contacts()
+    assert first.colliding_entities() == [second]
+    assert second.colliding_entities() == [first]
+    assert far.colliding_entities() == []
+    assert main_scene.entity_pairs in ([(first, second)], [(second, first)])
+    second.kill()
+    assert first.colliding_entities() == []
@@ -0,0 +1,50 @@
+from src.core.util import ChunkManager, Vec
+from src.game.world import generate_chunk
+import time
+
+def test_missing_chunks_are_generated_closest_first():
+    generated = []
+    def generate(x: int, y: int) -> tuple[int, int]:
+        generated.append((x, y))
+        return (x, y)
+    chunks = ChunkManager(generate, 100, load_radius=1, threaded=False)
+    # the first update only asks for them, every later one makes a few
+    chunks.update(Vec(150, 150))
+    assert generated == []
+    chunks.update(Vec(150, 150))
+    assert len(generated) == ChunkManager.SYNC_BUDGET
+    for _ in range(5):
+        chunks.update(Vec(150, 150))
+    assert len(generated) == 9 and generated[0] == (1, 1)
+    assert all(abs(x - 1) + abs(y - 1) == 1 for x, y in generated[1:5])
+    assert dict(chunks.nearby(Vec(150, 150), 0)) == {(1, 1): (1, 1)}
+
+def test_chunks_arent_generated_twice_while_pending():
+    generated = []
+    chunks = ChunkManager(lambda x, y: generated.append((x, y)) or (x, y), 100, load_radius=0, threaded=False)
+    for _ in range(3):
+        chunks.update(Vec())
+    assert generated == [(0, 0)]
+
+def test_least_recently_used_chunks_are_thrown_away():
+    chunks = ChunkManager(lambda x, y: (x, y), 100, load_radius=0, max_cached=2, threaded=False)
+    # the cache always has room for twice the load radius
+    assert chunks.max_cached == 2
+    for x in range(3):
+        chunks.update(Vec(100 * x, 0))
+        chunks.update(Vec(100 * x, 0))
+    chunks.update(Vec(200, 0))
+    assert list(chunks.chunks) == [(1, 0), (2, 0)]
+    assert chunks.get((0, 0)) is None
+
+def test_worker_thread_finishes_chunks_later():
+    chunks = ChunkManager(lambda x, y: (x, y), 100, load_radius=1)
+    deadline = time.monotonic() + 5
+    while len(chunks.chunks) < 9 and time.monotonic() < deadline:
+        chunks.update(Vec())
+        time.sleep(0.001)
+    assert sorted(chunks.chunks) == [(x, y) for x in (-1, 0, 1) for y in (-1, 0, 1)]
+
+def test_generation_only_depends_on_the_seed():
+    assert generate_chunk(7, 1024, 3, -2) == generate_chunk(7, 1024, 3, -2)
+    assert generate_chunk(7, 1024, 3, -2) != generate_chunk(8, 1024, 3, -2)
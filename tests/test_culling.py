@@ -0,0 +1,49 @@
+from src.core import Sprite
+from src.core.util import Vec
+from src.game.sprites import EarthBlock, Rollout
+from src.game.sprites import spells
+import pygame
+
+class Marker(Sprite):
+    def __init__(self, scene, pos: Vec, bounded: bool = True) -> None:
+        super().__init__(scene, "GROUND")
+        self.pos = pos
+        self.bounded = bounded
+        self.drawn = 0
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def draw(self, target: pygame.Surface) -> None:
+        self.drawn += 1
+
+    @property
+    def bounds(self):
+        if not self.bounded: return None
+        return (self.pos.x - 10, self.pos.y - 10, self.pos.x + 10, self.pos.y + 10)
+
+def test_only_sprites_in_view_are_drawn(main_scene):
+    left, top, right, bottom = main_scene.view_rect
+    inside = Marker(main_scene, Vec(left + 100, top + 100))
+    edge = Marker(main_scene, Vec(right + 5, top + 100))
+    outside = Marker(main_scene, Vec(right + 500, top + 100))
+    unbounded = Marker(main_scene, Vec(right + 500, top + 100), bounded=False)
+    layer = main_scene.layers["GROUND"]
+    for marker in (inside, edge, outside, unbounded):
+        main_scene.add(marker)
+    layer.draw(layer.group.surface)
+    assert (inside.drawn, edge.drawn, outside.drawn, unbounded.drawn) == (1, 1, 0, 1)
+
+def test_constructs_are_bounded_by_their_hitbox(main_scene):
+    rollout = Rollout(main_scene, Vec(100, 0), "")
+    assert rollout.bounds == rollout.hitbox.bounds
+    # decorations are drawn as circles around their hexagon hitbox
+    decoration = spells.TestDecoration(main_scene, Vec(500, 500))
+    assert decoration.bounds == (480, 480, 520, 520)
+
+def test_charging_earth_blocks_include_their_particles(main_scene):
+    block = EarthBlock(main_scene, Vec(200, 0), "", Vec(50, 40), 0)
+    left, top, right, bottom = block.bounds
+    assert right - left == 50 + 220 and bottom - top == 40 + 220
+    block.charging_time.force_end()
+    assert block.bounds == (block.pos.x - 25, block.pos.y - 20, block.pos.x + 25, block.pos.y + 20)
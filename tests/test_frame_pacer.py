@@ -0,0 +1,54 @@
+from src.core.util import FramePacer
+from time import perf_counter
+import asyncio
+
+def test_target_fps_drops_while_idle():
+    pacer = FramePacer(60, 10)
+    assert pacer.target_fps == 60
+    pacer.idle = True
+    assert pacer.target_fps == 10
+
+def test_vsync_paces_frames_at_or_above_the_refresh_rate():
+    pacer = FramePacer(144, 10, vsync=True, refresh_rate=60)
+    assert pacer.target_fps == 0
+    pacer.fps = 0
+    assert pacer.target_fps == 0
+    pacer.fps = 30
+    assert pacer.target_fps == 30
+
+def test_vsync_with_an_unknown_refresh_rate_still_paces():
+    pacer = FramePacer(60, 10, vsync=True, refresh_rate=0)
+    assert pacer.target_fps == 60
+
+def test_wait_lasts_until_the_frame_is_due():
+    pacer = FramePacer(100, 10)
+    pacer.restart()
+    dt = asyncio.run(pacer.wait())
+    assert 0.01 <= dt < 0.1
+    assert pacer.last <= perf_counter()
+
+def test_wait_times_from_the_last_frame():
+    pacer = FramePacer(100, 10)
+    pacer.last = perf_counter() - 1
+    # the frame is long overdue, so there is nothing to wait for
+    start = perf_counter()
+    dt = asyncio.run(pacer.wait())
+    assert dt >= 1
+    assert perf_counter() - start < 0.05
+
+def test_unlimited_frames_only_yield():
+    pacer = FramePacer(0, 0)
+    pacer.restart()
+    assert asyncio.run(pacer.wait()) < 0.01
+
+def test_wait_lets_other_tasks_run():
+    pacer = FramePacer(50, 10)
+    ran: list[float] = []
+    async def frame() -> None:
+        task = asyncio.create_task(asyncio.sleep(0.005, result=None))
+        task.add_done_callback(lambda _: ran.append(perf_counter()))
+        pacer.restart()
+        await pacer.wait()
+        # the other task ran while the frame was waited out
+        assert ran and ran[0] < pacer.last
+    asyncio.run(frame())
@@ -0,0 +1,113 @@
+from src.core import Headless, InputScript, Sprite
+from src.core.game import AbortGame
+from src.core.util import Profile, Vec
+from src.game.settings import MAX_TICKS_PER_FRAME
+from pygame.locals import K_q, QUIT
+import pygame
+import pytest
+
+class Recorder(Sprite):
+    def __init__(self, scene) -> None:
+        super().__init__(scene, "GROUND")
+        self.keys: list[int] = []
+
+    def update(self, dt: float) -> None:
+        self.keys.append(self.game.key_down)
+
+    def draw(self, target: pygame.Surface) -> None:
+        pass
+
+class Mover(Recorder):
+    interpolated = True
+
+    def update(self, dt: float) -> None:
+        self.pos += Vec(10, 0)
+
+@pytest.fixture
+def play(game, main_scene, monkeypatch):
+    """Run frames of the game on its own input script, without Game.run."""
+    script = InputScript()
+    monkeypatch.setattr(game, "headless", Headless(script))
+    monkeypatch.setattr(game, "update_profiler", main_scene.update, raising=False)
+    game.accumulator = 0.0
+    game.timestamp = 0
+    game.events = {}
+    game.input_consumed = True
+    profiled: list[int] = []
+    monkeypatch.setattr(Profile, "update", profiled.append)
+    def play(*ticks: float) -> None:
+        # every frame lasts the given number of ticks
+        for frame_ticks in ticks:
+            game.dt = frame_ticks * game.fixed_dt
+            game.update()
+            game.tick()
+            game.timestamp += 1
+    play.script = script
+    play.profiled = profiled
+    return play
+
+def test_frames_run_as_many_ticks_as_their_time_makes_up(game, main_scene, play):
+    recorder = Recorder(main_scene)
+    main_scene.add(recorder)
+    play(2.5, 0.25)
+    assert len(recorder.keys) == 2
+    assert game.alpha == pytest.approx(0.75)
+    play(0.5)
+    assert len(recorder.keys) == 3
+    assert game.alpha == pytest.approx(0.25)
+
+def test_far_behind_frames_give_up_catching_up(game, main_scene, play):
+    recorder = Recorder(main_scene)
+    main_scene.add(recorder)
+    play(MAX_TICKS_PER_FRAME + 10.5)
+    assert len(recorder.keys) == MAX_TICKS_PER_FRAME
+    assert game.accumulator < game.fixed_dt
+
+def test_input_is_seen_by_one_tick_only(main_scene, play):
+    recorder = Recorder(main_scene)
+    main_scene.add(recorder)
+    play.script.press(K_q, 0)
+    play(3)
+    assert recorder.keys == [K_q, -1, -1]
+    # the game's own keys are read the same way
+    assert play.profiled == [K_q, -1, -1]
+
+def test_frames_without_ticks_pass_their_input_on(main_scene, play):
+    recorder = Recorder(main_scene)
+    main_scene.add(recorder)
+    play.script.press(K_q, 0)
+    play(0.5)
+    assert recorder.keys == [] and play.profiled == []
+    play(0.5)
+    assert recorder.keys == [K_q]
+    assert play.profiled == [K_q]
+
+def test_quitting_is_read_with_the_rest_of_the_input(play):
+    play.script.events[0] = [pygame.event.Event(QUIT)]
+    with pytest.raises(AbortGame):
+        play(1)
+
+def test_render_pos_interpolates_between_ticks(game, main_scene, play):
+    mover = Mover(main_scene)
+    main_scene.add(mover)
+    play(1.25)
+    assert mover.render_pos == Vec(2.5, 0)
+
+def test_render_pos_ignores_sprites_that_arent_interpolated(game, main_scene, play):
+    recorder = Recorder(main_scene)
+    main_scene.add(recorder)
+    recorder.pos = Vec(10, 0)
+    # sprites are free to use an attribute of the same name for themselves
+    recorder.prev_pos = Vec(-100, 0)
+    play(1.25)
+    assert recorder.render_pos == recorder.pos == Vec(10, 0)
+
+def test_adding_again_doesnt_slide_in(game, main_scene, play):
+    mover = Mover(main_scene)
+    main_scene.add(mover)
+    play(1)
+    mover.kill()
+    mover.pos = Vec(500, 500)
+    main_scene.add(mover)
+    game.alpha = 0.5
+    assert mover.render_pos == Vec(500, 500)
@@ -0,0 +1,42 @@
+from src.core.util import Hitbox, Vec
+import pytest
+
+def square(center: Vec, size: float) -> Hitbox:
+    hitbox = Hitbox(center, [])
+    hitbox.set_size_rect(size, size)
+    return hitbox
+
+def test_moving_the_shared_center_in_place_updates_the_world_space_caches():
+    pos = Vec(0, 0)
+    hitbox = square(pos, 10)
+    assert hitbox.bounds == (-5, -5, 5, 5)
+    pos.x += 100
+    assert hitbox.bounds == (95, -5, 105, 5)
+    assert hitbox.points[0] == (95, -5)
+    assert hitbox.get_hitbox()[0] == Vec(95, -5)
+
+def test_reshaping_and_rotating_invalidate_the_caches():
+    hitbox = square(Vec(0, 0), 10)
+    assert hitbox.radius == pytest.approx(50 ** 0.5)
+    assert len(hitbox.normals) == 2
+    hitbox.set_size_rect(20, 20)
+    assert hitbox.bounds == (-10, -10, 10, 10)
+    assert hitbox.radius == pytest.approx(200 ** 0.5)
+    hitbox.set_rotation(45)
+    left, top, right, bottom = hitbox.bounds
+    assert right == pytest.approx(200 ** 0.5) and left == pytest.approx(-(200 ** 0.5))
+    hitbox.set_size_rad(10)
+    # a hexagon has three pairs of parallel edges
+    assert len(hitbox.normals) == 3
+    assert hitbox.radius == pytest.approx(10)
+
+def test_collisions_follow_the_cached_shapes():
+    a, b = square(Vec(0, 0), 10), square(Vec(12, 0), 10)
+    assert not a.is_colliding(b)
+    b.set_position(Vec(9, 0))
+    assert a.is_colliding(b) and b.is_colliding(a)
+    # rotated by 45 degrees the corner reaches further than the edge did
+    b.set_position(Vec(11, 0))
+    assert not a.is_colliding(b)
+    b.set_rotation(45)
+    assert a.is_colliding(b)
@@ -0,0 +1,68 @@
+from src.game.settings import TICK_RATE
+from src.game.sprites.inventory import Inventory
+import pytest
+
+@pytest.fixture
+def inventory(main_scene) -> Inventory:
+    inventory = Inventory(main_scene)
+    main_scene.add(inventory)
+    return inventory
+
+@pytest.fixture
+def advance(main_scene, tick):
+    """Tick until just past a point in the game's time."""
+    def advance(until: float) -> None:
+        while main_scene.game.time < until + 0.5 / TICK_RATE:
+            tick()
+    return advance
+
+def test_refunds_come_back_when_their_cooldown_ends(inventory, advance):
+    inventory.add("water", cooldown=1, num=2)
+    inventory.add("water", cooldown=0.5)
+    inventory.add("fire", cooldown=1)
+    assert inventory.cooling == {"air": 0, "water": 3, "earth": 0, "fire": 1}
+
+    advance(0.4)
+    assert inventory.elements["water"] == 0
+    advance(0.5)
+    assert inventory.elements["water"] == 1
+    assert inventory.cooling["water"] == 2
+    advance(1)
+    assert inventory.elements == {"air": 0, "water": 3, "earth": 0, "fire": 1}
+    assert inventory.cooling == {"air": 0, "water": 0, "earth": 0, "fire": 0}
+    assert inventory.refunds == [] and inventory.next_refund is None
+
+def test_only_wakes_for_the_soonest_refund(inventory, advance):
+    inventory.add("air", cooldown=5)
+    first = inventory.next_refund
+    inventory.add("air", cooldown=8)
+    assert inventory.next_refund is first
+    # a shorter cooldown moves the wake up earlier
+    inventory.add("earth", cooldown=2)
+    assert not first.active
+    assert inventory.next_refund.deadline == 2
+
+    advance(2)
+    assert inventory.elements["earth"] == 1
+    assert inventory.next_refund.deadline == 5
+    advance(8)
+    assert inventory.elements["air"] == 2
+
+def test_refunds_are_batched_per_element(inventory, advance):
+    for _ in range(10):
+        inventory.add("water", cooldown=1)
+    assert len(inventory.scheduled) == 1
+    advance(1)
+    assert inventory.elements["water"] == 10
+    assert inventory.cooling["water"] == 0
+
+def test_no_cooldown_adds_right_away(inventory):
+    inventory.add("fire", num=3)
+    assert inventory.elements["fire"] == 3
+    assert inventory.next_refund is None
+
+def test_refunds_stop_when_the_inventory_is_killed(inventory, advance):
+    inventory.add("air", cooldown=1)
+    inventory.kill()
+    advance(2)
+    assert inventory.elements["air"] == 0
@@ -0,0 +1,88 @@
+from src.core.util import PhysicsWorld, Vec
+from src.game.sprites import BasicEnemy
+import pytest
+
+class Ball:
+    def __init__(self, x: float, vx: float) -> None:
+        self.pos = Vec(x, 0)
+        self.vel = Vec(vx, 0)
+        self.acc = Vec(0, 100)
+        self.ext_acc = Vec()
+        self.ext_vel = Vec()
+
+def integrate(ball: Ball, dt: float) -> None:
+    # the per-entity version of the step, see Entity.update_position
+    ball.vel += ball.acc * dt
+    ball.vel += ball.ext_acc
+    ball.ext_acc = Vec()
+    ball.vel *= 0.004 ** dt
+    ball.pos += ball.vel * dt
+    ball.pos += ball.ext_vel
+    ball.ext_vel = Vec()
+
+def test_changes_made_in_place_are_simulated_and_pos_is_kept():
+    world = PhysicsWorld(1, 6000, capacity=1)
+    ball = Ball(0, 0)
+    pos = ball.pos
+    world.add(ball)
+    ball.acc.y = 0
+    ball.vel.x += 10
+    world.move(ball, 1)
+    assert world.step() == [ball]
+    assert ball.pos is pos
+    assert ball.pos == Vec(10, 0)
+
+def test_matches_the_per_entity_step_and_skips_bodies_not_moved():
+    world = PhysicsWorld(0.004, 6000, capacity=2)
+    balls = [Ball(i, i) for i in range(5)]
+    expected = [Ball(i, i) for i in range(5)]
+    for ball in balls:
+        world.add(ball)
+    world.remove(balls.pop(1))
+    expected.pop(1)
+    dt = 1 / 60
+    for tick in range(30):
+        for i, (ball, reference) in enumerate(zip(balls, expected)):
+            ball.ext_acc += Vec(1, 1)
+            reference.ext_acc += Vec(1, 1)
+            # the third one is only updated every third tick, like a throttled enemy
+            if i == 2 and tick % 3 != 2: continue
+            step = 3 * dt if i == 2 else dt
+            world.move(ball, step)
+            integrate(reference, step)
+        moved = world.step()
+        assert balls[2] in moved if tick % 3 == 2 else balls[2] not in moved
+    for ball, reference in zip(balls, expected):
+        assert ball.pos.x == pytest.approx(reference.pos.x)
+        assert ball.pos.y == pytest.approx(reference.pos.y)
+        assert ball.vel.y == pytest.approx(reference.vel.y)
+
+def test_contacts_push_bodies_apart():
+    world = PhysicsWorld(1, 600)
+    left, right = Ball(0, 0), Ball(10, 0)
+    left.acc = right.acc = Vec()
+    for ball in (left, right):
+        world.add(ball)
+        world.move(ball, 0.1)
+    world.step([(left, right)])
+    assert left.vel.x < 0 < right.vel.x
+
+def test_bodies_not_moving_keep_their_push_for_later():
+    world = PhysicsWorld(1, 600)
+    mover, idle = Ball(0, 0), Ball(10, 0)
+    for ball in (mover, idle):
+        world.add(ball)
+    world.move(mover, 0.1)
+    assert world.step([(mover, idle)]) == [mover]
+    assert idle.pos == Vec(10, 0)
+    assert idle.ext_acc == Vec(60, 0)
+
+def test_entities_move_with_their_hitbox(main_scene):
+    start = main_scene.player.pos + Vec(300, 0)
+    enemy = BasicEnemy(main_scene, start.copy())
+    main_scene.add(enemy)
+    assert enemy in main_scene.physics
+    main_scene.update(1 / 60)
+    assert enemy.pos != start
+    assert enemy.hitbox.center is enemy.pos
+    assert main_scene.spatial_hash.entries[enemy][0] == main_scene.spatial_hash.key(enemy.pos)
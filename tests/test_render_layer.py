@@ -0,0 +1,60 @@
+from src.core.render_layer import DirtySurface, mark_dirty
+from collections import defaultdict
+from types import SimpleNamespace
+import pygame
+
+def test_blits_fills_and_draws_are_marked():
+    surface = DirtySurface((100, 100), pygame.SRCALPHA)
+    surface.fill((255, 0, 0), (10, 10, 5, 5))
+    surface.blit(pygame.Surface((4, 4)), (50, 50))
+    pygame.draw.circle(surface, (0, 255, 0), (80, 20), 5)
+    pygame.draw.line(surface=surface, color=(0, 0, 255), start_pos=(0, 90), end_pos=(30, 90))
+    assert surface.dirty[:2] == [pygame.Rect(10, 10, 5, 5), pygame.Rect(50, 50, 4, 4)]
+    assert surface.dirty[2].collidepoint(80, 20)
+    assert surface.dirty[3].collidepoint(15, 90)
+
+def test_only_dirty_surfaces_are_marked():
+    surface = pygame.Surface((100, 100))
+    assert pygame.draw.rect(surface, (255, 0, 0), (0, 0, 10, 10)) == pygame.Rect(0, 0, 10, 10)
+    mark_dirty(surface, (0, 0, 10, 10))
+
+def test_marks_are_clipped_to_the_surface():
+    surface = DirtySurface((100, 100), pygame.SRCALPHA)
+    pygame.draw.rect(surface, (255, 0, 0), (200, 200, 10, 10))
+    mark_dirty(surface, (90, 90, 20, 20))
+    assert surface.dirty == [pygame.Rect(90, 90, 10, 10)]
+
+def test_clearing_a_group_only_wipes_what_was_drawn(main_scene):
+    hud = main_scene.layers["HUD"].group
+    hud.clear()
+    pygame.draw.rect(hud.surface, (255, 0, 0), (10, 10, 20, 20))
+    assert hud.surface.get_at((15, 15)) == (255, 0, 0, 255)
+    hud.clear()
+    assert hud.surface.get_at((15, 15)).a == 0
+    assert hud.surface.dirty == []
+    assert pygame.Rect(10, 10, 20, 20) in hud.cleared
+
+class FakeBatch:
+    def __init__(self, log: list) -> None:
+        self.log = log
+        self.order = []
+
+    def draw(self, image: pygame.Surface, *args, **kwargs) -> None:
+        self.order.append(image)
+
+    def render(self) -> None:
+        self.log.append("batch")
+        self.order.clear()
+
+def test_groups_present_their_surface_once_per_frame(main_scene, monkeypatch):
+    for group in main_scene.layer_groups:
+        log = []
+        # just enough of a pipeline for the shader sprites to set uniforms on
+        monkeypatch.setattr(group, "pipeline", SimpleNamespace(uniforms=defaultdict(bytearray)))
+        monkeypatch.setattr(group, "present", lambda log=log: log.append("present"))
+        for layer in group.layers:
+            if layer.name == "ENTITY":
+                monkeypatch.setattr(layer, "batch", FakeBatch(log))
+        group.draw()
+        assert log.count("present") == 1, [layer.name for layer in group.layers]
+        assert log.count("batch") == (group is main_scene.layers["ENTITY"].group)
@@ -0,0 +1,27 @@
+from src.core.util import RotationCache, Vec
+import pygame
+
+def test_angles_are_rounded_to_the_resolution():
+    cache = RotationCache(resolution=5)
+    image = pygame.Surface((10, 20))
+    rotated, size = cache.get(image, 89)
+    assert size == Vec(20, 10) == Vec(rotated.get_size())
+    assert cache.get(image, 91)[0] is rotated
+    assert cache.get(image, 90 - 360)[0] is rotated
+    assert cache.get(image, 95)[0] is not rotated
+
+def test_images_are_cached_separately():
+    cache = RotationCache()
+    first, second = pygame.Surface((10, 20)), pygame.Surface((10, 20))
+    assert cache.get(first, 45)[0] is not cache.get(second, 45)[0]
+
+def test_least_recently_used_rotations_are_dropped():
+    cache = RotationCache(max_entries=2)
+    image = pygame.Surface((10, 20))
+    zero = cache.get(image, 0)[0]
+    one = cache.get(image, 1)[0]
+    cache.get(image, 0)
+    cache.get(image, 2)
+    assert len(cache.cache) == 2
+    assert cache.get(image, 0)[0] is zero
+    assert cache.get(image, 1)[0] is not one
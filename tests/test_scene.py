@@ -0,0 +1,68 @@
+from src.core import Sprite
+from typing import Callable
+import pygame
+import pytest
+
+class Probe(Sprite):
+    def __init__(self, scene, action: Callable[[], None] = lambda: None) -> None:
+        super().__init__(scene, "GROUND")
+        self.action = action
+        self.events: list[str] = []
+
+    def update(self, dt: float) -> None:
+        self.action()
+
+    def draw(self, target: pygame.Surface) -> None:
+        pass
+
+    def on_add(self) -> None:
+        self.events.append("add")
+
+    def on_remove(self) -> None:
+        self.events.append("remove")
+
+def test_outside_of_updates_changes_are_immediate(main_scene):
+    probe = Probe(main_scene)
+    main_scene.add(probe)
+    assert probe in main_scene.layers["GROUND"].updating
+    probe.kill()
+    assert probe not in main_scene.layers["GROUND"].updating
+    assert probe.events == ["add", "remove"]
+
+def test_changes_during_an_update_wait_until_its_end(main_scene):
+    layer = main_scene.layers["GROUND"]
+    child = Probe(main_scene)
+    seen = []
+    def spawn() -> None:
+        main_scene.add(child)
+        seen.append(child in layer.updating)
+        parent.kill()
+        seen.append(parent in layer.updating)
+    parent = Probe(main_scene, spawn)
+    main_scene.add(parent)
+    main_scene.update(0.01)
+    assert seen == [False, True]
+    assert child in layer.updating and parent not in layer.updating
+    assert child.events == ["add"] and parent.events == ["add", "remove"]
+
+def test_deferred_changes_keep_their_order(main_scene):
+    layer = main_scene.layers["GROUND"]
+    brief = Probe(main_scene)
+    def flicker() -> None:
+        main_scene.add(brief)
+        brief.kill()
+    main_scene.add(Probe(main_scene, flicker))
+    main_scene.update(0.01)
+    assert brief not in layer.updating
+    assert brief.events == ["add", "remove"]
+
+def test_changes_are_applied_even_if_the_update_fails(main_scene):
+    child = Probe(main_scene)
+    def crash() -> None:
+        main_scene.add(child)
+        raise RuntimeError
+    main_scene.add(Probe(main_scene, crash))
+    with pytest.raises(RuntimeError):
+        main_scene.update(0.01)
+    assert child in main_scene.layers["GROUND"].updating
+    assert not main_scene.deferring
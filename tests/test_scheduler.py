@@ -0,0 +1,103 @@
+from src.core import Sprite
+from src.core.util import Scheduler, Time
+from src.game.settings import TICK_RATE
+import pygame
+import pytest
+
+def test_calls_in_order_of_deadline():
+    scheduler = Scheduler()
+    calls = []
+    scheduler.at(2, lambda: calls.append("b"))
+    scheduler.at(1, lambda: calls.append("a"))
+    scheduler.at(2, lambda: calls.append("c"))
+    scheduler.at(5, lambda: calls.append("d"))
+    assert scheduler.run(0.5) == 0
+    assert scheduler.run(2) == 3
+    # equal deadlines go in the order they were scheduled
+    assert calls == ["a", "b", "c"]
+    assert scheduler.next_deadline == 5
+
+def test_cancelled_calls_are_skipped():
+    scheduler = Scheduler()
+    calls = []
+    call = scheduler.at(1, lambda: calls.append(1))
+    call.cancel()
+    assert not call.active
+    assert scheduler.run(10) == 0
+    assert calls == [] and len(scheduler) == 0
+
+def test_one_off_calls_become_inactive():
+    scheduler = Scheduler()
+    call = scheduler.at(1, lambda: None)
+    scheduler.run(1)
+    assert not call.active
+
+def test_intervals_repeat_until_cancelled():
+    scheduler = Scheduler()
+    times = []
+    call = scheduler.at(1, lambda: times.append(call.deadline), interval=0.5)
+    # running late makes up for every missed repeat
+    assert scheduler.run(2.1) == 3
+    assert times == [1.5, 2.0, 2.5]
+    call.cancel()
+    assert scheduler.run(10) == 0
+
+def test_after_counts_from_the_game_time():
+    Time._time = 3
+    scheduler = Scheduler()
+    assert scheduler.after(2, lambda: None).deadline == 5
+
+def test_callbacks_can_schedule_more():
+    scheduler = Scheduler()
+    calls = []
+    scheduler.at(1, lambda: scheduler.at(1.5, lambda: calls.append("later")))
+    scheduler.run(2)
+    assert calls == ["later"]
+
+def test_rejects_non_positive_intervals():
+    with pytest.raises(ValueError):
+        Scheduler().at(1, lambda: None, interval=0)
+
+class Marker(Sprite):
+    def __init__(self, scene) -> None:
+        super().__init__(scene, "GROUND")
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def draw(self, target: pygame.Surface) -> None:
+        pass
+
+def test_sprites_are_called_back_as_the_scene_ticks(main_scene, tick):
+    marker = Marker(main_scene)
+    main_scene.add(marker)
+    calls = []
+    marker.schedule(2 / TICK_RATE, lambda: calls.append(main_scene.game.time))
+    tick()
+    assert calls == []
+    tick()
+    assert calls == [pytest.approx(2 / TICK_RATE)]
+
+def test_scheduled_calls_are_cancelled_on_kill(main_scene, tick):
+    marker = Marker(main_scene)
+    main_scene.add(marker)
+    calls = []
+    once = marker.schedule(1 / TICK_RATE, lambda: calls.append("once"))
+    again = marker.schedule(1 / TICK_RATE, lambda: calls.append("again"), 1 / TICK_RATE)
+    tick(2)
+    assert calls == ["once", "again", "again"]
+    marker.kill()
+    assert not once.active and not again.active
+    tick(5)
+    assert calls == ["once", "again", "again"]
+
+def test_callbacks_can_kill_their_sprite(main_scene, tick):
+    marker = Marker(main_scene)
+    main_scene.add(marker)
+    calls = []
+    marker.schedule(1 / TICK_RATE, lambda: calls.append("tick"), 1 / TICK_RATE)
+    marker.schedule(3.5 / TICK_RATE, marker.kill)
+    tick(5)
+    # the repeating call stopped once the sprite died
+    assert calls == ["tick"] * 3
+    assert marker not in main_scene.layers["GROUND"].updating
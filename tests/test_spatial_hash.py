@@ -0,0 +1,89 @@
+from src.core.util import SpatialHash, Vec
+from random import Random
+
+class Thing:
+    def __init__(self, x: float, y: float) -> None:
+        self.pos = Vec(x, y)
+
+    def __repr__(self) -> str:
+        return f"Thing({self.pos.x}, {self.pos.y})"
+
+def test_update_moves_objects_between_cells():
+    grid = SpatialHash(64, padding=0)
+    thing = Thing(10, 10)
+    grid.insert(thing, "entity")
+    thing.pos = Vec(300, 300)
+    grid.update(thing)
+    assert list(grid.query_rect(0, 0, 63, 63, "entity")) == []
+    assert list(grid.query_rect(256, 256, 319, 319, "entity")) == [thing]
+    assert len(grid.cells) == 1
+
+def test_changes_during_a_query_are_deferred():
+    grid = SpatialHash(64)
+    things = [Thing(10 * i, 0) for i in range(5)]
+    for thing in things:
+        grid.insert(thing, "entity")
+    newcomer = Thing(0, 0)
+    seen = []
+    for thing in grid.query_radius(Vec(), 100, "entity"):
+        seen.append(thing)
+        grid.remove(things[0])
+        grid.insert(newcomer, "entity")
+        # nothing changes until the query is done
+        assert things[0] in grid and newcomer not in grid
+    assert len(seen) == 5
+    assert things[0] not in grid and newcomer in grid
+
+def test_remove_drops_empty_cells():
+    grid = SpatialHash(64)
+    thing = Thing(10, 10)
+    grid.insert(thing, "entity")
+    grid.remove(thing)
+    grid.remove(thing)
+    assert thing not in grid
+    assert grid.cells == {}
+
+def test_query_segment_only_finds_objects_along_the_segment():
+    grid = SpatialHash(32, padding=0)
+    near = Thing(200, 5)
+    far = Thing(200, 300)
+    grid.insert(near, "entity")
+    grid.insert(far, "entity")
+    found = list(grid.query_segment(Vec(0, 0), Vec(400, 0), "entity"))
+    assert found == [near]
+    assert list(grid.query_segment(Vec(0, 0), Vec(400, 0), "entity", width=400)) != [near]
+
+def test_nearest_matches_sorting_by_distance():
+    rng = Random(1)
+    grid = SpatialHash(50)
+    things = [Thing(rng.uniform(-500, 500), rng.uniform(-500, 500)) for _ in range(200)]
+    for thing in things:
+        grid.insert(thing, "entity")
+    pos = Vec(12, -34)
+    expected = sorted(things, key=lambda thing: pos.distance_to(thing.pos))
+    assert grid.nearest(pos, "entity", k=5) == expected[:5]
+    within = [thing for thing in expected if pos.distance_to(thing.pos) <= 100]
+    assert grid.nearest(pos, "entity", k=1000, max_distance=100) == within
+
+def test_pairs_finds_every_close_pair_once():
+    rng = Random(2)
+    grid = SpatialHash(64)
+    things = [Thing(rng.uniform(0, 400), rng.uniform(0, 400)) for _ in range(80)]
+    for thing in things:
+        grid.insert(thing, "entity")
+    pairs = grid.pairs("entity")
+    found = {frozenset(pair) for pair in pairs}
+    assert len(found) == len(pairs)
+    # anything closer than a cell is always a candidate
+    for i, a in enumerate(things):
+        for b in things[i + 1:]:
+            if a.pos.distance_to(b.pos) < 64:
+                assert frozenset((a, b)) in found
+
+def test_pairs_between_categories():
+    grid = SpatialHash(64)
+    wall, entity, lonely = Thing(0, 0), Thing(20, 0), Thing(1000, 0)
+    grid.insert(wall, "construct")
+    grid.insert(entity, "entity")
+    grid.insert(lonely, "entity")
+    assert grid.pairs("construct", "entity") == [(wall, entity)]
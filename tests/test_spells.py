@@ -0,0 +1,23 @@
+from src.core.util import Vec
+from src.game.sprites import EarthBlock, Fireball
+
+def test_projectiles_are_only_collidable_while_in_the_scene(main_scene):
+    fireball = Fireball(main_scene, Vec(1, 0), "player")
+    assert fireball not in main_scene.projectiles
+    assert fireball not in main_scene.spatial_hash
+    main_scene.add(fireball)
+    assert fireball in main_scene.projectiles
+    assert main_scene.spatial_hash.entries[fireball][1] == "projectile"
+    fireball.kill()
+    assert fireball not in main_scene.projectiles
+    assert fireball not in main_scene.spatial_hash
+
+def test_constructs_are_filed_where_they_were_placed(main_scene):
+    block = EarthBlock(main_scene, Vec(3000, 0), "", Vec(50, 40), 0)
+    assert block not in main_scene.constructs
+    main_scene.add(block)
+    assert block in main_scene.constructs
+    assert main_scene.spatial_hash.entries[block] == (main_scene.spatial_hash.key(block.pos), "construct")
+    block.kill()
+    assert block not in main_scene.constructs
+    assert block not in main_scene.spatial_hash
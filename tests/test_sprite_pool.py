@@ -0,0 +1,94 @@
+from src.core import Sprite
+from src.core.util import Hitbox, Timer, Vec
+from src.game.sprites import Fireball, Gust, StoneCannon, WallOfFire, Waterball
+from typing import Any
+import pygame
+import pytest
+
+def state(sprite: Sprite) -> dict[str, Any]:
+    """Everything about a sprite that a reused one has to match a new one in."""
+    skip = {"uuid", "_hash", "game", "scene", "scheduled", "_render_prev_pos"}
+    values = {}
+    for name, value in vars(sprite).items():
+        if name in skip: continue
+        if isinstance(value, Timer):
+            value = (value.duration, value.time, value.paused, value.paused_duration, value.done)
+        elif isinstance(value, Hitbox):
+            value = (tuple(value.center), value.points)
+        elif isinstance(value, Vec):
+            value = tuple(value)
+        values[name] = value
+    return values
+
+def run_until_removed(sprite: Sprite, tick) -> None:
+    layer = sprite.scene.layers[sprite.layer]
+    for _ in range(600):
+        if sprite not in layer.updating: return
+        tick()
+    raise AssertionError(f"{sprite} was never removed")
+
+@pytest.mark.parametrize("cls, args", [
+    (Waterball, (Vec(1, 0), "enemy")),
+    (Fireball, (Vec(0, 1), "player")),
+    (StoneCannon, (Vec(-1, 0), "player")),
+    (Gust, (Vec(1, 0), "player", Vec(50, 300), 1, 0, Hitbox(Vec(), [Vec(0, 0), Vec(1, 0), Vec(0, 1)]))),
+])
+def test_reused_sprites_are_as_good_as_new(main_scene, tick, cls, args):
+    sprite = cls.acquire(main_scene, *args)
+    main_scene.add(sprite)
+    tick(30)
+    sprite.kill()
+    run_until_removed(sprite, tick)
+    assert main_scene.sprite_pool.free[cls] == [sprite]
+
+    reused = cls.acquire(main_scene, *args)
+    fresh = cls(main_scene, *args)
+    assert reused is sprite
+    assert state(reused) == state(fresh)
+    # the expiry and such that a new sprite schedules are made again too
+    assert len([call for call in reused.scheduled if call.active]) == len(fresh.scheduled)
+
+def test_waterballs_come_back_from_exploding(main_scene, tick):
+    waterball = Waterball.acquire(main_scene, Vec(1, 0), "enemy")
+    main_scene.add(waterball)
+    tick(120)
+    waterball.kill()
+    assert waterball.exploding
+    run_until_removed(waterball, tick)
+    assert waterball not in main_scene.projectiles
+
+    again = Waterball.acquire(main_scene, Vec(1, 0), "enemy")
+    assert again is waterball
+    assert not again.exploding and again.rad == 20 and again.hitbox.radius == pytest.approx(20)
+    assert not again.killed and not again.exploding_timer.done
+    main_scene.add(again)
+    assert again in main_scene.projectiles
+    stats = main_scene.sprite_pool.stats[Waterball]
+    assert (stats.created, stats.reused, stats.released, stats.free) == (1, 1, 1, 0)
+
+def test_pools_drop_sprites_past_their_size(main_scene, monkeypatch):
+    monkeypatch.setattr(Fireball, "pool_size", 2)
+    fireballs = [Fireball.acquire(main_scene, Vec(1, 0), "player") for _ in range(3)]
+    for fireball in fireballs:
+        main_scene.add(fireball)
+    for fireball in fireballs:
+        fireball.kill()
+    stats = main_scene.sprite_pool.stats[Fireball]
+    assert (stats.released, stats.dropped, stats.free) == (2, 1, 2)
+    main_scene.sprite_pool.clear()
+    assert Fireball.acquire(main_scene, Vec(1, 0), "player") not in fireballs
+
+def test_walls_of_fire_arent_pooled(main_scene):
+    wall = WallOfFire.acquire(main_scene, Vec(), "", 20)
+    main_scene.add(wall)
+    wall.kill()
+    assert WallOfFire.acquire(main_scene, Vec(), "", 20) is not wall
+    assert WallOfFire not in main_scene.sprite_pool.stats
+
+def test_pooled_sprites_must_override_reset():
+    with pytest.raises(TypeError):
+        class Leaky(Sprite):
+            pool_size = 4
+
+            def update(self, dt: float) -> None: pass
+            def draw(self, target: pygame.Surface) -> None: pass
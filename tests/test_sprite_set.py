@@ -0,0 +1,69 @@
+from src.core import Sprite
+from typing import Optional
+import pygame
+from src.core.util import SpriteSet
+import pytest
+
+def test_keeps_insertion_order():
+    items = SpriteSet("cab")
+    items.add("d")
+    items.discard("a")
+    assert list(items) == ["c", "b", "d"]
+
+def test_changes_during_iteration_are_deferred():
+    items = SpriteSet([1, 2, 3])
+    seen = []
+    for item in items:
+        seen.append(item)
+        if item == 1:
+            items.remove(2)
+            items.add(4)
+            assert 2 not in items and 4 in items
+            assert len(items) == 3
+    # removed items are skipped right away, added ones wait for the next pass
+    assert seen == [1, 3]
+    assert list(items) == [1, 3, 4]
+
+def test_adding_back_during_iteration():
+    items = SpriteSet([1, 2])
+    for item in items:
+        items.discard(1)
+        items.add(1)
+    assert list(items) == [1, 2]
+
+def test_nested_iteration_flushes_once_done():
+    items = SpriteSet([1, 2])
+    for _ in items:
+        for _ in items:
+            items.add(3)
+        assert list(items._items) == [1, 2]
+    assert list(items) == [1, 2, 3]
+
+def test_remove_missing_raises():
+    with pytest.raises(KeyError):
+        SpriteSet().remove(1)
+
+class Hunter(Sprite):
+    def __init__(self, scene, log: list) -> None:
+        super().__init__(scene, "GROUND")
+        self.log = log
+        self.prey: Optional[Sprite] = None
+
+    def update(self, dt: float) -> None:
+        self.log.append(self)
+        if self.prey is not None:
+            self.scene.layers[self.layer].remove(self.prey)
+
+    def draw(self, target: pygame.Surface) -> None:
+        pass
+
+def test_layers_skip_sprites_removed_mid_update(main_scene):
+    log = []
+    layer = main_scene.layers["GROUND"]
+    hunter, prey, other = Hunter(main_scene, log), Hunter(main_scene, log), Hunter(main_scene, log)
+    hunter.prey = prey
+    for sprite in (hunter, prey, other):
+        layer.add(sprite)
+    layer.update(0.01)
+    assert log == [hunter, other]
+    assert list(layer.drawing) == [hunter, other]
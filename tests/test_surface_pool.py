@@ -0,0 +1,42 @@
+from src.core.util import SurfacePool
+import pygame
+import pytest
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    SurfacePool.end_frame()
+    SurfacePool.clear()
+    yield
+    SurfacePool.end_frame()
+    SurfacePool.clear()
+
+def test_surfaces_are_reused_clean_the_next_frame():
+    surface = SurfacePool.get((30.7, 20))
+    assert surface.get_size() == (30, 20)
+    surface.fill((255, 0, 0))
+    surface.set_alpha(100)
+    surface.set_colorkey((255, 0, 0))
+    # a surface isn't handed out twice in the same frame
+    other = SurfacePool.get((30, 20))
+    assert other is not surface
+    SurfacePool.end_frame()
+    assert {SurfacePool.get((30, 20)), SurfacePool.get((30, 20))} == {surface, other}
+    assert surface.get_at((0, 0)) == (0, 0, 0, 0)
+    assert surface.get_alpha() == 255 and surface.get_colorkey() is None
+    assert surface.get_flags() & pygame.SRCALPHA
+
+def test_sizes_and_flags_are_pooled_separately():
+    alpha = SurfacePool.get((10, 10))
+    SurfacePool.end_frame()
+    assert SurfacePool.get((10, 10), 0) is not alpha
+    assert SurfacePool.get((10, 11)) is not alpha
+    assert SurfacePool.get((10, 10)) is alpha
+
+def test_sizes_not_asked_for_in_a_while_are_let_go_of():
+    old = SurfacePool.get((10, 10))
+    for _ in range(2 * SurfacePool.KEEP_FRAMES):
+        SurfacePool.get((5, 5))
+        SurfacePool.end_frame()
+    assert (10, 10, pygame.SRCALPHA) not in SurfacePool._free
+    assert SurfacePool.get((10, 10)) is not old
+    assert (5, 5, pygame.SRCALPHA) in SurfacePool._last_used
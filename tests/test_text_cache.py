@@ -0,0 +1,35 @@
+from src.core.util import Font, TextCache
+import pygame
+import pytest
+
+@pytest.fixture(autouse=True)
+def empty_cache(game):
+    # the fonts are loaded by the game
+    TextCache.clear()
+    yield
+    TextCache.clear()
+
+def test_same_text_is_only_rendered_once():
+    first = TextCache.render("font18", "Fire", (255, 0, 0))
+    assert TextCache.render("font18", "Fire", (255, 0, 0)) is first
+    assert TextCache.render("font18", "Fire", (0, 0, 255)) is not first
+    assert TextCache.render("font18", "Fire", (255, 0, 0), antialias=True) is not first
+
+def test_least_recently_used_text_is_dropped(monkeypatch):
+    monkeypatch.setattr(TextCache, "MAX_ENTRIES", 2)
+    first = TextCache.render("font18", "a", (0, 0, 0))
+    second = TextCache.render("font18", "b", (0, 0, 0))
+    # using the first one again makes the second one the oldest
+    TextCache.render("font18", "a", (0, 0, 0))
+    TextCache.render("font18", "c", (0, 0, 0))
+    assert TextCache.render("font18", "a", (0, 0, 0)) is first
+    assert TextCache.render("font18", "b", (0, 0, 0)) is not second
+
+def test_glyphs_line_up_like_the_whole_text():
+    target = pygame.Surface((100, 40), pygame.SRCALPHA)
+    rect = TextCache.blit_glyphs(target, "font18", "1234", (0, 0, 0), (10, 5))
+    whole = Font.get("font18").render("1234", False, (0, 0, 0))
+    assert rect.topleft == (10, 5)
+    assert rect.size == whole.get_size()
+    # only the characters get cached, not the number
+    assert ("font18", "1234", (0, 0, 0), False) not in TextCache._cache
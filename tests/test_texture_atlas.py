@@ -0,0 +1,52 @@
+from src.core.util import TextureAtlas
+import pygame
+
+def image(size: tuple[int, int], color: tuple[int, int, int, int]) -> pygame.Surface:
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+def test_packed_images_keep_their_pixels_and_dont_overlap():
+    atlas = TextureAtlas(page_size=64, padding=1)
+    colors = [(255, 0, 0, 255), (0, 255, 0, 128), (0, 0, 255, 0), (9, 9, 9, 9)]
+    regions = [atlas.add(image((20, 10 + i), color)) for i, color in enumerate(colors)]
+    assert len(atlas.pages) == 1
+    for i, (region, color) in enumerate(zip(regions, colors)):
+        assert region.surface.get_size() == (20, 10 + i)
+        assert region.surface.get_at((5, 5)) == color
+        assert region.rect.collidelist([other.rect for other in regions[:i]]) == -1
+
+def test_images_are_only_packed_once():
+    atlas = TextureAtlas(page_size=64)
+    surface = image((8, 8), (255, 0, 0, 255))
+    region = atlas.add(surface)
+    assert atlas.add(surface) is region
+    # the packed copy is what images hand out from then on
+    assert atlas.add(region.surface) is region
+    assert atlas.pages[0].version == 1
+
+def test_full_pages_and_oversized_images_get_new_pages():
+    atlas = TextureAtlas(page_size=32, padding=0)
+    for _ in range(4):
+        atlas.add(image((16, 16), (255, 255, 255, 255)))
+    assert len(atlas.pages) == 1
+    atlas.add(image((16, 16), (255, 255, 255, 255)))
+    assert len(atlas.pages) == 2
+    big = atlas.add(image((100, 40), (255, 255, 255, 255)))
+    assert big.page.size == 100 and len(atlas.pages) == 3
+
+def test_uvs_are_flipped_like_the_uploaded_pages():
+    atlas = TextureAtlas(page_size=100, padding=0)
+    region = atlas.add(image((10, 20), (255, 255, 255, 255)))
+    assert region.uv == (0, 1, 0.1, 0.8)
+
+def test_variants_are_made_once_per_tint_and_whole_degree():
+    atlas = TextureAtlas(page_size=128)
+    surface = image((10, 20), (200, 100, 50, 255))
+    assert atlas.variant(surface) is atlas.add(surface)
+    tinted = atlas.variant(surface, tint=(128, 128, 128))
+    assert atlas.variant(surface, tint=(128, 128, 128)) is tinted
+    assert tinted.surface.get_at((0, 0)) == (100, 50, 25, 255)
+    turned = atlas.variant(surface, angle=90.2)
+    assert atlas.variant(surface, angle=450) is turned
+    assert turned.surface.get_size() == (20, 10)
@@ -0,0 +1,53 @@
+from src.core import Sprite
+from src.core.util import UpdateLOD, Vec
+import pygame
+import pytest
+
+class Walker(Sprite):
+    throttled = True
+
+    def __init__(self, scene, pos: Vec) -> None:
+        super().__init__(scene, "GROUND")
+        self.pos = pos
+        self.updates: list[float] = []
+
+    def update(self, dt: float) -> None:
+        self.updates.append(dt)
+
+    def draw(self, target: pygame.Surface) -> None:
+        pass
+
+class Still(Walker):
+    throttled = False
+
+def test_tiers_by_distance():
+    lod = UpdateLOD([(500, 4), (100, 1), (float("inf"), 10)])
+    lod.begin_frame(Vec(1000, 0))
+    assert lod.interval(Vec(1050, 0)) == 1
+    assert lod.interval(Vec(1000, 300)) == 4
+    assert lod.interval(Vec(0, 0)) == 10
+
+def test_far_sprites_catch_up_on_the_time_they_skipped(main_scene):
+    main_scene.update_lod = UpdateLOD([(100, 1), (float("inf"), 4)])
+    far = Walker(main_scene, main_scene.player.pos + Vec(5000, 0))
+    near = Walker(main_scene, main_scene.player.pos.copy())
+    still = Still(main_scene, main_scene.player.pos + Vec(5000, 0))
+    for sprite in (far, near, still):
+        main_scene.add(sprite)
+    for _ in range(12):
+        main_scene.update(0.01)
+    assert len(near.updates) == len(still.updates) == 12
+    assert len(far.updates) == 3
+    assert sum(far.updates) + far.skipped_dt == pytest.approx(0.12)
+    assert all(dt == pytest.approx(0.04) for dt in far.updates[1:])
+
+def test_coming_close_updates_right_away(main_scene):
+    main_scene.update_lod = UpdateLOD([(100, 1), (float("inf"), 1000)])
+    walker = Walker(main_scene, main_scene.player.pos + Vec(5000, 0))
+    main_scene.add(walker)
+    main_scene.update(0.01)
+    main_scene.update(0.01)
+    walker.pos = main_scene.player.pos.copy()
+    main_scene.update(0.01)
+    assert walker.updates[-1] == pytest.approx(0.03 if len(walker.updates) == 1 else 0.01)
+    assert walker.skipped_dt == 0